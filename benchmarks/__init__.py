@@ -0,0 +1 @@
+"""OBL Convertor 성능 측정용 벤치마크"""
@@ -0,0 +1,119 @@
+"""CLL→OBL 변환 벤치마크: 기존 iterrows 방식과 컬럼 단위 엔진의 속도 및 결과 비교
+
+실행: python -m benchmarks.bench_convert --rows 8000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from obl_convert import build_obl_frame
+from stow_index import StowIndex
+
+SERVICE_MAPPINGS = [
+    {'port': 'SGSIN', 'stow_code': 'SIN'},
+    {'port': 'NLRTM', 'stow_code': 'RTM'},
+    {'port': 'DEHAM', 'stow_code': 'HAM'},
+    {'port': 'BEANR', 'stow_code': 'ANR'},
+]
+
+
+def make_cll_frame(rows, seed=0):
+    """테스트용 CLL 데이터프레임 생성 (pd.read_excel(header=4) 결과와 같은 형태)"""
+    rng = random.Random(seed)
+    nan = np.nan
+    return pd.DataFrame({
+        'CNTR NO': [f"MSCU{i:07d}" for i in range(rows)],
+        'OPT': [rng.choice([nan, 'KRPUS', 'CNSHA']) for _ in range(rows)],
+        'POD': [rng.choice(['SIN', 'RTM', 'HAM', 'ANR', 'USNYC', nan]) for _ in range(rows)],
+        'FDP': [rng.choice(['SGSIN', 'NLRTM', nan]) for _ in range(rows)],
+        'T&S': [rng.choice([22, 42, 45, 45, nan]) for _ in range(rows)],
+        'WGT': [rng.choice([nan, 2300, 12000, 28750]) for _ in range(rows)],
+        'F/E': [rng.choice(['F', 'F', 'E']) for _ in range(rows)],
+        'R/F': [rng.choice([nan, nan, '-18.0 CEL', '5.0 CEL']) for _ in range(rows)],
+        'OH': [rng.choice([nan, nan, 0, 35]) for _ in range(rows)],
+        'OL': [rng.choice([nan, nan, 0, 40]) for _ in range(rows)],
+        'OW': [rng.choice([nan, nan, 0, 25]) for _ in range(rows)],
+        'UNDG': [rng.choice([nan, nan, 1263, 3082]) for _ in range(rows)],
+        'IMDG': [rng.choice([nan, nan, 3, 9]) for _ in range(rows)],
+    })
+
+
+def legacy_convert(cll_df, pol, tol, service_mappings):
+    """기존 convert_file의 행 단위 변환 로직 (비교 기준)"""
+    obl_data = []
+    for idx, row in cll_df.iterrows():
+        por_value = row['OPT'] if pd.notna(row['OPT']) and row['OPT'] != '' else pol
+        pod = str(row['POD']) if pd.notna(row['POD']) else ''
+        fpod = str(row['FDP']) if pd.notna(row['FDP']) else ''
+        mapped_port = pod
+        mapped_stow = ''
+        for mapping in service_mappings:
+            if pod.upper() == mapping['stow_code'].upper():
+                mapped_port = mapping['port']
+                mapped_stow = mapping['stow_code']
+                break
+        obl_row = {
+            'No': idx + 1, 'CtrNbr': row['CNTR NO'], 'ShOwn': 'N', 'Opr': 'MSC',
+            'POR': por_value, 'POL': pol, 'TOL': tol, 'POD': mapped_port, 'TOD': '',
+            'Stow': mapped_stow, 'FPOD': fpod,
+            'SzTp': int(row['T&S']) if pd.notna(row['T&S']) else '',
+            'Wgt': int(row['WGT']) if pd.notna(row['WGT']) else '',
+            'ForE': row['F/E'], 'Lbl': '', 'Rfopr': 'N',
+            'Rftemp': row['R/F'].replace(' CEL', '') if pd.notna(row['R/F']) else '',
+            'OvDH': row['OH'],
+            'OvDF': row['OL'] / 2 if pd.notna(row['OL']) and row['OL'] != 0 else '',
+            'OvDA': row['OL'] / 2 if pd.notna(row['OL']) and row['OL'] != 0 else '',
+            'OvDP': row['OW'] / 2 if pd.notna(row['OW']) and row['OW'] != 0 else '',
+            'OvDS': row['OW'] / 2 if pd.notna(row['OW']) and row['OW'] != 0 else '',
+        }
+        for col in ['OvSH', 'OvSF', 'OvSA', 'OvSP', 'OvSS', 'BL', 'HI', 'AC', 'Flip']:
+            obl_row[col] = ''
+        obl_row.update({'Door': 'C', 'CustH': 'N'})
+        for col in ['LenBB', 'BrthBB', 'HgtBB', 'WgtBB']:
+            obl_row[col] = ''
+        obl_row['Fumi'] = 'N'
+        for col in ['FuDt', 'VenDt', 'Venti', 'Damag', 'PPK', 'Food', 'Resi', 'Book', 'Cold', 'Catm']:
+            obl_row[col] = ''
+        obl_row['VGM'] = 'Y'
+        for col in ['VGM Weighting Method', 'HVC', 'BN1', 'BN2', 'BN3', 'BN4',
+                    'Harmonised system codes', 'Description', 'Flexitank']:
+            obl_row[col] = ''
+        obl_row.update({'UNNO': row['UNDG'], 'Class': row['IMDG']})
+        for col in ['PSN', 'N.Weight', 'S.Risk1', 'S.Risk2', 'S.Risk3', 'P.Group', 'LQ', 'EQ', 'FP',
+                    'IMDG Remark', 'Sub Index', 'Inf type', 'Address', 'Street', 'City',
+                    'Postal Code', 'Country Code', 'Country', 'Sub Index_1', 'Remark']:
+            obl_row[col] = ''
+        obl_data.append(obl_row)
+    return pd.DataFrame(obl_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLL→OBL 변환 벤치마크")
+    parser.add_argument('--rows', type=int, default=8000, help="CLL 컨테이너 수")
+    args = parser.parse_args()
+
+    cll_df = make_cll_frame(args.rows)
+
+    start = time.perf_counter()
+    legacy_df = legacy_convert(cll_df, 'KRPUS', 'KRPUSAB', SERVICE_MAPPINGS)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    obl_df = build_obl_frame(cll_df, 'KRPUS', 'KRPUSAB', StowIndex(SERVICE_MAPPINGS))
+    engine_time = time.perf_counter() - start
+
+    # 결과 동일성 확인 (컬럼 순서, 값 모두 일치해야 함)
+    pd.testing.assert_frame_equal(obl_df, legacy_df, check_dtype=False)
+
+    print(f"rows:        {args.rows}")
+    print(f"iterrows:    {legacy_time:.3f}s")
+    print(f"vectorized:  {engine_time:.3f}s")
+    print(f"speedup:     {legacy_time / engine_time:.1f}x")
+    print("결과 일치: OK")
+
+
+if __name__ == "__main__":
+    main()
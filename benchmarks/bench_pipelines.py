@@ -0,0 +1,176 @@
+"""파이프라인 단계별 벤치마크 (CLL 변환, CLL 병합, ITPS 추가, EDI 변환, EDI 파싱)
+
+가상 입력 파일을 만들어 각 파이프라인을 별도 프로세스에서 실행하고
+단계별 시간, 초당 처리 행 수, 최대 메모리(peak RSS)를 출력한다.
+
+실행: python -m benchmarks.bench_pipelines --sizes 1000,10000,100000
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.generators import (BENCH_STOW_MAPPING, write_baplie, write_cll_workbook,
+                                   write_itps_workbook, write_obl_workbook)
+from parse_cache import CACHE_ENV
+
+SIZES = (1000, 10000, 100000)
+PIPELINES = ('convert', 'combine', 'itps', 'edi', 'edi_parse')
+MERGE_TERMINALS = ('PNITC', 'PNCOC', 'BCTHD', 'HJNPC')
+
+
+class StageTimer:
+    """파이프라인 progress 콜백으로 단계 경계를 받아 단계별 시간 기록"""
+
+    def __init__(self):
+        self.stages = {}
+        self.current = None
+        self.started = None
+
+    def __call__(self, stage, done=None, total=None):
+        if stage == self.current:
+            return
+        now = time.perf_counter()
+        self._close(now)
+        self.current = stage
+        self.started = now
+
+    def _close(self, now):
+        if self.current is not None:
+            self.stages[self.current] = self.stages.get(self.current, 0.0) + now - self.started
+
+    def finish(self):
+        self._close(time.perf_counter())
+        self.current = None
+        return self.stages
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 메모리 사용량 (MB)"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        memory = psutil.Process().memory_info()
+        return getattr(memory, 'peak_wset', memory.rss) / 1024 / 1024
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def prepare_inputs(pipeline, rows, work_dir):
+    """파이프라인 입력 파일 생성 (벤치마크 시간에서 제외)"""
+    path = lambda name: os.path.join(work_dir, name)
+    if pipeline == 'convert':
+        return [write_cll_workbook(path(f"CLL_{rows}.xlsx"), rows)]
+    if pipeline == 'combine':
+        # 같은 항구의 터미널별 CLL로 나누어 병합
+        count = len(MERGE_TERMINALS)
+        return [write_cll_workbook(path(f"CLL_{rows}_{terminal}.xlsx"), rows // count,
+                                   terminal_code=terminal, seed=i, prefix=f"MS{i:02d}")
+                for i, terminal in enumerate(MERGE_TERMINALS)]
+    if pipeline == 'itps':
+        return [write_obl_workbook(path(f"OBL_{rows}.xlsx"), rows),
+                write_itps_workbook(path(f"ITPS_{rows}.xlsx"), rows)]
+    if pipeline in ('edi', 'edi_parse'):
+        return [write_baplie(path(f"BAPLIE_{rows}.edi"), rows)]
+    raise ValueError(f"알 수 없는 파이프라인: {pipeline}")
+
+
+def run_pipeline(pipeline, inputs, work_dir, progress):
+    """파이프라인 하나 실행 (GUI 작업과 같은 함수 사용)"""
+    from cll_loader import load_cll_files, merge_port_info
+    from edi_parser import convert_edi_file, parse_edi_file
+    from obl_pipelines import combine_cll_frames, convert_cll_file, merge_itps_file, write_obl
+    from stow_index import compile_stow_indexes
+
+    stow_indexes = compile_stow_indexes(BENCH_STOW_MAPPING)
+    if pipeline == 'convert':
+        convert_cll_file(inputs[0], stow_indexes, 'BENCH', work_dir, progress=progress)
+    elif pipeline == 'combine':
+        clls = load_cll_files(inputs, progress=progress)
+        pol, tols = merge_port_info(clls)
+        combined_df = combine_cll_frames([cll.data for cll in clls], pol, tols,
+                                         stow_indexes['BENCH'], progress)
+        write_obl(combined_df, os.path.join(work_dir, "Combined_OBL.xlsx"), progress)
+    elif pipeline == 'itps':
+        merge_itps_file(inputs[0], inputs[1], {}, work_dir, progress=progress)
+    elif pipeline == 'edi':
+        convert_edi_file(inputs[0], work_dir, progress=progress)
+    elif pipeline == 'edi_parse':
+        # 엑셀 저장 없이 토크나이저 + 세그먼트 처리만 (peak RSS는 파싱 결과 크기에 가까워야 함)
+        parse_edi_file(inputs[0], progress=progress)
+
+
+def measure(pipeline, rows, work_dir):
+    """(자식 프로세스에서) 입력 생성 후 파이프라인을 실행하고 측정 결과 반환"""
+    inputs = prepare_inputs(pipeline, rows, work_dir)
+    # 같은 내용의 입력을 다시 만들므로 파싱 캐시는 끄고 측정
+    os.environ[CACHE_ENV] = '0'
+    timer = StageTimer()
+    start = time.perf_counter()
+    # 파이프라인의 디버깅 출력은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_pipeline(pipeline, inputs, work_dir, timer)
+    elapsed = time.perf_counter() - start
+    return {
+        'pipeline': pipeline,
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_sec': rows / elapsed if elapsed else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': timer.finish(),
+    }
+
+
+def run_isolated(pipeline, rows, work_dir):
+    """peak RSS가 섞이지 않도록 측정마다 새 프로세스 사용"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(measure, pipeline, rows, work_dir).result()
+
+
+def print_result(result):
+    rss = f"{result['peak_rss_mb']:.0f}MB" if result['peak_rss_mb'] is not None else "n/a"
+    print(f"{result['pipeline']:<8} {result['rows']:>7}행  {result['seconds']:8.2f}s  "
+          f"{result['rows_per_sec']:>10,.0f} rows/s  peak RSS {rss}")
+    for stage, seconds in result['stages'].items():
+        print(f"           - {stage:<10} {seconds:8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OBL Convertor 파이프라인 벤치마크")
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)), help="컨테이너 수 목록 (쉼표 구분)")
+    parser.add_argument('--pipelines', default=','.join(PIPELINES), help="실행할 파이프라인 (쉼표 구분)")
+    parser.add_argument('--work-dir', help="입력/출력 파일 위치 (기본: 임시 디렉토리)")
+    parser.add_argument('--json', help="결과를 JSON으로 저장할 경로 (회귀 비교용)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    pipelines = [name for name in args.pipelines.split(',') if name]
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = args.work_dir or temp_dir
+        os.makedirs(work_dir, exist_ok=True)
+        for rows in sizes:
+            for pipeline in pipelines:
+                result = run_isolated(pipeline, rows, work_dir)
+                print_result(result)
+                results.append(result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
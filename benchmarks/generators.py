@@ -0,0 +1,182 @@
+"""벤치마크용 가상 입력 파일 생성 (CLL, ITPS, OBL, BAPLIE EDI)
+
+실행: python -m benchmarks.generators --rows 10000 --out samples/
+"""
+import argparse
+import os
+import random
+
+import openpyxl
+
+# 실제 파일과 비슷한 분포의 값 목록
+CLL_PODS = ['SIN', 'RTM', 'HAM', 'ANR', 'FXT', 'USNYC', 'CNSHA', 'KRPUS']
+ITPS_PORTS = ['BUSAN', 'KWANGYANG', 'INCHEON', 'SGSIN', 'NLRTM', 'DEHAM', 'CNSHA']
+ITPS_TYPES = ['22G1', '42G1', '45G1', '45R1', '22R1', '22T1', '42P1']
+EDI_PODS = ['SGSIN', 'NLRTM', 'DEHAM', 'BEANR', 'KRPUS', 'KRKAN', 'KRINC', 'CNSHA']
+EDI_TYPES = ['22G1', '2210', '42G1', '45G1', '45R1', '22R1', '42P1', 'L5G1', 'XXXX']
+
+CLL_HEADERS = ["NO", "CNTR NO", "OPT", "POD", "FDP", "T&S", "F/E", "WGT", "R/F",
+               "OH", "OL", "OW", "UNDG", "IMDG"]
+ITPS_HEADERS = ["Equipment Number", "Origin Load Port", "Discharge Port", "Type/Size",
+                "Reefer Temp.", "Weight", "Full/Empty", "IMO Class", "UN Number"]
+
+# 벤치마크에서 사용하는 stow 매핑 (CLL_PODS 일부와 일치)
+BENCH_STOW_MAPPING = {
+    'BENCH': [
+        {'port': 'SGSIN', 'stow_code': 'SIN'},
+        {'port': 'NLRTM', 'stow_code': 'RTM'},
+        {'port': 'DEHAM', 'stow_code': 'HAM'},
+        {'port': 'BEANR', 'stow_code': 'ANR'},
+        {'port': 'GBFXT', 'stow_code': 'FXT'},
+    ]
+}
+
+
+def container_number(prefix, index):
+    """컨테이너 번호 생성 (접두어 4자리 + 숫자 7자리)"""
+    return f"{prefix}{index:07d}"
+
+
+def cll_rows(rows, seed=0, prefix='MSCU'):
+    """CLL 데이터 행 생성기"""
+    rng = random.Random(seed)
+    for i in range(rows):
+        reefer = rng.random() < 0.1
+        dangerous = rng.random() < 0.05
+        oversize = rng.random() < 0.03
+        yield [
+            i + 1,
+            container_number(prefix, i),
+            rng.choice([None, None, 'KRPUS', 'CNSHA']),
+            rng.choice(CLL_PODS),
+            rng.choice([None, 'SGSIN', 'NLRTM']),
+            rng.choice([22, 42, 45, 45]),
+            rng.choice(['F', 'F', 'F', 'E']),
+            rng.randint(2200, 30480),
+            f"{rng.choice(['-18.0', '-25.0', '5.0'])} CEL" if reefer else None,
+            rng.choice([0, 35, 60]) if oversize else None,
+            rng.choice([0, 40]) if oversize else None,
+            rng.choice([0, 20]) if oversize else None,
+            rng.choice([1263, 3082, 1993]) if dangerous else None,
+            rng.choice([3, 9, '2.1']) if dangerous else None,
+        ]
+
+
+def write_cll_workbook(path, rows, terminal_code='PNITC', seed=0, prefix='MSCU'):
+    """CLL 엑셀 생성 (L4에 터미널 코드, 5행에 헤더, 6행부터 데이터)"""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("CLL")
+    ws.append(["CONTAINER LOADING LIST"])
+    ws.append(["VESSEL", "MSC BENCHMARK"])
+    ws.append(["VOYAGE", "BM001A"])
+    ws.append(["TERMINAL"] + [None] * 10 + [terminal_code])
+    ws.append(CLL_HEADERS)
+    for row in cll_rows(rows, seed, prefix):
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def itps_rows(rows, seed=0, prefix='ITPU'):
+    """ITPS 데이터 행 생성기"""
+    rng = random.Random(seed)
+    for i in range(rows):
+        tpsz = rng.choice(ITPS_TYPES)
+        dangerous = rng.random() < 0.05
+        yield [
+            container_number(prefix, i),
+            rng.choice(ITPS_PORTS),
+            rng.choice(ITPS_PORTS),
+            tpsz,
+            f"{rng.choice(['-18', '-25', '5'])} / C" if 'R' in tpsz else None,
+            rng.randint(2200, 30480),
+            rng.choice(['F', 'F', 'E']),
+            rng.choice([3, 8, 9.0]) if dangerous else None,
+            rng.choice([1263, 1830, 3082]) if dangerous else None,
+        ]
+
+
+def write_itps_workbook(path, rows, seed=0, prefix='ITPU'):
+    """ITPS 엑셀 생성 (1행 헤더)"""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("ITPS")
+    ws.append(ITPS_HEADERS)
+    for row in itps_rows(rows, seed, prefix):
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def write_obl_workbook(path, rows, pol='KRPUS', tol='KRPUSAB', seed=0):
+    """CLL 변환 결과와 같은 형식의 OBL 엑셀 생성 (ITPS 추가 기준 파일)"""
+    import pandas as pd
+    from obl_convert import build_obl_frame
+    from obl_pipelines import write_obl
+    from stow_index import StowIndex
+
+    cll_df = pd.DataFrame(list(cll_rows(rows, seed)), columns=CLL_HEADERS)
+    obl_df = build_obl_frame(cll_df, pol, tol, StowIndex(BENCH_STOW_MAPPING['BENCH']))
+    return write_obl(obl_df, path)
+
+
+def baplie_segments(containers, seed=0, vessel='MSC BENCHMARK', voyage='BM001A', port='KRPUS'):
+    """BAPLIE 세그먼트 생성기 (한 줄에 세그먼트 하나)"""
+    rng = random.Random(seed)
+    yield "UNB+UNOA:2+MSC+KRPUS+240102:1230+1'"
+    yield "UNH+1+BAPLIE:D:95B:UN:SMDG20'"
+    yield "BGM++1+9'"
+    yield "DTM+137:202401021230:201'"
+    yield f"TDT+20+{voyage}+++MSC:172:20+++9461269:146::{vessel}'"
+    yield f"LOC+5+{port}:139:6'"
+    yield "LOC+61+SGSIN:139:6'"
+    for i in range(containers):
+        bay = 1 + (i // 200) % 80
+        cell = f"{bay:03d}{(i // 10) % 20:02d}{(i % 10) * 2 + 2:02d}"
+        pod = rng.choice(EDI_PODS)
+        pol = port if rng.random() < 0.6 else rng.choice(EDI_PODS)
+        yield f"LOC+147+{cell}::5'"
+        yield f"MEA+WT++KGM:{rng.randint(2200, 30480)}'"
+        if rng.random() < 0.1:
+            yield f"TMP+2+{rng.choice(['-18.0', '-25.0', '05.0', '00.0'])}:CEL'"
+        yield f"LOC+9+{pol}'"
+        yield f"LOC+11+{pod}'"
+        if rng.random() < 0.3:
+            yield f"LOC+83+{rng.choice(EDI_PODS)}'"
+        yield "RFF+BM:1'"
+        yield f"EQD+CN+{container_number('MSCU', i)}+{rng.choice(EDI_TYPES)}+++{rng.choice(['5', '5', '4'])}'"
+        yield "NAD+CA+MSC:172:20'"
+        if rng.random() < 0.05:
+            yield f"DGS+IMD+{rng.choice(['3', '8', '9'])}+{rng.choice(['1263', '1830', '3082'])}++{rng.choice(['2', '3'])}'"
+        if rng.random() < 0.03:
+            yield f"DIM+{rng.choice(['5', '6', '7', '8', '9'])}+CMT::{rng.choice([10, 20, 35])}'"
+    yield "UNT+1+1'"
+    yield "UNZ+1+1'"
+
+
+def write_baplie(path, containers, seed=0, **kwargs):
+    """BAPLIE EDI 파일 생성"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for segment in baplie_segments(containers, seed, **kwargs):
+            f.write(segment + '\r\n')
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 가상 입력 파일 생성")
+    parser.add_argument('--rows', type=int, default=1000, help="컨테이너 수")
+    parser.add_argument('--out', default='.', help="출력 디렉토리")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for path in (
+        write_cll_workbook(os.path.join(args.out, f"CLL_{args.rows}.xlsx"), args.rows, seed=args.seed),
+        write_itps_workbook(os.path.join(args.out, f"ITPS_{args.rows}.xlsx"), args.rows, seed=args.seed),
+        write_obl_workbook(os.path.join(args.out, f"OBL_{args.rows}.xlsx"), args.rows, seed=args.seed),
+        write_baplie(os.path.join(args.out, f"BAPLIE_{args.rows}.edi"), args.rows, seed=args.seed),
+    ):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from instrumentation import stage
+from parse_cache import cached_parse, note_cache_result
+
+# CLL 양식: 4행 12열(L4)에 터미널 코드, 5행에 컬럼 헤더, 6행부터 컨테이너 데이터
+CLL_TERMINAL_CELL = (3, 11)  # 0-based (행, 열)
+CLL_HEADER_ROW = 4  # 0-based
+
+# 파싱 결과 캐시 버전 (CllWorkbook 속성이나 읽는 방식이 바뀌면 올린다)
+CLL_CACHE_VERSION = 1
+
+# 터미널 코드에 따른 POL, TOL 매핑
+TERMINAL_PORTS = {
+    'PNITC': {'pol': 'KRPUS', 'tol': 'KRPUSAB'},
+    'PNCOC': {'pol': 'KRPUS', 'tol': 'KRPUSPN'},
+    'BCTHD': {'pol': 'KRPUS', 'tol': 'KRPUSBC'},
+    'HJNPC': {'pol': 'KRPUS', 'tol': 'KRPUSAP'},
+    'ICTPC': {'pol': 'KRINC', 'tol': 'KRINCAH'},
+    'KEGWC': {'pol': 'KRKAN', 'tol': 'KRKANKT'}
+}
+
+
+class CllWorkbook:
+    """CLL 엑셀 파일을 한 번만 열어 터미널 코드와 데이터 테이블을 함께 제공"""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+
+        # 워크북은 한 번만 연다 (헤더 블록과 데이터 테이블 모두 같은 워크북에서 읽기)
+        with stage('workbook_read') as record, pd.ExcelFile(file_path) as workbook:
+            row, col = CLL_TERMINAL_CELL
+            header_block = workbook.parse(header=None, nrows=row + 1)
+            self.data = workbook.parse(header=CLL_HEADER_ROW)
+            record['rows'] = len(self.data)
+
+        with stage('terminal_detect'):
+            self.terminal_code = self._read_terminal_code(header_block)
+
+    @staticmethod
+    def _read_terminal_code(header_block):
+        """헤더 블록의 (4,12) 위치에서 터미널 코드 추출"""
+        row, col = CLL_TERMINAL_CELL
+        if header_block.shape[0] <= row or header_block.shape[1] <= col:
+            return ''
+        value = header_block.iloc[row, col]
+        if pd.isna(value):
+            return ''
+        return str(value).strip()
+
+    def pod_list(self):
+        """POD 목록 (서비스 매칭용)"""
+        return self.data['POD'].unique().tolist()
+
+    def port_info(self):
+        """터미널 코드 기준 POL, TOL"""
+        return terminal_to_port(self.terminal_code)
+
+    def __len__(self):
+        return len(self.data)
+
+
+def terminal_to_port(terminal_code):
+    """터미널 코드 → {'pol': ..., 'tol': ...} (매핑이 없으면 빈 값)"""
+    return TERMINAL_PORTS.get(terminal_code, {'pol': '', 'tol': ''})
+
+
+def load_cll(file_path, cache=None):
+    """CLL 파일 로드 (같은 내용의 파일은 파싱 캐시에서 읽음)"""
+    cll, hit = cached_parse(file_path, 'cll', CLL_CACHE_VERSION, lambda: CllWorkbook(file_path), cache=cache)
+    # 같은 내용의 다른 파일로 저장된 결과일 수 있으므로 경로는 현재 파일 기준
+    cll.file_path = file_path
+    cll.file_name = os.path.basename(file_path)
+    cll.cache_hit = hit
+    return cll
+
+
+def load_cll_files(file_paths, max_workers=None, progress=None):
+    """여러 CLL 파일을 프로세스 풀에서 동시에 파싱 (입력 순서대로 반환)"""
+    file_paths = list(file_paths)
+    if len(file_paths) <= 1 or max_workers == 1:
+        clls = []
+        for done, file_path in enumerate(file_paths):
+            if progress is not None:
+                progress("CLL 읽기", done, len(file_paths))
+            clls.append(load_cll(file_path))
+        return clls
+
+    results = {}
+    executor = ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(file_paths)))
+    try:
+        futures = {executor.submit(load_cll, file_path): i for i, file_path in enumerate(file_paths)}
+        for future in as_completed(futures):
+            cll = results[futures[future]] = future.result()
+            # 작업 프로세스의 캐시 적중 여부를 이 프로세스 집계에 반영
+            note_cache_result(cll.cache_hit)
+            if progress is not None:
+                progress("CLL 읽기", len(results), len(file_paths))
+    finally:
+        # 오류나 취소 시 아직 시작하지 않은 파싱은 버린다
+        executor.shutdown(wait=True, cancel_futures=True)
+    return [results[i] for i in range(len(file_paths))]
+
+
+def merge_port_info(clls, default_pol='', default_tol=''):
+    """여러 CLL의 터미널 코드로 공통 POL과 파일별 TOL 목록 결정
+
+    매핑이 없는 터미널은 기본값(선택된 POL/TOL)을 사용하며,
+    POL이 서로 다르면 한 선박의 같은 항구 CLL이 아니므로 ValueError
+    """
+    pols = []
+    tols = []
+    for cll in clls:
+        port_info = terminal_to_port(cll.terminal_code)
+        pol = port_info['pol'] or default_pol
+        tol = port_info['tol'] or default_tol
+        if not pol or not tol:
+            raise ValueError(f"{cll.file_name}: 터미널 코드 '{cll.terminal_code}'에 대한 매핑을 찾을 수 없습니다.")
+        pols.append(pol)
+        tols.append(tol)
+
+    mismatched = sorted(set(pols))
+    if len(mismatched) > 1:
+        details = '\n'.join(f"{cll.file_name}: {pol}" for cll, pol in zip(clls, pols))
+        raise ValueError(f"CLL 파일들의 POL이 일치하지 않습니다 ({', '.join(mismatched)}).\n{details}")
+    return pols[0], tols
@@ -0,0 +1,153 @@
+"""여러 BAPLIE EDI 파일 일괄 변환 및 POD 통합 요약"""
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+from edi_parser import convert_edi_file, edi_output_path, read_edi_header
+from input_files import expand_inputs
+from instrumentation import stage
+from parse_cache import note_cache_result
+
+EDI_EXTENSIONS = ('.edi', '.txt')
+
+POD_REPORT_COLUMNS = ["Vessel", "Voyage", "Port", "POD", "Total", "From Port", "File"]
+
+
+def plan_edi_outputs(file_paths, out_dir=None):
+    """입력 파일별 엑셀 출력 경로를 작업 시작 전에 결정
+
+    결과 이름은 파싱해야 알 수 있는 "선박 항차 항구"이므로 머리말만 먼저 읽는다.
+    원본/수정본처럼 같은 항차 파일끼리 경로가 겹치면 이름 뒤에 입력 파일 이름을 붙이고,
+    그래도 겹치면 ValueError. 머리말을 읽을 수 없는 파일은 None (변환 작업이 오류를 보고).
+    """
+    headers = {}
+    for file_path in file_paths:
+        try:
+            headers[file_path] = read_edi_header(file_path)
+        except Exception:
+            headers[file_path] = None
+
+    def output_path(file_path, suffix=''):
+        if headers[file_path] is None:
+            return None
+        return edi_output_path(out_dir or os.path.dirname(file_path), *headers[file_path], suffix=suffix)
+
+    def path_key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    planned = {file_path: output_path(file_path) for file_path in file_paths}
+    counts = Counter(path_key(path) for path in planned.values() if path)
+    for file_path, path in planned.items():
+        if path and counts[path_key(path)] > 1:
+            planned[file_path] = output_path(file_path, os.path.splitext(os.path.basename(file_path))[0])
+
+    counts = Counter(path_key(path) for path in planned.values() if path)
+    clashes = [file_path for file_path, path in planned.items() if path and counts[path_key(path)] > 1]
+    if clashes:
+        raise ValueError(f"출력 파일 이름이 겹칩니다 (다른 폴더의 같은 이름 파일): {', '.join(clashes)}")
+    return planned
+
+
+def _convert_edi_job(file_path, out_dir, output_file):
+    """프로세스 풀용 EDI 변환 (예외는 메시지로 돌려줌)"""
+    try:
+        return convert_edi_file(file_path, out_dir, output_file=output_file), None
+    except Exception as e:
+        return None, str(e)
+
+
+def convert_edi_files(file_paths, out_dir=None, max_workers=None, progress=None):
+    """여러 EDI 파일을 프로세스 풀에서 동시에 변환
+
+    (성공 결과 목록, (파일 경로, 오류 메시지) 목록)을 입력 순서대로 반환하며,
+    각 결과에는 'input_file'이 추가된다. 한 파일의 실패는 나머지 변환을 멈추지 않는다.
+    출력 경로는 plan_edi_outputs로 미리 정한다 (겹치는 이름을 만들 수 없으면 ValueError).
+    """
+    file_paths = list(file_paths)
+    output_files = plan_edi_outputs(file_paths, out_dir)
+    outcomes = {}
+    if len(file_paths) <= 1 or max_workers == 1:
+        for done, file_path in enumerate(file_paths):
+            if progress is not None:
+                progress("EDI 변환", done, len(file_paths))
+            outcomes[done] = _convert_edi_job(file_path, out_dir, output_files[file_path])
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(file_paths)))
+        try:
+            futures = {executor.submit(_convert_edi_job, file_path, out_dir, output_files[file_path]): i
+                       for i, file_path in enumerate(file_paths)}
+            for future in as_completed(futures):
+                result, error = outcomes[futures[future]] = future.result()
+                # 작업 프로세스의 캐시 적중 여부를 이 프로세스 집계에 반영
+                if result is not None:
+                    note_cache_result(result['cache_hit'])
+                if progress is not None:
+                    progress("EDI 변환", len(outcomes), len(file_paths))
+        finally:
+            # 오류나 취소 시 아직 시작하지 않은 변환은 버린다
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    results = []
+    errors = []
+    for i, file_path in enumerate(file_paths):
+        result, error = outcomes[i]
+        if error is None:
+            results.append({**result, 'input_file': file_path})
+        else:
+            errors.append((file_path, error))
+    return results, errors
+
+
+def pod_report_frame(results):
+    """변환 결과들의 POD 요약을 (선박, 항차, 항구, POD)별 한 행으로 합친 데이터프레임"""
+    rows = []
+    for result in results:
+        for pod, count in sorted(result['pod_summary'].items()):
+            rows.append([result['vessel'], result['voy'], result['port'], pod, count,
+                         result['pol_pod_summary'].get(pod, 0),
+                         os.path.basename(result['input_file'])])
+    return pd.DataFrame(rows, columns=POD_REPORT_COLUMNS)
+
+
+def pod_report_path(out_dir):
+    """통합 POD 요약 파일 경로"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(out_dir, f"EDI_POD_Summary_{timestamp}.xlsx")
+
+
+def write_pod_report(results, output_file):
+    """통합 POD 요약 엑셀 저장
+
+    "POD Summary" 시트는 파일별 POD 수량 목록, "Port Matrix" 시트는
+    선박/항차/항구별 행 × POD 열 표이며 합계 열을 포함한다.
+    """
+    report = pod_report_frame(results)
+    with stage('excel_write', len(report)):
+        matrix = report.pivot_table(index=["Vessel", "Voyage", "Port"], columns="POD",
+                                    values="Total", aggfunc='sum', fill_value=0)
+        matrix["Total"] = matrix.sum(axis=1)
+        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+            report.to_excel(writer, sheet_name="POD Summary", index=False)
+            matrix.to_excel(writer, sheet_name="Port Matrix")
+    return output_file
+
+
+def convert_edi_batch(file_paths, out_dir=None, max_workers=None, progress=None):
+    """EDI 파일 일괄 변환 + 통합 POD 요약 저장
+
+    통합 요약은 out_dir(없으면 첫 입력 파일의 폴더)에 저장하며, 성공한 파일이 없으면 만들지 않는다.
+    """
+    file_paths = expand_inputs(file_paths, EDI_EXTENSIONS)
+    if not file_paths:
+        raise ValueError("변환할 EDI 파일이 없습니다.")
+
+    results, errors = convert_edi_files(file_paths, out_dir, max_workers, progress)
+    report_file = None
+    if results:
+        if progress is not None:
+            progress("요약 저장")
+        report_file = write_pod_report(results, pod_report_path(out_dir or os.path.dirname(file_paths[0])))
+    return {'results': results, 'errors': errors, 'report_file': report_file}
@@ -0,0 +1,167 @@
+"""BAPLIE 두 개(원본/수정본) 비교
+
+두 파일을 파싱한 뒤 컨테이너 번호 → 위치 해시 인덱스로 한 번만 훑어
+추가/삭제된 컨테이너와 셀, POD, 무게, 온도, 위험물 정보 변경을 찾는다.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from edi_parser import EDI_FIELDS, EDI_HEADERS, load_edi_file
+from instrumentation import stage
+from parse_cache import note_cache_result
+
+# 비교 대상 필드 → 표시 이름
+DIFF_FIELDS = {
+    'cell': "CELL",
+    'pod': "POD",
+    'weight': "WGT",
+    'temp': "Temp",
+    'dg': "DG",
+    'unno': "UNNO",
+}
+
+# 추가/삭제 시트에 쓰는 필드 (EDI 엑셀 열 순서)
+RECORD_FIELDS = sorted(EDI_FIELDS, key=EDI_FIELDS.get)
+RECORD_HEADERS = [EDI_HEADERS[EDI_FIELDS[field] - 1] for field in RECORD_FIELDS]
+
+CHANGE_HEADERS = ["Cntr No.", "Field", "Before", "After", "Before CELL", "After CELL"]
+
+HEADER_FONT = Font(bold=True)
+
+
+def index_containers(containers):
+    """컨테이너 번호 → 레코드 위치 (번호가 없으면 제외, 중복이면 처음 것 사용)"""
+    index = {}
+    for i, cntr_no in enumerate(containers['cntr_no']):
+        if cntr_no and cntr_no not in index:
+            index[cntr_no] = i
+    return index
+
+
+def container_record(containers, i):
+    """i번째 컨테이너의 레코드 값 목록 (RECORD_FIELDS 순서)"""
+    return [containers[field][i] for field in RECORD_FIELDS]
+
+
+def diff_containers(old, new, fields=DIFF_FIELDS):
+    """두 컬럼 레코드의 차이 (added/removed는 레코드 목록, changed는 변경 행 목록)"""
+    remaining = index_containers(old)
+    added = []
+    changed = []
+    field_counts = dict.fromkeys(fields, 0)
+
+    new_cntr_nos = new['cntr_no']
+    compared = [(field, old[field], new[field]) for field in fields]
+    seen = set()
+    for j, cntr_no in enumerate(new_cntr_nos):
+        if not cntr_no or cntr_no in seen:
+            continue
+        seen.add(cntr_no)
+        i = remaining.pop(cntr_no, None)
+        if i is None:
+            added.append(container_record(new, j))
+            continue
+        for field, old_values, new_values in compared:
+            if old_values[i] != new_values[j]:
+                changed.append([cntr_no, fields[field], old_values[i], new_values[j], old['cell'][i], new['cell'][j]])
+                field_counts[field] += 1
+
+    removed = [container_record(old, i) for i in sorted(remaining.values())]
+    return {
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+        'field_counts': field_counts,
+        'changed_containers': len({row[0] for row in changed}),
+    }
+
+
+def edi_diff_path(out_dir, parsed):
+    """비교 결과 파일 경로 ("선박 항차 항구_DIFF_날짜.xlsx")"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(out_dir, f"{parsed['vessel']} {parsed['voy']} {parsed['port']}_DIFF_{timestamp}.xlsx")
+
+
+def write_diff_workbook(diff, old_file, new_file, output_file):
+    """비교 결과 저장 (Summary / Added / Removed / Changed 시트)"""
+    wb = Workbook(write_only=True)
+
+    def add_sheet(title, headers, rows):
+        ws = wb.create_sheet(title)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = HEADER_FONT
+            header_cells.append(cell)
+        ws.append(header_cells)
+        for row in rows:
+            ws.append(row)
+        return ws
+
+    summary = [
+        ["Before", os.path.basename(old_file)],
+        ["After", os.path.basename(new_file)],
+        ["Added", len(diff['added'])],
+        ["Removed", len(diff['removed'])],
+        ["Changed containers", diff['changed_containers']],
+    ]
+    summary += [[f"Changed {name}", diff['field_counts'][field]] for field, name in DIFF_FIELDS.items()]
+    add_sheet("Summary", ["Item", "Value"], summary)
+    add_sheet("Added", RECORD_HEADERS, diff['added'])
+    add_sheet("Removed", RECORD_HEADERS, diff['removed'])
+    add_sheet("Changed", CHANGE_HEADERS, diff['changed'])
+    wb.save(output_file)
+    return output_file
+
+
+def load_edi_pair(old_file, new_file):
+    """두 EDI 파일을 동시에 파싱 (파싱 캐시 사용, 코어가 하나면 차례로)"""
+    if (os.cpu_count() or 1) < 2:
+        return load_edi_file(old_file)[0], load_edi_file(new_file)[0]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(load_edi_file, path) for path in (old_file, new_file)]
+        loaded = [future.result() for future in futures]
+    # 작업 프로세스의 캐시 적중 여부를 이 프로세스 집계에 반영
+    for _, hit in loaded:
+        note_cache_result(hit)
+    return loaded[0][0], loaded[1][0]
+
+
+def diff_edi_files(old_file, new_file, out_dir=None, progress=None):
+    """원본/수정본 BAPLIE 비교 후 결과 엑셀 저장 (요약 dict 반환)"""
+    for path in (old_file, new_file):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"파일이 존재하지 않습니다: {path}")
+
+    if progress is not None:
+        progress("EDI 파싱")
+    old, new = load_edi_pair(old_file, new_file)
+
+    if progress is not None:
+        progress("비교")
+    with stage('edi_diff', new['count']):
+        diff = diff_containers(old['containers'], new['containers'])
+
+    if progress is not None:
+        progress("파일 저장")
+    output_file = edi_diff_path(out_dir or os.path.dirname(new_file), new)
+    with stage('excel_write', len(diff['added']) + len(diff['removed']) + len(diff['changed'])):
+        write_diff_workbook(diff, old_file, new_file, output_file)
+
+    return {
+        'vessel': new['vessel'],
+        'voy': new['voy'],
+        'port': new['port'],
+        'before_count': old['count'],
+        'after_count': new['count'],
+        'added': len(diff['added']),
+        'removed': len(diff['removed']),
+        'changed_containers': diff['changed_containers'],
+        'field_counts': diff['field_counts'],
+        'output_file': output_file,
+    }
@@ -0,0 +1,484 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import Counter
+
+from openpyxl import Workbook, utils
+from openpyxl.cell import WriteOnlyCell
+
+from edifact import iter_segments
+from instrumentation import add_stage, stage
+from iso_types import default_type_table
+from parse_cache import cached_parse
+
+_logger = logging.getLogger("obl_convertor.edi_parser")
+
+# 엑셀 헤더 (6번째 행)
+EDI_HEADERS = ["POD", "CELL", "Cntr No.", "OPR", "POL", "STOW", "FPOD", "POR",
+               "TpSz", "WGT", "F_E", "SP", "Temp", "DG", "UNNO", "PG", "FP",
+               "PrePos", "ACC.", "RSN", "Over Dimension", "Over Slot", "Remark",
+               "Void.Calc", "Void.Calc"]
+
+# 컨테이너 레코드 필드 → 엑셀 열 번호 (나머지 열은 빈 칸)
+EDI_FIELDS = {
+    'pod': 1,
+    'cell': 2,
+    'cntr_no': 3,
+    'opr': 4,
+    'pol': 5,
+    'fpod': 7,
+    'por': 8,
+    'tpsz': 9,
+    'weight': 10,
+    'fe': 11,
+    'temp': 13,
+    'dg': 14,
+    'unno': 15,
+    'over_dimension': 21,
+}
+
+# 엑셀에는 쓰지 않고 OBL 직접 변환에만 쓰는 필드 (ISO 타입 원본 코드, kg 단위 무게)
+EDI_EXTRA_FIELDS = ('iso_type', 'weight_kg')
+
+# 새 컨테이너 레코드의 기본값 (환적항/최종 목적지는 UNSET)
+EDI_FIELD_DEFAULTS = {'fpod': "UNSET", 'por': "UNSET"}
+
+# LOC 한정자 → 레코드 필드
+LOC_FIELDS = {
+    "9": 'pol', "6": 'pol',  # 선적항 (5열)
+    "11": 'pod', "12": 'pod',  # 양하항 (1열)
+    "76": 'por',  # 최종 목적지 (8열)
+    "83": 'fpod',  # 환적항 (7열)
+}
+
+# 파싱 결과 캐시 버전 (parse_edi_file 결과 형식이나 해석이 바뀌면 올린다)
+EDI_PARSER_VERSION = 3
+
+HEADER_ROW = 6
+COLUMN_WIDTH = 12
+WEIGHT_FORMAT = "0.0"
+
+
+def edi_output_path(input_dir, vessel, voy, port, suffix=''):
+    """EDI 변환 결과 파일 경로 ("선박 항차 항구.xlsx", suffix가 있으면 "선박 항차 항구 (suffix).xlsx")"""
+    name = f"{vessel} {voy} {port}"
+    if suffix:
+        name += f" ({suffix})"
+    return os.path.join(input_dir, f"{name}.xlsx")
+
+
+def format_temperature(temp_str):
+    """TMP 온도값 표시 형식 변환 (05.0 → 5.0C, -018.0 → -18.0C)"""
+    temp_str = temp_str.strip()
+
+    # 부호 처리
+    is_negative = temp_str.startswith('-')
+    if is_negative:
+        temp_str = temp_str[1:]  # 마이너스 부호 제거
+    elif temp_str.startswith('+'):
+        temp_str = temp_str[1:]  # 플러스 부호 제거
+
+    # 앞의 0 제거하고 소수점 처리
+    if temp_str.startswith('0') and not temp_str.startswith('0.'):
+        temp_str = temp_str[1:]  # 앞의 0 제거
+
+    # 부호 다시 추가
+    if is_negative:
+        temp_str = f"-{temp_str}"
+    return f"{temp_str}C"
+
+
+class EdiParseState:
+    """파싱 중인 BAPLIE의 선박 정보와 컨테이너별 컬럼 레코드"""
+
+    def __init__(self, type_table):
+        self.type_table = type_table
+        self.containers = {field: [] for field in (*EDI_FIELDS, *EDI_EXTRA_FIELDS)}
+        self.header_rows = {}
+        self.unknown_types = Counter()  # 변환표에 없는 ISO 타입 코드별 컨테이너 수
+        self.invalid_segments = Counter()  # 값을 읽지 못한 세그먼트 태그별 수
+        self.vessel = ""
+        self.voy = ""
+        self.port = ""
+        self.formatted_date_time = ""
+        self.count = 0
+
+    def start_container(self, cell):
+        """새 컨테이너 레코드 추가 (LOC+147)"""
+        self.count += 1
+        for field, values in self.containers.items():
+            values.append(EDI_FIELD_DEFAULTS.get(field))
+        self.containers['cell'][-1] = cell
+
+    def set_field(self, field, value):
+        """현재 컨테이너의 필드 설정"""
+        # 첫 LOC+147 이전(헤더 영역)의 컨테이너 정보는 무시
+        if self.count:
+            self.containers[field][-1] = value
+
+    def vessel_row(self):
+        return f"Vessel Name : {self.vessel}                                                                                                   Data : {self.formatted_date_time}"
+
+
+# DTM (날짜/시간) 처리
+def handle_dtm(segment, state):
+    date_time_parts = segment[1].split(':')
+    if date_time_parts[0] == "137":
+        date_str = date_time_parts[1]
+        edi_date = f"{date_str[6:8]}.{date_str[4:6]}.{date_str[:4]}"
+        edi_time = f"{date_str[8:10]}:{date_str[10:12]}:23"
+        state.formatted_date_time = f"{edi_date} {edi_time}"
+        state.header_rows[2] = state.vessel_row()
+
+
+# TDT (선박 정보) 처리
+def handle_tdt(segment, state):
+    state.vessel = segment.raw.split('::')[1]
+    state.voy = segment[2]
+
+    state.header_rows[1] = "                                                               Inquary Summary(Detail Information)"
+    state.header_rows[2] = state.vessel_row()
+    state.header_rows[4] = "Operator Code : MSC"
+
+
+# LOC+5: 현재 항구
+def handle_loc_port(segment, state):
+    state.port = segment[2][:5]
+    state.header_rows[3] = f"Voyage No : {state.voy}                                                                                                   Port : {state.port}"
+
+
+# LOC+147: 셀 위치 (2열), 새 컨테이너 시작
+def handle_loc_cell(segment, state):
+    if len(segment) >= 3 and segment[2].strip():
+        state.start_container(int(segment[2][:7]))
+
+
+def loc_field_handler(field):
+    """LOC 항구 코드를 레코드 필드에 기록하는 처리 함수 생성"""
+    def handle_loc_field(segment, state):
+        if len(segment) >= 3 and segment[2].strip():
+            cell_value = segment[2][:5]
+            if cell_value == "KRBUS":
+                cell_value = "KRPUS"
+            state.set_field(field, cell_value)
+    return handle_loc_field
+
+
+# MEA (무게 정보) 처리
+def handle_mea(segment, state):
+    if len(segment) <= 3:
+        return
+    try:
+        # MEA+WT++KGM:29600 형식에서 무게 추출
+        weight_str = segment[3].split(':')[1]  # 29600 추출
+        weight_kg = float(weight_str)
+        state.set_field('weight', round(weight_kg / 1000, 1))  # 29600 → 29.6
+        state.set_field('weight_kg', weight_kg)
+    except Exception:
+        state.invalid_segments['MEA'] += 1
+        state.set_field('weight', "")
+
+
+# EQD (컨테이너 정보) 처리
+def handle_eqd(segment, state):
+    try:
+        # 컨테이너 번호 (3열)
+        state.set_field('cntr_no', segment[2])
+
+        # 컨테이너 타입 (9열)
+        if len(segment) > 3:
+            state.set_field('iso_type', segment[3])
+            state.set_field('tpsz', state.type_table.resolve(segment[3], state.unknown_types))
+
+        # E/F 상태 (11열)
+        if len(segment) > 6:
+            handle_full_empty(segment[6], state)
+
+    except Exception:
+        state.invalid_segments['EQD'] += 1
+
+
+def handle_full_empty(indicator, state):
+    """적재 상태 코드 (4: Empty, 5: Full)"""
+    if indicator == "4":
+        state.set_field('fe', "E")
+    elif indicator == "5":
+        state.set_field('fe', "F")
+
+
+# CN (컨테이너 상태) 처리
+def handle_cn(segment, state):
+    if len(segment) > 6:
+        handle_full_empty(segment[6], state)
+
+
+# NAD (운송인 정보) 처리
+def handle_nad(segment, state):
+    if len(segment) > 2:
+        state.set_field('opr', segment[2][:3])
+
+
+# TMP (온도 정보) 처리
+def handle_tmp(segment, state):
+    if len(segment) <= 2:
+        return
+    try:
+        # TMP+2+05.0:CEL 또는 TMP+2+00.0:CEL 형식에서 온도값 추출
+        state.set_field('temp', format_temperature(segment[2].split(':')[0]))
+    except Exception:
+        state.invalid_segments['TMP'] += 1
+        state.set_field('temp', "")  # 에러 시 빈 값 설정
+
+
+# DGS (위험물 정보) 처리
+def handle_dgs(segment, state):
+    if len(segment) > 3:
+        state.set_field('dg', float(segment[2]))
+        state.set_field('unno', float(segment[3]))
+
+
+# DIM (치수 정보) 처리
+def handle_dim(segment, state):
+    if len(segment) > 2:
+        state.set_field('over_dimension', segment[2])
+
+
+# 세그먼트 태그 → 처리 함수 (dict 값은 첫 요소(한정자) → 처리 함수, 키 None은 나머지 한정자용)
+SEGMENT_HANDLERS = {
+    'DTM': handle_dtm,
+    'TDT': handle_tdt,
+    'LOC': {
+        "5": handle_loc_port,
+        "147": handle_loc_cell,
+        **{qualifier: loc_field_handler(field) for qualifier, field in LOC_FIELDS.items()},
+    },
+    'MEA': handle_mea,
+    'EQD': handle_eqd,
+    'CN': handle_cn,
+    'NAD': handle_nad,
+    'TMP': handle_tmp,
+    'DGS': handle_dgs,
+    'DIM': handle_dim,
+}
+
+
+def register_segment_handler(tag, handler, qualifier=None):
+    """세그먼트 처리 함수 등록 (qualifier를 주면 첫 요소 값별로 등록, 예: LOC+147)
+
+    처리 함수는 handler(segment, state) 형식이며 state는 EdiParseState이다.
+    한정자별 처리 함수가 있는 태그에 qualifier 없이 등록하면 기존 한정자별 처리 함수는
+    그대로 두고 나머지 한정자용으로 등록하며, 한정자 없는 처리 함수가 있던 태그에
+    qualifier를 주면 기존 처리 함수를 나머지 한정자용으로 남긴다.
+    """
+    current = SEGMENT_HANDLERS.get(tag)
+    if qualifier is None:
+        if isinstance(current, dict):
+            current[None] = handler
+        else:
+            SEGMENT_HANDLERS[tag] = handler
+        return
+    if not isinstance(current, dict):
+        current = SEGMENT_HANDLERS[tag] = {} if current is None else {None: current}
+    current[qualifier] = handler
+
+
+def handlers_fingerprint(handlers=None):
+    """처리 함수 구성 해시 (태그, 한정자, 함수 이름; 파싱 캐시 키에 사용)"""
+    handlers = SEGMENT_HANDLERS if handlers is None else handlers
+    entries = []
+    for tag, handler in handlers.items():
+        qualified = handler if isinstance(handler, dict) else {None: handler}
+        for qualifier, function in qualified.items():
+            entries.append([tag, qualifier or '', f"{function.__module__}.{function.__qualname__}"])
+    content = json.dumps(sorted(entries))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+def parse_edi_file(input_file_path, progress=None, type_table=None, handlers=None):
+    """EDI(BAPLIE) 파일을 컨테이너별 컬럼 레코드로 파싱
+
+    반환 dict의 'containers'는 필드 이름 → 컨테이너 순서의 값 목록이며,
+    'header_rows'는 1~4행에 들어갈 선박/항차 정보 문자열, 'segment_stats'는
+    세그먼트(LOC는 한정자 포함)별 [개수, 처리 시간(초)], 'invalid_segments'는
+    값을 읽지 못해 빈 값으로 둔 세그먼트 태그별 수이다.
+    """
+    handlers = SEGMENT_HANDLERS if handlers is None else handlers
+    state = EdiParseState(type_table or default_type_table())
+    segment_stats = {}
+    skipped = Counter()  # 처리 함수가 없어 디코딩하지 않은 세그먼트 수
+    clock = time.perf_counter
+
+    with stage('edi_parse') as record:
+        for segment in iter_segments(input_file_path, progress=progress, tags=handlers, skipped=skipped):
+            key = tag = segment.tag
+            handler = handlers.get(tag)
+            if type(handler) is dict:
+                qualifier = segment[1] if len(segment) > 1 else ''
+                key = f"{tag}+{qualifier}"
+                handler = handler.get(qualifier) or handler.get(None)
+
+            stats = segment_stats.get(key)
+            if stats is None:
+                stats = segment_stats[key] = [0, 0.0]
+            stats[0] += 1
+            if handler is None:
+                continue
+
+            start = clock()
+            handler(segment, state)
+            stats[1] += clock() - start
+
+        record['rows'] = state.count
+
+    for tag, count in skipped.items():
+        segment_stats.setdefault(tag, [0, 0.0])[0] += count
+
+    # 세그먼트별 처리 시간을 작업 타이머에도 기록 (시간 상세 / 타이밍 로그)
+    for key, (count, seconds) in segment_stats.items():
+        add_stage(f"segment:{key}", seconds, count)
+    if state.invalid_segments:
+        _logger.warning("%s: 값을 읽지 못한 세그먼트 %s", input_file_path, dict(state.invalid_segments))
+
+    return {
+        'vessel': state.vessel,
+        'voy': state.voy,
+        'port': state.port,
+        'header_rows': state.header_rows,
+        'containers': state.containers,
+        'count': state.count,
+        'unknown_types': dict(state.unknown_types),
+        'invalid_segments': dict(state.invalid_segments),
+        'segment_stats': segment_stats,
+    }
+
+
+def summarize_pods(containers, port):
+    """(전체 POD별 수량, POL이 port인 컨테이너의 POD별 수량) 집계"""
+    pod_summary = Counter()
+    pol_pod_summary = Counter()
+    for pod, pol in zip(containers['pod'], containers['pol']):
+        if pod and pod != "UNSET":  # POD 값이 있고 UNSET이 아닌 경우만
+            pod_summary[pod] += 1
+            # POL이 현재 port와 일치하는 경우만 별도 집계
+            if pol == port:
+                pol_pod_summary[pod] += 1
+    return dict(pod_summary), dict(pol_pod_summary)
+
+
+def iter_container_rows(ws, containers):
+    """컬럼 레코드를 엑셀 행(25열 값 목록)으로 변환"""
+    width = len(EDI_HEADERS)
+    positions = [(column - 1, containers[field]) for field, column in EDI_FIELDS.items()]
+    weight_column = EDI_FIELDS['weight'] - 1
+    for i in range(len(containers['cell'])):
+        row = [None] * width
+        for position, values in positions:
+            row[position] = values[i]
+        weight = row[weight_column]
+        if isinstance(weight, float):
+            cell = WriteOnlyCell(ws, value=weight)
+            cell.number_format = WEIGHT_FORMAT
+            row[weight_column] = cell
+        yield row
+
+
+def write_edi_workbook(parsed, output_file):
+    """파싱 결과를 write-only 워크북에 한 번에 기록 (1~4행 선박 정보, 6행 헤더, 7행부터 데이터)"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+
+    # 기본 열 너비 설정
+    for column in range(1, len(EDI_HEADERS) + 1):  # A to Y
+        ws.column_dimensions[utils.get_column_letter(column)].width = COLUMN_WIDTH
+
+    header_rows = parsed['header_rows']
+    for row in range(1, HEADER_ROW):
+        ws.append([header_rows[row]] if row in header_rows else [])
+    ws.append(EDI_HEADERS)
+
+    for row in iter_container_rows(ws, parsed['containers']):
+        ws.append(row)
+    wb.save(output_file)
+
+
+def read_edi_header(input_file_path):
+    """BAPLIE 머리말(첫 LOC+147 전)만 읽어 (선박, 항차, 항구) 반환 (출력 경로를 미리 정할 때 사용)"""
+    state = EdiParseState(None)
+    segments = iter_segments(input_file_path, tags={'TDT', 'LOC'})
+    try:
+        for segment in segments:
+            if segment.tag == 'TDT':
+                handle_tdt(segment, state)
+            elif len(segment) > 1 and segment[1] == '147':
+                break
+            elif len(segment) > 2 and segment[1] == '5':
+                handle_loc_port(segment, state)
+    finally:
+        segments.close()
+    return state.vessel, state.voy, state.port
+
+
+def load_edi_file(input_file_path, progress=None, type_table=None, cache=None):
+    """EDI 파싱 결과를 캐시에서 읽거나 새로 파싱 ((파싱 결과, 캐시 적중 여부) 반환)
+
+    캐시 키에 변환표와 처리 함수 구성을 포함하므로 처리 함수를 등록하면 다시 파싱한다.
+    캐시 적중 시 'segment_stats'는 이번에 측정한 값이 없으므로 빈 dict이다.
+    """
+    type_table = type_table or default_type_table()
+    parsed, cache_hit = cached_parse(input_file_path, 'edi', EDI_PARSER_VERSION,
+                                     lambda: parse_edi_file(input_file_path, progress, type_table),
+                                     type_table.fingerprint(), handlers_fingerprint(), cache=cache)
+    if cache_hit:
+        parsed = {**parsed, 'segment_stats': {}}
+    return parsed, cache_hit
+
+
+def convert_edi_file(input_file_path, out_dir=None, progress=None, type_table=None, cache=None, output_file=None):
+    """EDI(BAPLIE) 파일을 엑셀로 변환하고 POD 요약과 미등록 타입 코드 집계를 반환
+
+    output_file을 생략하면 "선박 항차 항구.xlsx"에 저장한다.
+    """
+    if not os.path.exists(input_file_path):
+        raise FileNotFoundError("파일이 존재하지 않습니다.")
+
+    input_dir = out_dir or os.path.dirname(input_file_path)
+
+    parsed, cache_hit = load_edi_file(input_file_path, progress, type_table, cache)
+    vessel, voy, port = parsed['vessel'], parsed['voy'], parsed['port']
+
+    # POD 요약 생성
+    pod_summary, pol_pod_summary = summarize_pods(parsed['containers'], port)
+
+    # 파일 저장
+    if progress is not None:
+        progress("파일 저장")
+    output_file = output_file or edi_output_path(input_dir, vessel, voy, port)
+
+    # 기존 파일이 있다면 삭제
+    if os.path.exists(output_file):
+        try:
+            os.remove(output_file)
+        except PermissionError:
+            raise PermissionError("기존 파일이 열려있습니다. 파일을 닫고 다시 시도해주세요.")
+
+    with stage('excel_write', parsed['count']):
+        write_edi_workbook(parsed, output_file)
+
+    # 파일이 정상적으로 생성되었는지 확인
+    if not os.path.exists(output_file):
+        raise IOError("파일 생성에 실패했습니다.")
+    if os.path.getsize(output_file) == 0:
+        raise IOError("파일이 올바르게 생성되지 않았습니다.")
+
+    return {
+        'vessel': vessel,
+        'voy': voy,
+        'port': port,
+        'pod_summary': pod_summary,
+        'pol_pod_summary': pol_pod_summary,
+        'unknown_types': parsed['unknown_types'],
+        'cache_hit': cache_hit,
+        'output_file': output_file
+    }
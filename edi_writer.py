@@ -0,0 +1,353 @@
+"""OBL 데이터 → BAPLIE / COPRAR EDI 파일 쓰기
+
+OBL 데이터프레임(convert_file/combine_cll_files 결과) 또는 저장된 OBL 파일을
+행 단위로 읽어 세그먼트를 하나씩 만들어 바로 파일에 쓴다. 행 수와 관계없이
+메모리 사용량이 일정하다.
+
+SzTp는 TpSz 매핑과 ISO 타입 변환표를 역방향으로 써서 ISO 코드로, 항구 이름은
+port_resolver로 5자리 코드로 바꾼다. BAPLIE의 LOC+147(적재 위치)은 필수이므로
+OBL에 숫자 셀 위치('Cell' 열, 베이/열/단)가 없는 컨테이너가 있으면 ValueError로
+멈춘다. 적재 전 OBL처럼 셀 위치가 없는 데이터는 COPRAR로 보낸다.
+"""
+import itertools
+import math
+import os
+from datetime import datetime
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from edifact import COMPONENT_SEPARATOR, ELEMENT_SEPARATOR, SEGMENT_TERMINATOR, escape
+from instrumentation import stage
+from iso_types import default_type_table
+from obl_schema import normalize_obl_columns
+from obl_writer import OBL_CHUNK_ROWS, iter_frame_chunks
+from port_resolver import PORT_CODES, port_resolver
+
+# 메시지 종류별 UNH 메시지 식별자와 BGM 문서 코드/기능
+EDI_MESSAGES = {
+    'BAPLIE': {'identifier': ('BAPLIE', 'D', '95B', 'UN', 'SMDG22'), 'document': '', 'function': '9'},
+    'COPRAR': {'identifier': ('COPRAR', 'D', '00B', 'UN', 'SMDG21'), 'document': '45', 'function': '5'},
+}
+
+# OOG 열 → DIM 한정자 (5: 앞, 6: 뒤, 7: 오른쪽, 8: 왼쪽, 9: 높이)
+OOG_DIMENSIONS = {'OvDF': '5', 'OvDA': '6', 'OvDS': '7', 'OvDP': '8', 'OvDH': '9'}
+
+DEFAULT_OPERATOR = "MSC"
+
+# 세그먼트 사이 줄바꿈 (읽는 쪽은 무시)
+SEGMENT_SEPARATOR = SEGMENT_TERMINATOR + "\r\n"
+
+PROGRESS_INTERVAL = 5000
+
+
+def _value(value):
+    """셀 값을 EDI 문자열로 (빈 값/NaN은 '', 정수인 실수는 소수점 없이)"""
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+def segment(tag, *elements):
+    """세그먼트 문자열 생성 (튜플 요소는 구성 요소, 끝의 빈 요소는 생략, 구분자는 해제 문자 처리)"""
+    parts = [tag]
+    for element in elements:
+        if isinstance(element, tuple):
+            components = [escape(_value(component)) for component in element]
+            while components and not components[-1]:
+                components.pop()
+            parts.append(COMPONENT_SEPARATOR.join(components))
+        else:
+            parts.append(escape(_value(element)))
+    while len(parts) > 1 and not parts[-1]:
+        parts.pop()
+    return ELEMENT_SEPARATOR.join(parts)
+
+
+def iter_obl_records(source, chunk_rows=OBL_CHUNK_ROWS):
+    """OBL 데이터프레임/청크 이터레이터/파일(.xlsx, .csv)을 행 dict로 하나씩 읽기"""
+    if isinstance(source, pd.DataFrame):
+        source = iter_frame_chunks(source, chunk_rows)
+    elif isinstance(source, str):
+        if source.lower().endswith('.csv'):
+            source = pd.read_csv(source, chunksize=chunk_rows, dtype=object)
+        else:
+            yield from _iter_xlsx_records(source)
+            return
+    for chunk in source:
+        yield from normalize_obl_columns(chunk).to_dict('records')
+
+
+def _iter_xlsx_records(file_path):
+    """read-only 모드로 엑셀 행을 차례로 읽기 (중복 헤더는 pandas처럼 이름 변경)"""
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = []
+        for name in header:
+            name = '' if name is None else str(name)
+            column, suffix = name, 0
+            while column in columns:
+                suffix += 1
+                column = f"{name}.{suffix}"
+            columns.append(column)
+        columns = normalize_obl_columns(pd.DataFrame(columns=columns)).columns.tolist()
+        for row in rows:
+            if any(value is not None for value in row):
+                yield dict(zip(columns, row))
+    finally:
+        wb.close()
+
+
+class TypeResolver:
+    """OBL SzTp → ISO 타입 코드 (TpSz 매핑 → MSC 타입 → ISO 코드, 결과 캐시)"""
+
+    def __init__(self, tpsz_mapping=None, type_table=None):
+        self.type_table = type_table or default_type_table()
+        # TpSz 매핑 역방향 (같은 SzTp가 여럿이면 처음 것 사용)
+        self.msc_types = {}
+        for msc_type, sztp in (tpsz_mapping or {}).items():
+            self.msc_types.setdefault(str(sztp), msc_type)
+        self._cache = {}
+
+    def __call__(self, sztp):
+        sztp = _value(sztp)
+        code = self._cache.get(sztp)
+        if code is None:
+            msc_type = self.msc_types.get(sztp)
+            if msc_type is not None:
+                code = self.type_table.iso_code(msc_type) or msc_type
+            elif sztp in self.type_table.mapping:
+                code = sztp  # 이미 ISO 코드
+            else:
+                code = self.type_table.iso_code(sztp) or sztp
+            self._cache[sztp] = code
+        return code
+
+
+def header_segments(message, header, reference):
+    """UNH ~ LOC+5/LOC+9 헤더 세그먼트"""
+    config = EDI_MESSAGES[message]
+    prepared = header.get('prepared') or datetime.now()
+    yield segment('UNH', reference, config['identifier'])
+    yield segment('BGM', config['document'], reference, config['function'])
+    yield segment('DTM', ('137', prepared.strftime("%Y%m%d%H%M"), '201'))
+    operator = header.get('operator') or DEFAULT_OPERATOR
+    yield segment('TDT', '20', header.get('voyage', ''), '', '', (operator, '172', '20'), '', '',
+                  (header.get('call_sign', ''), '146', '', header.get('vessel', '')))
+    port = header.get('port', '')
+    if port:
+        yield segment('LOC', '5' if message == 'BAPLIE' else '9', (port, '139', '6'))
+
+
+def baplie_container_segments(record, resolve_type, resolve_port):
+    """BAPLIE 컨테이너 하나의 세그먼트 (LOC+147로 시작, 셀 위치가 없으면 ValueError)"""
+    cell = _value(record.get('Cell'))
+    if not cell.isdigit():
+        raise ValueError(f"BAPLIE에는 컨테이너마다 셀 위치(Cell 열, 베이/열/단 숫자)가 필요합니다 "
+                         f"(CtrNbr {_value(record.get('CtrNbr'))}: '{cell}'). "
+                         f"셀 위치가 없는 OBL은 COPRAR로 내보내세요.")
+    yield segment('LOC', '147', (cell.zfill(7), '', '5'))  # 베이/열/단 (BBBRRTT)
+    weight = _value(record.get('Wgt'))
+    if weight:
+        yield segment('MEA', 'WT', '', ('KGM', weight))
+    yield from dimension_segments(record)
+    temperature = _value(record.get('Rftemp'))
+    if temperature:
+        yield segment('TMP', '2', (temperature, 'CEL'))
+    pol = resolve_port(record.get('POL'))
+    pod = resolve_port(record.get('POD'))
+    fpod = resolve_port(record.get('FPOD'))
+    por = resolve_port(record.get('POR'))
+    if pol:
+        yield segment('LOC', '9', (pol, '139', '6'))
+    if pod:
+        yield segment('LOC', '11', (pod, '139', '6'))
+    if fpod and fpod != pod:
+        yield segment('LOC', '83', (fpod, '139', '6'))
+    if por and por != pol:
+        yield segment('LOC', '76', (por, '139', '6'))
+    yield segment('EQD', 'CN', record.get('CtrNbr'), resolve_type(record.get('SzTp')), '', '',
+                  full_empty_code(record))
+    yield segment('NAD', 'CA', (_value(record.get('Opr')) or DEFAULT_OPERATOR, '172', '20'))
+    yield from dangerous_goods_segments(record)
+
+
+def coprar_container_segments(record, resolve_type, resolve_port):
+    """COPRAR 컨테이너 하나의 세그먼트 (EQD로 시작)"""
+    yield segment('EQD', 'CN', record.get('CtrNbr'), (resolve_type(record.get('SzTp')), '6346', '5'), '', '2',
+                  full_empty_code(record))
+    pod = resolve_port(record.get('POD'))
+    fpod = resolve_port(record.get('FPOD'))
+    if pod:
+        yield segment('LOC', '11', (pod, '139', '6'))
+    if fpod:
+        yield segment('LOC', '7', (fpod, '139', '6'))
+    weight = _value(record.get('Wgt'))
+    if weight:
+        qualifier = 'VGM' if _value(record.get('VGM')) == 'Y' else 'G'
+        yield segment('MEA', 'AAE', qualifier, ('KGM', weight))
+    yield from dimension_segments(record)
+    temperature = _value(record.get('Rftemp'))
+    if temperature:
+        yield segment('TMP', '2', (temperature, 'CEL'))
+    yield from dangerous_goods_segments(record)
+    yield segment('NAD', 'CF', (_value(record.get('Opr')) or DEFAULT_OPERATOR, '160', '20'))
+
+
+def full_empty_code(record):
+    """ForE → 적재 상태 코드 (E: 4, 그 외: 5)"""
+    return '4' if _value(record.get('ForE')).upper() == 'E' else '5'
+
+
+def dimension_segments(record):
+    """OOG 초과 치수 DIM 세그먼트 (앞/뒤는 길이, 좌/우는 폭, 높이 자리에 기록)"""
+    for column, qualifier in OOG_DIMENSIONS.items():
+        value = _value(record.get(column))
+        if not value or value == '0':
+            continue
+        if qualifier in ('5', '6'):
+            yield segment('DIM', qualifier, ('CMT', value))
+        elif qualifier in ('7', '8'):
+            yield segment('DIM', qualifier, ('CMT', '', value))
+        else:
+            yield segment('DIM', qualifier, ('CMT', '', '', value))
+
+
+def dangerous_goods_segments(record):
+    """위험물 DGS 세그먼트 (Class가 있을 때만)"""
+    imo_class = _value(record.get('Class'))
+    if imo_class:
+        yield segment('DGS', 'IMD', imo_class, _value(record.get('UNNO')), '', _value(record.get('P.Group')))
+
+
+CONTAINER_SEGMENTS = {
+    'BAPLIE': baplie_container_segments,
+    'COPRAR': coprar_container_segments,
+}
+
+
+def iter_edi_segments(records, message='BAPLIE', header=None, tpsz_mapping=None, type_table=None,
+                      port_codes=PORT_CODES, stats=None):
+    """OBL 행 → EDI 세그먼트 문자열을 하나씩 생성 (UNB ~ UNZ)
+
+    CtrNbr가 없는 행은 건너뛴다. stats dict를 주면 'containers', 'segments'를 채운다.
+    """
+    message = message.upper()
+    if message not in EDI_MESSAGES:
+        raise ValueError(f"지원하지 않는 메시지입니다: {message}")
+    header = header or {}
+    if not _value(header.get('recipient')):
+        raise ValueError("UNB 수신자(recipient)가 필요합니다.")
+    reference = header.get('reference') or datetime.now().strftime("%y%m%d%H%M")
+    prepared = header.get('prepared') or datetime.now()
+    header = {**header, 'prepared': prepared}
+    resolve_type = TypeResolver(tpsz_mapping, type_table)
+    resolve_port = port_resolver(port_codes)
+    container_segments = CONTAINER_SEGMENTS[message]
+
+    yield segment('UNB', ('UNOA', '2'), header.get('sender') or DEFAULT_OPERATOR, header['recipient'],
+                  (prepared.strftime("%y%m%d"), prepared.strftime("%H%M")), reference)
+    # UNT의 세그먼트 수는 UNH부터 UNT까지
+    count = 0
+    for line in header_segments(message, {**header, 'port': resolve_port(header.get('port'))}, reference):
+        count += 1
+        yield line
+
+    containers = 0
+    for record in records:
+        if not _value(record.get('CtrNbr')):
+            continue
+        containers += 1
+        for line in container_segments(record, resolve_type, resolve_port):
+            count += 1
+            yield line
+
+    if message == 'COPRAR':
+        count += 1
+        yield segment('CNT', ('16', containers))
+    yield segment('UNT', count + 1, reference)
+    yield segment('UNZ', '1', reference)
+
+    if stats is not None:
+        stats['containers'] = containers
+        stats['segments'] = count + 3
+
+
+def write_edi_segments(segments, output_file, encoding='utf-8'):
+    """세그먼트를 차례로 파일에 쓰기 (쓴 세그먼트 수 반환)"""
+    written = 0
+    with open(output_file, 'w', encoding=encoding, newline='') as f:
+        for line in segments:
+            f.write(line)
+            f.write(SEGMENT_SEPARATOR)
+            written += 1
+    return written
+
+
+def edi_export_path(obl_file, message, out_dir=None):
+    """OBL 파일 기준 EDI 출력 경로 ("원본이름_BAPLIE.edi")"""
+    save_dir = out_dir or os.path.dirname(obl_file)
+    base_name = os.path.splitext(os.path.basename(obl_file))[0]
+    return os.path.join(save_dir, f"{base_name}_{message.upper()}.edi")
+
+
+def _count_progress(records, progress):
+    """PROGRESS_INTERVAL 행마다 진행 상황 보고"""
+    for i, record in enumerate(records, 1):
+        if i % PROGRESS_INTERVAL == 0:
+            progress("EDI 쓰기", i)
+        yield record
+
+
+def export_obl_edi(source, output_file=None, message='BAPLIE', header=None, tpsz_mapping=None,
+                   out_dir=None, progress=None):
+    """OBL 데이터(데이터프레임 또는 파일 경로)를 BAPLIE/COPRAR 파일로 저장 (요약 dict 반환)
+
+    header에는 vessel, voyage, call_sign, port, operator, sender, recipient(필수), reference를 줄 수 있다.
+    header['port']가 없으면 첫 행의 POL을 쓴다. 쓰는 도중 오류가 나면 만들던 파일은 지운다.
+    """
+    message = message.upper()
+    if isinstance(source, str):
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"파일이 존재하지 않습니다: {source}")
+        output_file = output_file or edi_export_path(source, message, out_dir)
+    elif output_file is None:
+        raise ValueError("출력 파일 경로가 필요합니다.")
+
+    records = iter_obl_records(source)
+    header = dict(header or {})
+    if not header.get('port'):
+        # 첫 행의 POL을 현재 항구로 사용 (읽은 행은 다시 앞에 붙인다)
+        first = next(records, None)
+        if first is not None:
+            header['port'] = first.get('POL')
+            records = itertools.chain([first], records)
+    if progress is not None:
+        records = _count_progress(records, progress)
+
+    stats = {}
+    with stage('edi_write') as record:
+        try:
+            write_edi_segments(iter_edi_segments(records, message, header, tpsz_mapping, stats=stats), output_file)
+        except BaseException:
+            # 셀 위치 누락 등으로 중간에 멈춘 파일은 남기지 않는다
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            raise
+        record['rows'] = stats['containers']
+
+    return {
+        'message': message,
+        'output_file': output_file,
+        'containers': stats['containers'],
+        'segments': stats['segments'],
+    }
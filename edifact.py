@@ -0,0 +1,275 @@
+"""UN/EDIFACT 세그먼트 토크나이저 (BAPLIE 등)
+
+파일 경로는 메모리 매핑한 뒤 바이트 단위로 세그먼트 종결자(')를 찾아 필요한
+세그먼트만 디코딩하고, 파일 객체는 일정 크기씩 읽으면서 나누므로 어느 쪽이든
+파일 크기와 관계없이 메모리 사용량이 일정하다. 해제 문자(?) 뒤의 구분자는
+데이터로 취급하고, 요소/구성요소 분리는 실제로 접근할 때만 수행한다.
+"""
+import mmap
+import os
+import re
+from collections import Counter
+
+# 기본 구분자 (UNA 세그먼트가 있으면 그 값을 사용)
+COMPONENT_SEPARATOR = ':'
+ELEMENT_SEPARATOR = '+'
+RELEASE_CHARACTER = '?'
+SEGMENT_TERMINATOR = "'"
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def split_unescaped(text, separator, release=RELEASE_CHARACTER):
+    """해제 문자로 이스케이프되지 않은 구분자 기준으로 분리 (str, bytes 모두 가능)"""
+    if release not in text:
+        return text.split(separator)
+
+    parts = []
+    start = search = 0
+    while True:
+        pos = text.find(separator, search)
+        if pos < 0:
+            parts.append(text[start:])
+            return parts
+
+        # 바로 앞의 해제 문자 개수가 홀수면 데이터로 쓰인 구분자
+        released = 0
+        k = pos - 1
+        while k >= start and text[k:k + 1] == release:
+            released += 1
+            k -= 1
+        if released % 2:
+            search = pos + 1
+            continue
+
+        parts.append(text[start:pos])
+        start = search = pos + 1
+
+
+def unescape(text, release=RELEASE_CHARACTER):
+    """해제 문자 제거 (?' → ', ?? → ?)"""
+    if release not in text:
+        return text
+    return re.sub(re.escape(release) + '(.)', r'\1', text, flags=re.DOTALL)
+
+
+def escape(text, separators=(COMPONENT_SEPARATOR, ELEMENT_SEPARATOR, SEGMENT_TERMINATOR),
+           release=RELEASE_CHARACTER):
+    """구분자와 해제 문자 앞에 해제 문자 추가 (unescape의 반대, 쓰기용)"""
+    if not any(character in text for character in (*separators, release)):
+        return text
+    text = text.replace(release, release + release)
+    for character in separators:
+        text = text.replace(character, release + character)
+    return text
+
+
+class Segment:
+    """세그먼트 하나 (segment[0]은 태그, segment[i]는 i번째 데이터 요소)"""
+
+    __slots__ = ('raw', 'tag', '_elements', '_component_separator', '_element_separator', '_release')
+
+    def __init__(self, raw, component_separator=COMPONENT_SEPARATOR,
+                 element_separator=ELEMENT_SEPARATOR, release=RELEASE_CHARACTER):
+        self.raw = raw
+        self.tag = raw.partition(element_separator)[0]
+        self._elements = None
+        self._component_separator = component_separator
+        self._element_separator = element_separator
+        self._release = release
+
+    def _split(self):
+        if self._elements is None:
+            self._elements = split_unescaped(self.raw, self._element_separator, self._release)
+        return self._elements
+
+    @property
+    def elements(self):
+        """해제 문자를 제거한 요소 목록 (0번은 태그)"""
+        return [unescape(element, self._release) for element in self._split()]
+
+    def __getitem__(self, index):
+        # 태그 비교만 하는 세그먼트는 요소를 나누지 않는다
+        if index == 0:
+            return self.tag
+        return unescape(self._split()[index], self._release)
+
+    def __len__(self):
+        return len(self._split())
+
+    def element(self, index, default=''):
+        """index번째 요소 (없으면 default)"""
+        elements = self._split()
+        return unescape(elements[index], self._release) if index < len(elements) else default
+
+    def components(self, index):
+        """index번째 요소의 구성요소 목록 (없으면 빈 목록)"""
+        elements = self._split()
+        if index >= len(elements):
+            return []
+        return [unescape(component, self._release)
+                for component in split_unescaped(elements[index], self._component_separator, self._release)]
+
+    def component(self, index, component_index, default=''):
+        """index번째 요소의 component_index번째 구성요소 (없으면 default)"""
+        components = self.components(index)
+        return components[component_index] if component_index < len(components) else default
+
+    def __repr__(self):
+        return f"Segment({self.raw!r})"
+
+
+def _read_delimiters(head):
+    """UNA 서비스 문자열에서 구분자 읽기 (UNA:+.? ')"""
+    if head.startswith('UNA') and len(head) >= 9:
+        return {
+            'component': head[3],
+            'element': head[4],
+            'release': head[6],
+            'terminator': head[8],
+        }, 9
+    return {
+        'component': COMPONENT_SEPARATOR,
+        'element': ELEMENT_SEPARATOR,
+        'release': RELEASE_CHARACTER,
+        'terminator': SEGMENT_TERMINATOR,
+    }, 0
+
+
+def iter_segments(source, encoding='utf-8', chunk_size=READ_CHUNK_SIZE, progress=None, tags=None, skipped=None):
+    """EDI 파일(경로 또는 텍스트 파일 객체)에서 세그먼트를 순서대로 생성
+
+    줄바꿈은 세그먼트 구분에 쓰이지 않으므로 한 줄에 모든 세그먼트가 있는 파일,
+    세그먼트마다 줄이 바뀐 파일, 80자 고정 폭으로 줄이 나뉜 파일 모두 처리된다.
+    종결자(')가 전혀 없는 파일은 줄바꿈을 세그먼트 구분으로 사용한다.
+
+    tags를 주면 그 태그의 세그먼트만 돌려주고, 나머지는 디코딩하지 않고
+    skipped(Counter)에 태그별 개수만 더한다.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        total = os.path.getsize(source)
+        if not total:
+            return
+        # 경로는 메모리 매핑 (ASCII 호환 인코딩 전제: 구분자 바이트가 다중 바이트 문자 안에 나오지 않음)
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _iter_mapped_segments(mapped, encoding, chunk_size, _with_total(progress, total),
+                                             tags, skipped)
+        return
+
+    # UNA 서비스 문자열(9자)은 항상 첫 읽기에 포함
+    head = source.read(max(chunk_size, 9))
+    delimiters, offset = _read_delimiters(head)
+    terminator = delimiters['terminator']
+    release = delimiters['release']
+
+    # 종결자 없이 줄 단위로만 구분된 파일
+    line_mode = terminator not in head and '\n' in head
+    if line_mode:
+        terminator = '\n'
+
+    def make_segment(raw):
+        return Segment(raw, delimiters['component'], delimiters['element'], release)
+
+    def wanted(segment):
+        if tags is None or segment.tag in tags:
+            return True
+        if skipped is not None:
+            skipped[segment.tag] += 1
+        return False
+
+    buffer = head[offset:]
+    read_chars = len(head)
+    while True:
+        if not line_mode:
+            buffer = buffer.replace('\r', '').replace('\n', '')
+        pieces = split_unescaped(buffer, terminator, release)
+        # 마지막 조각은 아직 종결자가 나오지 않은 세그먼트
+        buffer = pieces.pop()
+        for piece in pieces:
+            piece = piece.strip()
+            if piece:
+                segment = make_segment(piece)
+                if wanted(segment):
+                    yield segment
+
+        if progress is not None:
+            progress(read_chars)
+
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        read_chars += len(chunk)
+        buffer += chunk
+
+    buffer = buffer.strip()
+    if buffer:
+        segment = make_segment(buffer)
+        if wanted(segment):
+            yield segment
+
+
+def _iter_mapped_segments(data, encoding, chunk_size, progress, tags, skipped):
+    """메모리 매핑된 EDI 파일을 바이트 단위로 나누어 세그먼트 생성
+
+    매핑을 chunk_size 바이트 구간씩 종결자로 나누고, 태그를 바이트 상태로 확인해
+    tags에 없는 세그먼트는 디코딩하지 않는다 (전체 파일을 한 번에 복사하지 않음).
+    """
+    delimiters, offset = _read_delimiters(data[:9].decode(encoding, errors='replace'))
+    terminator = delimiters['terminator'].encode(encoding)
+    release = delimiters['release'].encode(encoding)
+    element_separator = delimiters['element'].encode(encoding)
+
+    # 종결자 없이 줄 단위로만 구분된 파일 (스트림 읽기와 같은 기준: 첫 구간 안에서 판단)
+    head_size = max(chunk_size, 9)
+    line_mode = data.find(terminator, 0, head_size) < 0 and data.find(b'\n', 0, head_size) >= 0
+    if line_mode:
+        terminator = b'\n'
+
+    # 태그 확인은 "태그+" 접두어 비교 한 번으로 (요소가 없는 세그먼트는 태그 자체와 비교)
+    wanted = None if tags is None else {tag.encode(encoding) for tag in tags}
+    prefixes = None if tags is None else tuple(tag + element_separator for tag in wanted)
+    skipped_tags = Counter()
+    separators = (delimiters['component'], delimiters['element'], delimiters['release'])
+
+    def split_pieces(buffer):
+        if release in buffer:
+            return split_unescaped(buffer, terminator, release)
+        return buffer.split(terminator)
+
+    try:
+        size = len(data)
+        pos = offset
+        buffer = b''
+        while True:
+            end = min(pos + chunk_size, size)
+            buffer += data[pos:end]
+            pos = end
+            if not line_mode:
+                buffer = buffer.replace(b'\r', b'').replace(b'\n', b'')
+            pieces = split_pieces(buffer)
+            # 마지막 조각은 아직 종결자가 나오지 않은 세그먼트 (파일 끝이면 그대로 처리)
+            buffer = pieces.pop() if pos < size else b''
+            for piece in pieces:
+                piece = piece.strip()
+                if not piece:
+                    continue
+                if wanted is not None and not piece.startswith(prefixes) and piece not in wanted:
+                    skipped_tags[piece.partition(element_separator)[0]] += 1
+                    continue
+                yield Segment(piece.decode(encoding), *separators)
+
+            if progress is not None:
+                progress(pos)
+            if pos >= size:
+                break
+    finally:
+        if skipped is not None:
+            for tag, count in skipped_tags.items():
+                skipped[tag.decode(encoding, errors='replace')] += count
+
+
+def _with_total(progress, total):
+    """읽은 문자 수 콜백을 (단계, 진행, 전체) 형식의 progress로 변환"""
+    if progress is None:
+        return None
+    return lambda done: progress("EDI 파싱", min(done, total), total)
@@ -0,0 +1,23 @@
+"""명령줄 인자/드롭한 경로를 입력 파일 목록으로 확장"""
+import glob
+import os
+
+
+def expand_inputs(patterns, extensions):
+    """파일/디렉토리/glob 패턴 목록을 실제 파일 경로 목록으로 확장
+
+    디렉토리는 바로 아래의 extensions 파일만 (엑셀 임시 파일 ~$ 제외), 일치하는 파일이
+    없는 패턴은 그대로 두어 변환 작업이 오류를 보고하게 한다.
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for name in sorted(os.listdir(pattern)):
+                path = os.path.join(pattern, name)
+                if os.path.isfile(path) and name.lower().endswith(extensions) and not name.startswith('~$'):
+                    files.append(path)
+        else:
+            matched = sorted(glob.glob(pattern))
+            files.extend(matched if matched else [pattern])
+    # 중복 제거 (입력 순서 유지)
+    return list(dict.fromkeys(files))
@@ -0,0 +1,170 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+from obl_config import CONFIG_DIR
+
+# 타이밍 로그 (JSON lines, 크기 기준 순환)
+TIMING_LOG_ENV = "OBL_TIMING_LOG"
+TIMING_LOG_PATH = os.path.join(CONFIG_DIR, "logs", "obl_timing.log")
+TIMING_LOG_MAX_BYTES = 1024 * 1024
+TIMING_LOG_BACKUPS = 5
+
+# 단계 이름 → 화면 표시용 이름
+STAGE_LABELS = {
+    'workbook_read': "엑셀 읽기",
+    'terminal_detect': "터미널 확인",
+    'mapping': "매핑",
+    'frame_build': "프레임 생성",
+    'itps_rows': "ITPS 행 변환",
+    'edi_parse': "EDI 파싱",
+    'duplicate_check': "중복 확인",
+    'excel_write': "엑셀 저장",
+    'edi_write': "EDI 저장",
+    'summary_render': "Summary 표시",
+    'cache_lookup': "캐시 확인",
+    'cache_store': "캐시 저장",
+}
+
+_local = threading.local()
+_logger = logging.getLogger("obl_convertor.timing")
+_logger.propagate = False
+
+
+class JobTimer:
+    """작업 하나의 단계별 소요 시간과 처리 행 수 기록"""
+
+    def __init__(self, job, **info):
+        self.job = job
+        self.info = info
+        self.stages = []
+        self.started = time.perf_counter()
+        self.elapsed = None
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        """단계 시간 측정 (yield된 dict의 'rows'를 채우면 행 수도 기록)"""
+        record = {'stage': name, 'rows': rows}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = round(time.perf_counter() - start, 6)
+            self.stages.append(record)
+
+    def add_stage(self, name, seconds, rows=None):
+        """따로 측정한 단계 시간 추가 (반복 처리의 누적 시간 등)"""
+        self.stages.append({'stage': name, 'rows': rows, 'seconds': round(seconds, 6)})
+
+    def stop(self):
+        """전체 소요 시간 확정 (이후 기록되는 단계는 시간만 추가)"""
+        if self.elapsed is None:
+            self.elapsed = round(time.perf_counter() - self.started, 6)
+
+    def summary(self):
+        """단계별 합계 (같은 단계가 여러 번 실행되면 시간과 행 수를 합산)"""
+        totals = {}
+        for record in self.stages:
+            total = totals.setdefault(record['stage'], {'stage': record['stage'], 'seconds': 0.0, 'rows': None})
+            total['seconds'] += record['seconds']
+            if record['rows'] is not None:
+                total['rows'] = (total['rows'] or 0) + record['rows']
+        return {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'job': self.job,
+            **self.info,
+            'elapsed': self.elapsed,
+            'stages': list(totals.values()),
+        }
+
+    def format_breakdown(self):
+        """단계별 소요 시간 표시 문자열"""
+        summary = self.summary()
+        lines = [f"작업: {self.job}"]
+        if summary['elapsed'] is not None:
+            lines.append(f"전체: {summary['elapsed']:.3f}s")
+        lines.append("")
+        for record in summary['stages']:
+            label = STAGE_LABELS.get(record['stage'], record['stage'])
+            rows = f"  ({record['rows']}행)" if record['rows'] is not None else ""
+            lines.append(f"{label:<16} {record['seconds']:8.3f}s{rows}")
+        return "\n".join(lines)
+
+
+def current_timer():
+    """현재 스레드에서 활성화된 JobTimer (없으면 None)"""
+    return getattr(_local, 'timer', None)
+
+
+@contextmanager
+def activate(timer):
+    """현재 스레드의 stage() 기록 대상을 timer로 설정"""
+    previous = current_timer()
+    _local.timer = timer
+    try:
+        yield timer
+    finally:
+        _local.timer = previous
+
+
+@contextmanager
+def stage(name, rows=None):
+    """활성화된 JobTimer에 단계 기록 (타이머가 없으면 아무 일도 하지 않음)"""
+    timer = current_timer()
+    if timer is None:
+        yield {'stage': name, 'rows': rows}
+        return
+    with timer.stage(name, rows) as record:
+        yield record
+
+
+def add_stage(name, seconds, rows=None):
+    """활성화된 JobTimer에 측정한 단계 시간 추가 (타이머가 없으면 무시)"""
+    timer = current_timer()
+    if timer is not None:
+        timer.add_stage(name, seconds, rows)
+
+
+def timing_log_enabled():
+    return bool(_logger.handlers)
+
+
+def enable_timing_log(path=None):
+    """타이밍 JSON 로그 기록 시작"""
+    disable_timing_log()
+    path = path or TIMING_LOG_PATH
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=TIMING_LOG_MAX_BYTES,
+                                  backupCount=TIMING_LOG_BACKUPS, encoding='utf-8')
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _logger.addHandler(handler)
+    _logger.setLevel(logging.INFO)
+    return path
+
+
+def disable_timing_log():
+    """타이밍 JSON 로그 기록 중지"""
+    for handler in list(_logger.handlers):
+        _logger.removeHandler(handler)
+        handler.close()
+
+
+def enable_timing_log_from_env():
+    """OBL_TIMING_LOG 환경 변수가 있으면 로그 활성화 ("1"이면 기본 경로, 그 외는 파일 경로)"""
+    value = os.environ.get(TIMING_LOG_ENV, '').strip()
+    if not value or value == '0':
+        return None
+    return enable_timing_log(None if value == '1' else value)
+
+
+def log_timings(timer_or_summary):
+    """작업 타이밍을 JSON 한 줄로 기록 (로그가 꺼져 있으면 무시)"""
+    if not timing_log_enabled():
+        return
+    summary = timer_or_summary.summary() if isinstance(timer_or_summary, JobTimer) else timer_or_summary
+    _logger.info(json.dumps(summary, ensure_ascii=False))
@@ -0,0 +1,181 @@
+"""ISO 6346 사이즈/타입 코드 → MSC 타입 변환표 (EDI EQD 처리용)
+
+기본 변환표는 모듈 로드 시 한 번만 만들고, 바탕화면/설정 디렉토리에
+ISOType_mapping.json이 있으면 그 내용으로 덮어쓴다.
+
+    {"mapping": {"22G1": "20DV", ...}, "fallback": {"2": "20DV", "4": "40HC"}}
+"""
+import hashlib
+import json
+import re
+from collections import Counter
+from functools import lru_cache
+
+from obl_config import ISO_TYPE_CONFIG_NAME, load_json_config, locate_config_file
+
+# ISO 사이즈/타입 코드 → MSC 타입
+ISO_TYPE_MAPPING = {
+    # 20FT Containers
+    "2200": "20DV", "2210": "20DV", "22G0": "20DV", "22G1": "20DV",  # Standard 20ft
+    "22T0": "20TK", "22T1": "20TK",  # Tank 20ft
+    "2232": "20RE", "22R0": "20RE", "22R1": "20RE",  # Reefer 20ft
+    "22P1": "20FL", "22P0": "20FL",  # Flat Rack 20ft
+    "22U1": "20OT", "22U0": "20OT",  # Open Top 20ft
+    "22H0": "20HQ", "22H1": "20HQ",  # High Cube 20ft
+    "22B0": "20BK", "22B1": "20BK",  # Bulk 20ft
+    "2250": "20RF",  # Reefer 20ft
+    "22GP": "20GP", # General Purpose 20ft
+    "22PC": "20FR", # Platform Container 20ft
+    "22UT": "20OT", # Open Top 20ft
+
+    # 40FT Containers
+    "42G0": "40DV", "4310": "40DV", "42G1": "40DV",  # Standard 40ft
+    "45G0": "40HC", "4510": "40HC", "45G1": "40HC",  # High Cube 40ft
+    "45R0": "40HR", "4532": "40HR", "45R1": "40HR",  # High Cube Reefer 40ft
+    "42P1": "40FL", "4363": "40FL", "42P0": "40FL",  # Flat Rack 40ft
+    "42U1": "40OT", "42U0": "40OT",  # Open Top 40ft
+    "4232": "40RE", "42R0": "40RE",  # Reefer 40ft
+    "42T0": "40TK", "42T1": "40TK",  # Tank 40ft
+    "4563": "40HF",  # High Cube Flat Rack 40ft
+    "42B0": "40BK",  # Bulk 40ft
+    "40GP": "40GP", # General Purpose 40ft
+    "40PC": "40FR", # Platform Container 40ft
+    "40UT": "40OT", # Open Top 40ft
+    "43GP": "40HC", # 40ft High Cube
+
+    # 45FT Containers
+    "9400": "45HC", "L5G0": "45HC",  # High Cube 45ft
+    "L5G1": "45HC", "95G0": "45HC",  # High Cube 45ft variants
+    "45GP": "45HC", # 45ft High Cube General Purpose
+    "45PC": "45FR", # Platform Container 45ft
+    "45UT": "45OT", # Open Top 45ft
+
+    # Special Equipment
+    "GENE": "GE",  # Generator
+    "VENT": "VT",  # Ventilated
+    "CONT": "CT",  # Controlled Temperature
+    "CRYO": "CY",  # Cryogenic
+    "HCFR": "HRF", # High Cube Flat Rack
+    "PCHP": "HP", # Platform
+    "REOT": "RO", # Reefer Open Top
+    "TKOT": "TO", # Tank Open Top
+    "PCOT": "PO", # Platform Open Top
+    "FLOT": "FO", # Flat Rack Open Top
+    "SKEL": "SK", # Skeletal
+    "FRMG": "FG", # Frame
+    "BULD": "BD", # Bulked
+    "LIVS": "LS", # Live Stock
+    "VEHI": "VH", # Vehicle Carrier
+    "PIPE": "PP", # Pipe Carrier
+    "LOGS": "LG", # Log Carrier
+    "DANG": "DG", # Dangerous Goods
+    "EXPL": "EX", # Explosives
+    "RADIO": "RD", # Radioactive
+    "OXID": "OX", # Oxidizing Substances
+    "CORR": "CR", # Corrosives
+    "MISC": "MC", # Miscellaneous Dangerous Goods
+    "20HC": "20HC", # 20ft High Cube
+    "40PW": "40PW", # 40ft Pallet Wide
+    "45PW": "45PW", # 45ft Pallet Wide
+    "20RF": "20RF", # 20ft Reefer
+    "40RF": "40RF", # 40ft Reefer
+    "45RF": "45RF", # 45ft Reefer
+    "20TN": "20TN", # 20ft Tank
+    "40TN": "40TN", # 40ft Tank
+    "20PL": "20PL", # 20ft Platform
+    "40PL": "40PL", # 40ft Platform
+    "45PL": "45PL", # 45ft Platform
+    "20OS": "20OS", # 20ft Open Side
+    "40OS": "40OS", # 40ft Open Side
+    "20VN": "20VN", # 20ft Ventilated
+    "40VN": "40VN", # 40ft Ventilated
+    "20SS": "20SS", # 20ft Side Stanchion
+    "40SS": "40SS", # 40ft Side Stanchion
+    "20HT": "20HT", # 20ft Hard Top
+    "40HT": "40HT", # 40ft Hard Top
+    "20OT": "20OT", # 20ft Open Top
+    "40OT": "40OT", # 40ft Open Top
+    "40HF": "40HF", # 40ft Open Top
+    "40HO": "40HO", # 40ft Open Top
+    "45OT": "45OT", # 45ft Open Top
+}
+
+# 변환표에 없는 코드는 첫 글자(길이 코드)로 추정
+ISO_TYPE_FALLBACK = {
+    '2': "20DV",
+    '4': "40HC",
+}
+
+
+# ISO 6346 사이즈/타입 그룹 코드 형식 (22G1, 45R1, L5G1 ...)
+ISO_GROUP_CODE = re.compile(r'^[0-9A-Z][0-9A-Z][A-Z][0-9]$')
+
+
+class IsoTypeTable:
+    """ISO 타입 코드 변환표 (변환표에 없는 코드는 unknown에 집계)"""
+
+    def __init__(self, mapping=ISO_TYPE_MAPPING, fallback=ISO_TYPE_FALLBACK):
+        self.mapping = dict(mapping)
+        self.fallback = dict(fallback)
+        self._reverse_mapping = None
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def fingerprint(self):
+        """변환표 내용 해시 (파싱 캐시 키에 사용)"""
+        content = json.dumps([self.mapping, self.fallback], sort_keys=True)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+    def iso_code(self, msc_type):
+        """MSC 타입 → ISO 코드 (변환표 역방향, 없으면 None)
+
+        같은 타입의 코드가 여럿이면 ISO 6346 그룹 코드 형식(22G1 등) 중 가장 큰 코드를 쓴다.
+        """
+        return self._reverse().get(msc_type)
+
+    def _reverse(self):
+        reverse = self._reverse_mapping
+        if reverse is None:
+            candidates = {}
+            for code, msc_type in self.mapping.items():
+                candidates.setdefault(msc_type, []).append(code)
+            reverse = self._reverse_mapping = {
+                msc_type: max((code for code in codes if ISO_GROUP_CODE.match(code)), default=codes[0])
+                for msc_type, codes in candidates.items()
+            }
+        return reverse
+
+    def resolve(self, code, unknown=None):
+        """ISO 코드 하나를 MSC 타입으로 변환 (unknown Counter가 있으면 미등록 코드 집계)"""
+        new_type = self.mapping.get(code)
+        if new_type is not None:
+            return new_type
+        if not code:
+            return ""
+        if unknown is not None:
+            unknown[code] += 1
+        return self.fallback.get(code[0], "")
+
+
+def load_iso_type_table(path=None):
+    """기본 변환표에 JSON 설정 파일의 매핑을 덮어써서 변환표 생성"""
+    config = load_json_config(path)
+    mapping = {**ISO_TYPE_MAPPING, **config.get('mapping', {})}
+    fallback = {**ISO_TYPE_FALLBACK, **config.get('fallback', {})}
+    return IsoTypeTable(mapping, fallback)
+
+
+@lru_cache(maxsize=1)
+def default_type_table():
+    """설정 파일을 반영한 변환표 (프로세스당 한 번만 로드)"""
+    return load_iso_type_table(locate_config_file(ISO_TYPE_CONFIG_NAME))
+
+
+def format_unknown_types(unknown_types, limit=10):
+    """미등록 타입 코드 집계를 표시용 문자열로 변환 ("XXXX×3, 99Z1×1")"""
+    counts = Counter(unknown_types).most_common()
+    text = ", ".join(f"{code}×{count}" for code, count in counts[:limit])
+    if len(counts) > limit:
+        text += f" 외 {len(counts) - limit}종"
+    return text
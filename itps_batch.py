@@ -0,0 +1,145 @@
+"""ITPS 한 장을 여러 OBL에 한 번에 추가
+
+ITPS는 한 번만 읽고 변환한 뒤 행을 OBL별로 나누고, OBL마다 읽기 → 행 추가 → 저장을
+프로세스 풀에서 동시에 실행한다. 선적 항구/터미널 컬럼이 있는 ITPS는 POL/TOL이 같은
+OBL로 자동 분배하고, 일반 ITPS 양식(선적 항구 컬럼 없음)은 사용자가 컬럼 값별로
+대상 OBL을 지정한다 (기본 Origin Load Port).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+from instrumentation import stage
+from itps_merge import (ITPS_ASSIGN_COLUMN, append_itps_frame, assign_itps_rows, build_itps_frame,
+                        partition_itps_rows)
+from obl_duplicates import DEFAULT_DUPLICATE_POLICY, DuplicateCheck
+from obl_pipelines import report_progress, write_obl
+from obl_schema import normalize_obl_columns
+from port_resolver import PORT_CODES, convert_to_port_code
+
+
+def itps_output_path(obl_file, out_dir=None, fmt='xlsx', timestamp=None):
+    """OBL 파일 기준 ITPS 추가 결과 경로 ("원본이름_with_ITPS_시각.xlsx")"""
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_dir = out_dir or os.path.dirname(obl_file)
+    base_name = os.path.splitext(os.path.basename(obl_file))[0]
+    return os.path.join(save_dir, f"{base_name}_with_ITPS_{timestamp}.{fmt}")
+
+
+def read_itps(itps_file):
+    """ITPS 읽기 (Equipment Number가 없는 행 제외)"""
+    itps_df = pd.read_excel(itps_file)
+    return itps_df[itps_df['Equipment Number'].notna()].reset_index(drop=True)
+
+
+def read_obl_target(obl_file, port_codes=PORT_CODES):
+    """OBL 첫 행의 (POL 코드, TOL) (행이 없으면 빈 값)"""
+    head = normalize_obl_columns(pd.read_excel(obl_file, nrows=1))
+    if head.empty:
+        return '', ''
+    pol = head['POL'].iloc[0] if 'POL' in head.columns else ''
+    tol = head['TOL'].iloc[0] if 'TOL' in head.columns else ''
+    return convert_to_port_code(pol, port_codes), '' if pd.isna(tol) else str(tol).strip()
+
+
+def _append_itps_job(obl_file, new_df, output_file, duplicates):
+    """프로세스 풀용 OBL 하나 처리 (예외는 메시지로 돌려줌)"""
+    try:
+        obl_df = normalize_obl_columns(pd.read_excel(obl_file))
+        combined_df = append_itps_frame(obl_df, new_df)
+        check = DuplicateCheck(duplicates)
+        combined_df = check.apply(combined_df)
+        write_obl(combined_df, output_file, None, None)
+        if not os.path.exists(output_file):
+            raise IOError("파일이 생성되지 않았습니다.")
+        return {
+            'obl_file': obl_file,
+            'output_file': output_file,
+            'added': len(new_df),
+            'rows': len(combined_df),
+            'duplicates': check.summary()
+        }, None
+    except Exception as e:
+        return None, str(e)
+
+
+def merge_itps_batch(itps_file, obl_files, tpsz_mapping, out_dir=None, port_codes=PORT_CODES, fmt='xlsx',
+                     max_workers=None, progress=None, duplicates=DEFAULT_DUPLICATE_POLICY,
+                     assignments=None, assign_by=ITPS_ASSIGN_COLUMN, itps_df=None):
+    """ITPS 파일 하나를 여러 OBL에 나눠 추가하여 OBL마다 저장
+
+    assignments({assign_by 컬럼 값: OBL 파일})를 주면 그대로 나누고, 없으면 ITPS의
+    선적 항구(Load Port) / 터미널(Load Terminal) 컬럼으로 POL/TOL이 맞는 OBL에 나눈다.
+    OBL이 하나뿐이면 컬럼이 없어도 모든 행을 그 OBL에 추가한다. itps_df를 주면
+    (read_itps 결과) 파일을 다시 읽지 않는다. 한 OBL의 실패는
+    나머지 저장을 멈추지 않는다. 반환값의 'results'는 입력 순서대로의 OBL별 결과,
+    'errors'는 (OBL 파일, 오류 메시지) 목록, 'unmatched'는 대상 OBL을 찾지 못한
+    "POL TOL"별 행 수, 'skipped'는 추가할 행이 없던 OBL 파일 목록이다.
+    """
+    obl_files = list(obl_files)
+    report_progress(progress, "OBL POL/TOL 확인", 0, len(obl_files))
+    targets = [read_obl_target(obl_file, port_codes) for obl_file in obl_files]
+
+    if itps_df is None:
+        report_progress(progress, "ITPS 읽기")
+        itps_df = read_itps(itps_file)
+    if itps_df.empty:
+        raise ValueError("처리할 ITPS 데이터가 없습니다.")
+
+    # 항구 코드 변환 캐시를 같이 쓰도록 분배와 행 변환은 이 프로세스에서 한 번에 한다
+    report_progress(progress, "ITPS 변환", 0, len(itps_df))
+    with stage('itps_rows', len(itps_df)):
+        if assignments is not None:
+            unknown = [obl_file for obl_file in assignments.values()
+                       if obl_file is not None and obl_file not in obl_files]
+            if unknown:
+                raise ValueError(f"대상 OBL 목록에 없는 파일입니다: {', '.join(unknown)}")
+            assignments = {value: obl_files.index(obl_file) for value, obl_file in assignments.items()
+                           if obl_file is not None}
+            positions, unmatched = assign_itps_rows(itps_df, assignments, assign_by)
+        else:
+            positions, unmatched = partition_itps_rows(itps_df, targets, port_codes)
+        frames = {target: build_itps_frame(itps_df.iloc[rows], *targets[target], tpsz_mapping, port_codes)
+                  for target, rows in positions.items()}
+    if not frames:
+        raise ValueError("ITPS 행을 추가할 OBL이 없습니다 (POL/TOL 또는 지정한 값과 일치하는 행 없음).")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    jobs = {target: (obl_files[target], new_df, itps_output_path(obl_files[target], out_dir, fmt, timestamp),
+                     duplicates)
+            for target, new_df in frames.items()}
+
+    outcomes = {}
+    report_progress(progress, "OBL 저장", 0, len(jobs))
+    if len(jobs) <= 1 or max_workers == 1:
+        for target, args in jobs.items():
+            outcomes[target] = _append_itps_job(*args)
+            report_progress(progress, "OBL 저장", len(outcomes), len(jobs))
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(jobs)))
+        try:
+            futures = {executor.submit(_append_itps_job, *args): target for target, args in jobs.items()}
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+                report_progress(progress, "OBL 저장", len(outcomes), len(jobs))
+        finally:
+            # 오류나 취소 시 아직 시작하지 않은 저장은 버린다
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    results = []
+    errors = []
+    for target in sorted(outcomes):
+        result, error = outcomes[target]
+        if error is None:
+            results.append({**result, 'pol': targets[target][0], 'tol': targets[target][1]})
+        else:
+            errors.append((obl_files[target], error))
+    return {
+        'input_file': itps_file,
+        'results': results,
+        'errors': errors,
+        'unmatched': unmatched,
+        'skipped': [obl_file for i, obl_file in enumerate(obl_files) if i not in jobs]
+    }
@@ -0,0 +1,140 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+from obl_schema import ITPS_PLAN
+from port_resolver import PORT_CODES, convert_to_port_code, port_resolver
+
+# OBL별로 나눌 때 사용하는 ITPS 컬럼 (앞의 이름부터 찾음, 일반 ITPS 양식에는 없음)
+ITPS_LOAD_PORT_COLUMNS = ('Load Port', 'POL')
+ITPS_TERMINAL_COLUMNS = ('Load Terminal', 'TOL')
+
+# 선적 항구 컬럼이 없는 ITPS를 여러 OBL에 나눌 때 값별로 대상 OBL을 지정하는 기본 컬럼
+ITPS_ASSIGN_COLUMN = 'Origin Load Port'
+
+
+def build_itps_frame(itps_df, pol, tol, tpsz_mapping, port_codes=PORT_CODES, start_no=1):
+    """ITPS 데이터프레임을 컬럼 단위 연산으로 OBL 데이터프레임으로 변환 (Equipment Number가 없는 행 제외)"""
+    itps_df = itps_df[itps_df['Equipment Number'].notna()]
+    context = {
+        'pol': convert_to_port_code(pol, port_codes),
+        'tol': tol,
+        'start_no': start_no,
+        'tpsz_mapping': tpsz_mapping,
+        'port_codes': port_codes,
+    }
+    return ITPS_PLAN.build(itps_df, context)
+
+
+def append_itps_rows(obl_df, itps_df, tpsz_mapping, port_codes=PORT_CODES, progress=None):
+    """ITPS 데이터를 OBL 형식으로 변환하여 기존 OBL 뒤에 추가"""
+    # OBL의 POL과 TOL 값 가져오기
+    obl_pol = obl_df['POL'].iloc[0] if not obl_df.empty else ''
+    obl_tol = obl_df['TOL'].iloc[0] if not obl_df.empty else ''
+
+    if progress is not None:
+        progress("ITPS 변환", 0, len(itps_df))
+    with stage('itps_rows', len(itps_df)):
+        # No는 기존 OBL의 마지막 번호 다음부터
+        new_df = build_itps_frame(itps_df, obl_pol, obl_tol, tpsz_mapping, port_codes, start_no=len(obl_df) + 1)
+
+    if new_df.empty:
+        raise ValueError("처리할 ITPS 데이터가 없습니다.")
+
+    # 기존 OBL 데이터와 새로운 데이터 결합
+    with stage('frame_build', len(new_df)):
+        return pd.concat([obl_df, new_df], ignore_index=True)
+
+
+def append_itps_frame(obl_df, new_df):
+    """이미 변환한 ITPS 행을 기존 OBL 뒤에 추가 (No는 기존 OBL의 마지막 번호 다음부터)"""
+    new_df = new_df.copy()
+    new_df['No'] = range(len(obl_df) + 1, len(obl_df) + len(new_df) + 1)
+    with stage('frame_build', len(new_df)):
+        return pd.concat([obl_df, new_df], ignore_index=True)
+
+
+def _find_column(itps_df, names):
+    return next((name for name in names if name in itps_df.columns), None)
+
+
+def _column_keys(series):
+    """비교용 값 (빈 값은 '', 공백/대소문자 무시)"""
+    return series.astype(object).where(series.notna(), '').map(str).str.strip().str.upper()
+
+
+def has_load_port_column(itps_df):
+    """행을 POL/TOL로 자동 분배할 수 있는 ITPS인지 (선적 항구 컬럼 유무)"""
+    return _find_column(itps_df, ITPS_LOAD_PORT_COLUMNS) is not None
+
+
+def itps_assignment_values(itps_df, column=ITPS_ASSIGN_COLUMN):
+    """대상 OBL 지정용 컬럼의 값별 행 수 (등장 순서)"""
+    if column not in itps_df.columns:
+        raise ValueError(f"ITPS에 {column} 컬럼이 없습니다.")
+    return dict(Counter(_column_keys(itps_df[column]).tolist()))
+
+
+def assign_itps_rows(itps_df, assignments, column=ITPS_ASSIGN_COLUMN):
+    """ITPS 행을 사용자가 지정한 대상별로 분배
+
+    assignments는 column 값 → 대상 위치이며, 지정하지 않은 값(None 포함)의 행은 추가하지 않는다.
+    반환값은 partition_itps_rows와 같다.
+    """
+    if column not in itps_df.columns:
+        raise ValueError(f"ITPS에 {column} 컬럼이 없습니다.")
+    assignments = {str(value).strip().upper(): target for value, target in assignments.items()}
+    positions = {}
+    unmatched = Counter()
+    for row, key in enumerate(_column_keys(itps_df[column]).tolist()):
+        target = assignments.get(key)
+        if target is None:
+            unmatched[key or "(없음)"] += 1
+        else:
+            positions.setdefault(target, []).append(row)
+    return {target: np.array(rows) for target, rows in positions.items()}, dict(unmatched)
+
+
+def partition_itps_rows(itps_df, targets, port_codes=PORT_CODES):
+    """ITPS 행을 선적 항구/터미널이 일치하는 대상별로 분배
+
+    targets는 대상별 (POL 코드, TOL) 목록이다. 행에 터미널이 있으면 (POL, TOL)이
+    같은 대상에 넣고, 터미널이 없거나 일치하는 대상이 없으면 POL이 같은 대상이
+    하나뿐일 때 그 대상에 넣는다.
+    ({대상 위치: 행 위치 배열}, {"POL TOL": 대상을 찾지 못한 행 수})를 반환한다.
+    """
+    port_column = _find_column(itps_df, ITPS_LOAD_PORT_COLUMNS)
+    if port_column is None:
+        if len(targets) != 1:
+            raise ValueError(f"ITPS에 선적 항구 컬럼({', '.join(ITPS_LOAD_PORT_COLUMNS)})이 없어 "
+                             f"OBL별로 나눌 수 없습니다. 값별로 대상 OBL을 지정하세요.")
+        return {0: np.arange(len(itps_df))}, {}
+
+    pols = port_resolver(port_codes).resolve_series(itps_df[port_column]).tolist()
+    terminal_column = _find_column(itps_df, ITPS_TERMINAL_COLUMNS)
+    if terminal_column is None:
+        tols = [''] * len(pols)
+    else:
+        tols = _column_keys(itps_df[terminal_column]).tolist()
+
+    # 같은 키의 대상이 여럿이면 어느 쪽인지 알 수 없으므로 None
+    by_terminal = {}
+    by_port = {}
+    for i, (pol, tol) in enumerate(targets):
+        key = (pol, str(tol).strip().upper())
+        by_terminal[key] = None if key in by_terminal else i
+        by_port[pol] = None if pol in by_port else i
+
+    positions = {}
+    unmatched = Counter()
+    for row, (pol, tol) in enumerate(zip(pols, tols)):
+        target = by_terminal.get((pol, tol)) if tol else None
+        if target is None:
+            target = by_port.get(pol)
+        if target is None:
+            unmatched[f"{pol} {tol}".strip() or "(없음)"] += 1
+        else:
+            positions.setdefault(target, []).append(row)
+    return {target: np.array(rows) for target, rows in positions.items()}, dict(unmatched)
@@ -0,0 +1,129 @@
+import queue
+import threading
+import traceback
+
+from instrumentation import JobTimer, activate, log_timings
+
+
+class JobCancelled(Exception):
+    """사용자가 작업을 취소했을 때 발생"""
+
+
+class Job:
+    """백그라운드 작업 하나 (진행 상황 보고 + 취소 요청)"""
+
+    def __init__(self, name, events):
+        self.name = name
+        self.cancel_event = threading.Event()
+        self.timer = JobTimer(name)
+        self._events = events
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def progress(self, stage, done=None, total=None):
+        """진행 상황 보고 (작업 스레드에서 호출, 취소 요청 시 JobCancelled 발생)"""
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"{self.name} 작업이 취소되었습니다.")
+        self._events.put(('progress', self, (stage, done, total)))
+
+
+class JobRunner:
+    """변환 작업을 작업 스레드에서 실행하고 결과를 root.after로 Tk 메인 스레드에 전달
+
+    작업 함수는 progress=job.progress 키워드 인자를 받아 단계마다 호출한다.
+    on_done / on_error 콜백과 진행 표시는 모두 메인 스레드에서 실행되므로
+    messagebox 등 Tk 호출을 그대로 사용할 수 있다.
+    작업 스레드와 on_done 콜백에서 기록된 단계 시간은 job.timer에 모이고,
+    작업이 끝나면 타이밍 로그에 기록된 뒤 on_timings로 전달된다.
+    """
+
+    def __init__(self, root, on_progress=None, on_finish=None, on_timings=None, poll_ms=100):
+        self.root = root
+        self.on_progress = on_progress
+        self.on_finish = on_finish
+        self.on_timings = on_timings
+        self.poll_ms = poll_ms
+        self.current = None
+        self._events = queue.Queue()
+        self._polling = False
+
+    @property
+    def busy(self):
+        return self.current is not None
+
+    def submit(self, name, func, *args, on_done=None, on_error=None, **kwargs):
+        """작업 시작 (이미 실행 중인 작업이 있으면 None 반환)"""
+        if self.busy:
+            return None
+
+        job = Job(name, self._events)
+        self.current = job
+        kwargs['progress'] = job.progress
+
+        def worker():
+            try:
+                with activate(job.timer):
+                    result = func(*args, **kwargs)
+            except JobCancelled as e:
+                outcome = ('cancelled', job, e)
+            except Exception as e:
+                traceback.print_exc()
+                outcome = ('error', job, e)
+            else:
+                outcome = ('done', job, result)
+            job.timer.stop()
+            self._events.put(outcome)
+
+        job.callbacks = (on_done, on_error)
+        job.progress("시작")
+        threading.Thread(target=worker, name=f"job-{name}", daemon=True).start()
+        self._schedule()
+        return job
+
+    def cancel(self):
+        """실행 중인 작업에 취소 요청 (다음 단계 경계에서 중단)"""
+        if self.current is not None:
+            self.current.cancel()
+
+    def _schedule(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """작업 스레드가 보낸 이벤트를 메인 스레드에서 처리"""
+        self._polling = False
+        while True:
+            try:
+                kind, job, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                if self.on_progress and not job.cancelled:
+                    self.on_progress(job, *payload)
+                continue
+
+            self.current = None
+            on_done, on_error = job.callbacks
+            if self.on_finish:
+                self.on_finish(job, kind)
+            if kind == 'done' and on_done:
+                # 결과 표시(Summary 등)도 같은 작업의 단계로 기록
+                with activate(job.timer):
+                    on_done(payload)
+            elif kind == 'error' and on_error:
+                on_error(payload)
+
+            job.timer.info['outcome'] = kind
+            log_timings(job.timer)
+            if self.on_timings:
+                self.on_timings(job)
+
+        if self.current is not None or not self._events.empty():
+            self._schedule()
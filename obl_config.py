@@ -0,0 +1,41 @@
+import json
+import os
+
+# 설정 파일 이름
+STOW_CONFIG_NAME = "StowCodes_mapping.json"
+TPSZ_CONFIG_NAME = "SZTP_mapping.json"
+ISO_TYPE_CONFIG_NAME = "ISOType_mapping.json"
+
+DESKTOP_PATH = os.path.join(os.path.expanduser('~'), 'Desktop')
+ONEDRIVE_DESKTOP_PATH = os.path.join(os.path.expanduser('~'), 'OneDrive', '바탕 화면')
+CONFIG_DIR = os.path.join(DESKTOP_PATH, "OBL_Configs")
+
+
+def config_search_paths(filename):
+    """설정 파일을 찾을 경로 목록 (우선순위 순)"""
+    return [
+        os.path.join(DESKTOP_PATH, filename),  # 일반 바탕화면
+        os.path.join(ONEDRIVE_DESKTOP_PATH, filename),  # OneDrive 바탕화면
+        os.path.join(CONFIG_DIR, filename)  # 설정 디렉토리
+    ]
+
+
+def locate_config_file(filename):
+    """존재하는 설정 파일 경로 반환 (없으면 None)"""
+    for path in config_search_paths(filename):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_json_config(path):
+    """JSON 설정 파일 로드 (경로가 없으면 빈 딕셔너리)"""
+    if not path:
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_tpsz_mapping(path):
+    """TpSz 설정 파일에서 매핑 딕셔너리만 로드"""
+    return load_json_config(path).get('mapping', {})
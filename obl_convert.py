@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from obl_schema import CLL_PLAN, EDI_PLAN, EMPTY_PLAN, EMPTY_WEIGHTS, OBL_COLUMNS, empty_sequence
+from stow_index import EMPTY_STOW_INDEX
+
+
+def build_obl_frame(cll_df, pol, tol, stow_index, start_no=1,
+                    skip_missing_cntr=False, match_port=False):
+    """CLL 데이터프레임을 컬럼 단위 연산으로 OBL 데이터프레임으로 변환"""
+    if skip_missing_cntr:
+        cll_df = cll_df[cll_df['CNTR NO'].notna()]
+
+    context = {
+        'pol': pol,
+        'tol': tol,
+        'start_no': start_no,
+        'stow_index': stow_index,
+        'match_port': match_port,
+    }
+    return CLL_PLAN.build(cll_df, context)
+
+
+def build_empty_frame(empty_entries, pol, tol, stow_index=EMPTY_STOW_INDEX, start_no=1,
+                      weights=EMPTY_WEIGHTS, used_ctr_nbrs=()):
+    """EMPTY 컨테이너 입력값 [(POD, SzTp, 수량), ...]을 OBL 데이터프레임으로 변환
+
+    임시 번호(MSCU0000001 ...)는 used_ctr_nbrs(같은 OBL에 이미 있는 번호)와 겹치지 않게 매긴다.
+    """
+    pods = [pod for pod, _, _ in empty_entries]
+    sztps = [sztp for _, sztp, _ in empty_entries]
+    quantities = [max(qty, 0) for _, _, qty in empty_entries]
+    total = int(sum(quantities))
+    if total == 0:
+        return pd.DataFrame(columns=OBL_COLUMNS)
+
+    entries_df = pd.DataFrame({
+        'POD': np.repeat(np.array(pods, dtype=object), quantities),
+        'SZTP': np.repeat(np.array(sztps, dtype=object), quantities),
+        'SEQ': empty_sequence(total, used_ctr_nbrs),
+    })
+
+    context = {
+        'pol': pol,
+        'tol': tol,
+        'start_no': start_no,
+        'stow_index': stow_index,
+        'match_port': True,
+        'empty_weights': weights,
+    }
+    return EMPTY_PLAN.build(entries_df, context)
+
+
+def edi_source_frame(containers, tpsz_mapping, loaded_at=None):
+    """EDI 파싱 결과(컬럼 레코드)를 EDI_PLAN 입력 데이터프레임으로 변환
+
+    컨테이너 번호가 없는 레코드는 제외하고, loaded_at을 주면 그 항구에서 선적한
+    컨테이너만 남긴다. SzTp는 TpSz 매핑(타입명, 없으면 ISO 코드 기준)으로 변환하고
+    POR/FPOD가 UNSET이면 각각 컨테이너의 POL/POD를 사용한다.
+    """
+    rows = [i for i, cntr_no in enumerate(containers['cntr_no'])
+            if cntr_no and (loaded_at is None or containers['pol'][i] == loaded_at)]
+
+    def column(field):
+        values = containers[field]
+        return [values[i] for i in rows]
+
+    def unset_or(value, fallback):
+        return fallback if value in (None, "UNSET") else value
+
+    def sztp(tpsz, iso_type):
+        if tpsz in tpsz_mapping:
+            return tpsz_mapping[tpsz]
+        return tpsz_mapping.get(iso_type, tpsz)
+
+    pols = column('pol')
+    pods = column('pod')
+    return pd.DataFrame({
+        'cntr_no': column('cntr_no'),
+        'por': [unset_or(por, pol) for por, pol in zip(column('por'), pols)],
+        'pod': pods,
+        'fpod': [unset_or(fpod, pod) for fpod, pod in zip(column('fpod'), pods)],
+        'sztp': [sztp(tpsz, iso_type) for tpsz, iso_type in zip(column('tpsz'), column('iso_type'))],
+        'weight_kg': pd.Series(column('weight_kg'), dtype='float64'),
+        'fe': column('fe'),
+        'temp': column('temp'),
+        'unno': pd.Series(column('unno'), dtype='float64'),
+        'dg': pd.Series(column('dg'), dtype='float64'),
+    })
+
+
+def build_edi_obl_frame(containers, pol, tol, stow_index, tpsz_mapping, start_no=1, loaded_at=None):
+    """EDI 파싱 결과를 중간 엑셀 없이 바로 OBL 데이터프레임으로 변환"""
+    context = {
+        'pol': pol,
+        'tol': tol,
+        'start_no': start_no,
+        'stow_index': stow_index,
+        'match_port': True,
+    }
+    return EDI_PLAN.build(edi_source_frame(containers, tpsz_mapping, loaded_at), context)
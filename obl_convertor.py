@@ -0,0 +1,365 @@
+"""OBL Convertor 명령줄 실행 (Tk 없이 일괄 변환)
+
+사용 예:
+    python -m obl_convertor convert --service AE1 --out dir/ cll/*.xlsx
+    python -m obl_convertor convert --out dir/ cll/          (서비스 자동 선택)
+    python -m obl_convertor itps --obl OBL.xlsx itps/*.xlsx
+    python -m obl_convertor itps --obl 'obl/*.xlsx' ITPS.xlsx   (POL/TOL별로 나눠 여러 OBL에 추가)
+    python -m obl_convertor itps --obl A.xlsx --obl B.xlsx --assign BUSAN=A.xlsx --assign SGSIN=B.xlsx ITPS.xlsx
+    python -m obl_convertor edi --out dir/ edi/            (여러 파일이면 POD 통합 요약 포함)
+    python -m obl_convertor edi-obl --tol KRPUSPN edi/      (BAPLIE → OBL 직접 변환)
+    python -m obl_convertor diff old.edi new.edi            (원본/수정본 BAPLIE 비교)
+    python -m obl_convertor export --message COPRAR --recipient KRPUSPN --vessel "MSC ANNA" --voyage FE123 OBL.xlsx
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from edi_batch import EDI_EXTENSIONS, plan_edi_outputs, pod_report_path, write_pod_report
+from edi_diff import DIFF_FIELDS, diff_edi_files
+from edi_parser import convert_edi_file
+from edi_writer import EDI_MESSAGES, export_obl_edi
+from instrumentation import JobTimer, activate, enable_timing_log, enable_timing_log_from_env, log_timings
+from input_files import expand_inputs
+from iso_types import format_unknown_types
+from itps_batch import merge_itps_batch
+from itps_merge import ITPS_ASSIGN_COLUMN
+from obl_config import (STOW_CONFIG_NAME, TPSZ_CONFIG_NAME, locate_config_file,
+                        load_json_config, load_tpsz_mapping)
+from obl_duplicates import DEFAULT_DUPLICATE_POLICY, DUPLICATE_POLICIES, format_duplicates
+from obl_pipelines import convert_cll_file, convert_edi_obl_file, merge_itps_file
+from obl_writer import OBL_WRITERS
+from parse_cache import CACHE_ENV
+from stow_index import compile_stow_indexes
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+
+
+def timed_call(func, *args):
+    """작업 실행 + 단계별 시간 측정 (작업 프로세스에서 실행, 로그는 부모 프로세스가 기록)"""
+    timer = JobTimer(func.__name__, input_file=args[0])
+    try:
+        with activate(timer):
+            result = func(*args)
+        error = None
+    except Exception as e:
+        result, error = None, e
+    timer.stop()
+    timer.info['outcome'] = 'error' if error else 'done'
+    return result, error, timer.summary()
+
+
+def run_jobs(func, jobs, workers, describe, results=None):
+    """(인자 튜플) 목록을 프로세스 풀에서 실행하고 실패 건수 반환
+
+    describe는 작업 결과 요약 문자열을 만드는 함수 (하위 명령별로 지정).
+    results 목록이 주어지면 성공한 작업의 (입력 파일, 결과)를 추가한다.
+    """
+    failures = 0
+    if workers == 1 or len(jobs) <= 1:
+        for args in jobs:
+            failures += not report(args[0], *timed_call(func, *args), describe, results=results)
+        return failures
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(timed_call, func, *args): args[0] for args in jobs}
+        for future in as_completed(futures):
+            failures += not report(futures[future], *future.result(), describe, results=results)
+    return failures
+
+
+def report(input_file, result, error, timings, describe, results=None):
+    """작업 하나의 결과 출력 및 타이밍 로그 기록 (성공 여부 반환)"""
+    log_timings(timings)
+    if error is not None:
+        print(f"[실패] {input_file}: {error}", file=sys.stderr)
+        return False
+    cached = " (캐시)" if timings.get('cache_hits') else ""
+    print(f"[완료] {input_file} -> {describe(result)} [{timings['elapsed']:.2f}s{cached}]")
+    if results is not None:
+        results.append((input_file, result))
+    return True
+
+
+def describe_obl(result):
+    """CLL/EDI → OBL 변환 결과 요약"""
+    return (f"{result['output_file']} ({result['service'] or 'stow 미적용'}, {result['rows']}행)"
+            + describe_duplicates(result['duplicates']))
+
+
+def describe_itps(result):
+    """ITPS 추가 결과 요약"""
+    combined_df, output_file, duplicates = result
+    return f"{output_file} ({len(combined_df)}행)" + describe_duplicates(duplicates)
+
+
+def describe_edi(result):
+    """EDI → 엑셀 변환 결과 요약"""
+    total = sum(result['pod_summary'].values())
+    text = f"{result['output_file']} ({result['vessel']} {result['voy']} {result['port']}, {total}개)"
+    if result['unknown_types']:
+        text += f" [미등록 타입: {format_unknown_types(result['unknown_types'])}]"
+    return text
+
+
+def describe_export(result):
+    """OBL → EDI 생성 결과 요약"""
+    return f"{result['output_file']} ({result['message']}, {result['containers']}개)"
+
+
+def describe_diff(result):
+    """BAPLIE 비교 결과 요약"""
+    return f"{result['output_file']} ({result['before_count']} → {result['after_count']}개)"
+
+
+def describe_itps_batch(result):
+    """여러 OBL 대상 ITPS 작업 요약 (OBL별 한 줄)"""
+    added = sum(item['added'] for item in result['results'])
+    lines = [f"OBL {len(result['results'])}개 ({added}행 추가)"]
+    for item in result['results']:
+        lines.append(f"  {item['output_file']} ({item['pol']} {item['tol']}, +{item['added']} → {item['rows']}행)"
+                     + describe_duplicates(item['duplicates']))
+    for obl_file, error in result['errors']:
+        lines.append(f"  [실패] {obl_file}: {error}")
+    if result['skipped']:
+        lines.append(f"  [추가할 행 없음] {', '.join(result['skipped'])}")
+    if result['unmatched']:
+        unmatched = ", ".join(f"{key}×{count}" for key, count in result['unmatched'].items())
+        lines.append(f"  [대상 OBL 없음] {unmatched}")
+    return "\n".join(lines)
+
+
+def describe_duplicates(duplicates):
+    """중복 CtrNbr 요약 (없으면 빈 문자열)"""
+    if not duplicates:
+        return ""
+    return f" [중복 CtrNbr {len(duplicates)}개: {format_duplicates(duplicates)}]"
+
+
+def cmd_convert(args):
+    stow_indexes = {}
+    if not args.no_stow:
+        config_file = args.stow_config or locate_config_file(STOW_CONFIG_NAME)
+        stow_indexes = compile_stow_indexes(load_json_config(config_file))
+    files = expand_inputs(args.files, EXCEL_EXTENSIONS)
+    jobs = [(path, stow_indexes, args.service, args.out, not args.no_stow, args.format, None, args.duplicates)
+            for path in files]
+    return run_jobs(convert_cll_file, jobs, args.workers, describe_obl)
+
+
+def cmd_itps(args):
+    tpsz_mapping = load_tpsz_mapping(args.tpsz_config or locate_config_file(TPSZ_CONFIG_NAME))
+    files = expand_inputs(args.files, EXCEL_EXTENSIONS)
+    obl_files = expand_inputs(args.obl, EXCEL_EXTENSIONS)
+    if not obl_files:
+        print(f"[실패] --obl {' '.join(args.obl)}: OBL 파일이 없습니다", file=sys.stderr)
+        return 1
+    try:
+        assignments = parse_assignments(args.assign, obl_files)
+    except ValueError as e:
+        print(f"[실패] --assign: {e}", file=sys.stderr)
+        return 1
+    if len(obl_files) > 1:
+        # ITPS 하나를 여러 OBL에 나눠 추가 (OBL별 저장을 병렬로 하므로 ITPS는 차례로 처리)
+        jobs = [(path, obl_files, tpsz_mapping, args.out, args.format, args.workers, args.duplicates,
+                 assignments, args.assign_by)
+                for path in files]
+        results = []
+        failures = run_jobs(_merge_itps_batch_job, jobs, 1, describe_itps_batch, results)
+        return failures + sum(len(result['errors']) for _, result in results)
+
+    # ITPS는 같은 OBL에 차례로 추가되므로 결과 파일을 다음 입력으로 사용하지 않고 각각 저장
+    jobs = [(path, obl_files[0], tpsz_mapping, args.out, args.format, args.duplicates) for path in files]
+    return run_jobs(_merge_itps_job, jobs, args.workers, describe_itps)
+
+
+def _merge_itps_job(itps_file, obl_file, tpsz_mapping, out_dir, fmt, duplicates):
+    """프로세스 풀용 ITPS 작업 (ITPS 파일 경로가 첫 인자)"""
+    return merge_itps_file(obl_file, itps_file, tpsz_mapping, out_dir, fmt=fmt, duplicates=duplicates)
+
+
+def _merge_itps_batch_job(itps_file, obl_files, tpsz_mapping, out_dir, fmt, workers, duplicates,
+                          assignments=None, assign_by=ITPS_ASSIGN_COLUMN):
+    """여러 OBL 대상 ITPS 작업 (ITPS 파일 경로가 첫 인자)"""
+    return merge_itps_batch(itps_file, obl_files, tpsz_mapping, out_dir, fmt=fmt, max_workers=workers,
+                            duplicates=duplicates, assignments=assignments, assign_by=assign_by)
+
+
+def parse_assignments(specs, obl_files):
+    """--assign "값=OBL" 목록을 {값: OBL 파일}로 변환 (OBL은 경로 또는 파일 이름, 지정 없으면 None)"""
+    if not specs:
+        return None
+    by_name = {}
+    for obl_file in obl_files:
+        by_name.setdefault(os.path.abspath(obl_file), obl_file)
+        by_name.setdefault(os.path.basename(obl_file), obl_file)
+    assignments = {}
+    for spec in specs:
+        value, sep, target = spec.rpartition('=')
+        if not sep or not value.strip():
+            raise ValueError(f"'값=OBL' 형식이 아닙니다: {spec}")
+        obl_file = by_name.get(os.path.abspath(target)) or by_name.get(target)
+        if obl_file is None:
+            raise ValueError(f"--obl에 없는 파일입니다: {target}")
+        assignments[value.strip()] = obl_file
+    return assignments
+
+
+def cmd_edi(args):
+    files = expand_inputs(args.files, EDI_EXTENSIONS)
+    try:
+        # 같은 선박/항차/항구 파일이 서로의 결과를 덮어쓰지 않도록 출력 경로를 미리 정한다
+        output_files = plan_edi_outputs(files, args.out)
+    except ValueError as e:
+        print(f"[실패] {e}", file=sys.stderr)
+        return 1
+    jobs = [(path, args.out, output_files[path]) for path in files]
+    results = []
+    failures = run_jobs(_convert_edi_job, jobs, args.workers, describe_edi, results)
+
+    # 여러 파일을 변환하면 POD 요약을 한 파일로 통합 (입력 순서대로)
+    if results and (len(files) > 1 or args.report) and not args.no_report:
+        order = {path: i for i, path in enumerate(files)}
+        results = [{**result, 'input_file': path} for path, result in sorted(results, key=lambda item: order[item[0]])]
+        report_file = args.report or pod_report_path(args.out or os.path.dirname(files[0]))
+        write_pod_report(results, report_file)
+        print(f"[요약] {report_file} ({len(results)}개 파일)")
+    return failures
+
+
+def _convert_edi_job(input_file, out_dir, output_file):
+    """프로세스 풀용 EDI 변환 (출력 경로는 부모 프로세스가 정함)"""
+    return convert_edi_file(input_file, out_dir, output_file=output_file)
+
+
+def cmd_edi_obl(args):
+    stow_indexes = {}
+    if not args.no_stow:
+        config_file = args.stow_config or locate_config_file(STOW_CONFIG_NAME)
+        stow_indexes = compile_stow_indexes(load_json_config(config_file))
+    tpsz_mapping = load_tpsz_mapping(args.tpsz_config or locate_config_file(TPSZ_CONFIG_NAME))
+    files = expand_inputs(args.files, EDI_EXTENSIONS)
+    jobs = [(path, stow_indexes, tpsz_mapping, args.service, args.pol, args.tol, args.out,
+             not args.no_stow, args.loaded_only, args.format, None, args.duplicates) for path in files]
+    return run_jobs(convert_edi_obl_file, jobs, args.workers, describe_obl)
+
+
+def cmd_export(args):
+    tpsz_mapping = load_tpsz_mapping(args.tpsz_config or locate_config_file(TPSZ_CONFIG_NAME))
+    header = {'vessel': args.vessel, 'voyage': args.voyage, 'call_sign': args.call_sign, 'port': args.port,
+              'sender': args.sender, 'recipient': args.recipient}
+    files = expand_inputs(args.files, EXCEL_EXTENSIONS + ('.csv',))
+    jobs = [(path, None, args.message, header, tpsz_mapping, args.out) for path in files]
+    return run_jobs(export_obl_edi, jobs, args.workers, describe_export)
+
+
+def cmd_diff(args):
+    result, error, timings = timed_call(diff_edi_files, args.old, args.new, args.out)
+    if not report(args.new, result, error, timings, describe_diff):
+        return 1
+    counts = ", ".join(f"{DIFF_FIELDS[field]} {count}" for field, count in result['field_counts'].items() if count)
+    print(f"  추가 {result['added']} / 삭제 {result['removed']} / 변경 {result['changed_containers']}"
+          + (f" ({counts})" if counts else ""))
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="obl_convertor", description="OBL Convertor 일괄 변환")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_common(sub):
+        sub.add_argument('files', nargs='+', help="입력 파일, 디렉토리 또는 glob 패턴")
+        sub.add_argument('--out', help="출력 디렉토리 (기본: 입력 파일과 같은 위치)")
+        sub.add_argument('--workers', type=int, default=os.cpu_count(), help="병렬 프로세스 수")
+        sub.add_argument('--timing-log', nargs='?', const='', metavar='PATH',
+                         help="단계별 시간을 JSON lines 로그로 기록 (경로 생략 시 기본 위치)")
+        sub.add_argument('--no-cache', action='store_true', help="파싱 캐시를 사용하지 않음")
+
+    def add_duplicates(sub):
+        sub.add_argument('--duplicates', choices=DUPLICATE_POLICIES, default=DEFAULT_DUPLICATE_POLICY,
+                         help="중복 CtrNbr 처리 (flag: Remark에 표시, drop: 두 번째 이후 행 제외)")
+
+    convert = subparsers.add_parser('convert', help="CLL → OBL 변환")
+    add_common(convert)
+    convert.add_argument('--service', help="Stow 매핑 서비스명 (생략 시 POD 기준 자동 선택)")
+    convert.add_argument('--no-stow', action='store_true', help="Stow 매핑 없이 변환")
+    convert.add_argument('--stow-config', help=f"{STOW_CONFIG_NAME} 경로")
+    convert.add_argument('--format', choices=sorted(OBL_WRITERS), default='xlsx', help="OBL 출력 형식")
+    add_duplicates(convert)
+    convert.set_defaults(func=cmd_convert)
+
+    itps = subparsers.add_parser('itps', help="ITPS 데이터를 OBL에 추가")
+    add_common(itps)
+    itps.add_argument('--obl', required=True, action='append',
+                      help="기준 OBL 파일 (반복 지정/디렉토리/glob 패턴으로 여러 개면 ITPS 행을 POL/TOL별로 나눠 추가)")
+    itps.add_argument('--assign', action='append', metavar='VALUE=OBL',
+                      help="OBL이 여러 개일 때 --assign-by 컬럼 값별 대상 OBL (반복 지정, 지정하지 않은 값은 추가 안 함)")
+    itps.add_argument('--assign-by', default=ITPS_ASSIGN_COLUMN,
+                      help=f"--assign 값을 찾을 ITPS 컬럼 (기본: {ITPS_ASSIGN_COLUMN})")
+    itps.add_argument('--tpsz-config', help=f"{TPSZ_CONFIG_NAME} 경로")
+    itps.add_argument('--format', choices=sorted(OBL_WRITERS), default='xlsx', help="OBL 출력 형식")
+    add_duplicates(itps)
+    itps.set_defaults(func=cmd_itps)
+
+    edi = subparsers.add_parser('edi', help="EDI(BAPLIE) → 엑셀 변환")
+    add_common(edi)
+    edi.add_argument('--report', metavar='PATH',
+                     help="통합 POD 요약 파일 경로 (기본: 파일이 여러 개면 EDI_POD_Summary_날짜.xlsx)")
+    edi.add_argument('--no-report', action='store_true', help="통합 POD 요약을 만들지 않음")
+    edi.set_defaults(func=cmd_edi)
+
+    edi_obl = subparsers.add_parser('edi-obl', help="EDI(BAPLIE) → OBL 직접 변환")
+    add_common(edi_obl)
+    edi_obl.add_argument('--pol', help="POL (기본: BAPLIE의 현재 항구)")
+    edi_obl.add_argument('--tol', default='', help="TOL 터미널 코드 (예: KRPUSPN)")
+    edi_obl.add_argument('--loaded-only', action='store_true', help="POL에서 선적한 컨테이너만 변환")
+    edi_obl.add_argument('--service', help="Stow 매핑 서비스명 (생략 시 POD 기준 자동 선택)")
+    edi_obl.add_argument('--no-stow', action='store_true', help="Stow 매핑 없이 변환")
+    edi_obl.add_argument('--stow-config', help=f"{STOW_CONFIG_NAME} 경로")
+    edi_obl.add_argument('--tpsz-config', help=f"{TPSZ_CONFIG_NAME} 경로")
+    edi_obl.add_argument('--format', choices=sorted(OBL_WRITERS), default='xlsx', help="OBL 출력 형식")
+    add_duplicates(edi_obl)
+    edi_obl.set_defaults(func=cmd_edi_obl)
+
+    export = subparsers.add_parser('export', help="OBL → BAPLIE/COPRAR EDI 파일 생성")
+    add_common(export)
+    export.add_argument('--message', type=str.upper, choices=sorted(EDI_MESSAGES), default='BAPLIE',
+                        help="EDI 메시지 종류")
+    export.add_argument('--vessel', default='', help="선박명")
+    export.add_argument('--voyage', default='', help="항차")
+    export.add_argument('--call-sign', default='', help="선박 식별 번호 (IMO 번호)")
+    export.add_argument('--port', help="현재 항구 (기본: 첫 행의 POL)")
+    export.add_argument('--sender', help="송신자 (기본: MSC)")
+    export.add_argument('--recipient', required=True, help="수신자 (UNB 필수 항목, 예: 터미널 코드)")
+    export.add_argument('--tpsz-config', help=f"{TPSZ_CONFIG_NAME} 경로")
+    export.set_defaults(func=cmd_export)
+
+    diff = subparsers.add_parser('diff', help="원본/수정본 BAPLIE 비교")
+    diff.add_argument('old', help="원본 BAPLIE")
+    diff.add_argument('new', help="수정본 BAPLIE")
+    diff.add_argument('--out', help="출력 디렉토리 (기본: 수정본과 같은 위치)")
+    diff.add_argument('--timing-log', nargs='?', const='', metavar='PATH',
+                      help="단계별 시간을 JSON lines 로그로 기록 (경로 생략 시 기본 위치)")
+    diff.add_argument('--no-cache', action='store_true', help="파싱 캐시를 사용하지 않음")
+    diff.set_defaults(func=cmd_diff)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.timing_log is not None:
+        enable_timing_log(args.timing_log or None)
+    else:
+        enable_timing_log_from_env()
+    if args.no_cache:
+        # 작업 프로세스도 환경 변수를 물려받는다
+        os.environ[CACHE_ENV] = '0'
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    failures = args.func(args)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
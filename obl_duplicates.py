@@ -0,0 +1,107 @@
+"""OBL 저장 전 중복 컨테이너(CtrNbr) 확인
+
+CLL/ITPS/EMPTY 병합으로 같은 컨테이너 번호가 두 번 이상 들어가면 터미널에서
+반려되므로 저장 직전에 번호 집합을 한 번 훑어 두 번째 이후 행을 찾는다.
+청크로 나눠 저장하는 경우에도 앞 청크에서 본 번호를 기억한다.
+
+정책
+    flag : 행은 그대로 두고 Remark에 표시
+    drop : 두 번째 이후 행 제외 (처음 나온 행만 저장, No는 남은 행 기준으로 다시 매김)
+"""
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+
+DUPLICATE_POLICIES = ('flag', 'drop')
+DEFAULT_DUPLICATE_POLICY = 'flag'
+
+DUPLICATE_REMARK = "DUPLICATE CtrNbr"
+
+
+class DuplicateCheck:
+    """CtrNbr 해시 집합으로 중복 행 표시/제외 (duplicates는 번호 → 추가로 나온 횟수)"""
+
+    def __init__(self, policy=DEFAULT_DUPLICATE_POLICY):
+        if policy not in DUPLICATE_POLICIES:
+            raise ValueError(f"알 수 없는 중복 처리 정책: {policy} (지원: {', '.join(DUPLICATE_POLICIES)})")
+        self.policy = policy
+        self.seen = set()
+        self.duplicates = Counter()
+        self.kept = 0  # 지금까지 남긴 행 수 (drop 후 청크를 넘어 No를 이어서 매김)
+
+    def apply(self, obl_df):
+        """데이터프레임 하나 확인 (이전에 확인한 행의 번호도 중복으로 본다)"""
+        if 'CtrNbr' not in obl_df.columns or obl_df.empty:
+            return self._renumber(obl_df)
+        with stage('duplicate_check', len(obl_df)):
+            mask = self._duplicate_mask(obl_df['CtrNbr'])
+            if self.policy == 'drop':
+                return self._renumber(obl_df[~mask] if mask.any() else obl_df)
+            if not mask.any():
+                return obl_df
+            obl_df = obl_df.copy()
+            remarks = obl_df['Remark'] if 'Remark' in obl_df.columns else pd.Series('', index=obl_df.index)
+            remarks = remarks.astype(object).where(remarks.notna(), '').map(str)
+            flagged = np.where(remarks == '', DUPLICATE_REMARK, remarks + " / " + DUPLICATE_REMARK)
+            obl_df['Remark'] = remarks.where(~mask, pd.Series(flagged, index=obl_df.index, dtype=object))
+            return obl_df
+
+    def iter_chunks(self, chunks):
+        """청크 이터레이터를 차례로 확인"""
+        for chunk in chunks:
+            yield self.apply(chunk)
+
+    def _renumber(self, obl_df):
+        """drop 정책에서 제외한 행이 있었으면 남은 행의 No를 1부터 연속으로 다시 매김"""
+        start = self.kept
+        self.kept += len(obl_df)
+        if self.policy != 'drop' or not self.duplicates or 'No' not in obl_df.columns or obl_df.empty:
+            return obl_df
+        obl_df = obl_df.copy()
+        obl_df['No'] = np.arange(start + 1, self.kept + 1)
+        return obl_df
+
+    def _duplicate_mask(self, ctr_nbrs):
+        """앞에서 이미 나온 번호인 행 (빈 번호 제외, 공백/대소문자 무시)"""
+        seen = self.seen
+        add = seen.add
+        keys = [value.strip().upper() if isinstance(value, str) else ('' if value is None or value != value else str(value))
+                for value in ctr_nbrs.tolist()]
+        mask = []
+        for key in keys:
+            if key and key in seen:
+                mask.append(True)
+            else:
+                mask.append(False)
+                add(key)
+        mask = np.array(mask, dtype=bool)
+        if mask.any():
+            self.duplicates.update(key for key, duplicate in zip(keys, mask) if duplicate)
+        return mask
+
+    def dropped(self):
+        """제외한 행 수 (drop 정책일 때만)"""
+        return sum(self.duplicates.values()) if self.policy == 'drop' else 0
+
+    def summary(self):
+        """중복 번호 → 추가로 나온 횟수 (많은 순)"""
+        return dict(self.duplicates.most_common())
+
+
+def duplicate_check(duplicates):
+    """정책 이름 또는 DuplicateCheck를 DuplicateCheck로 (None은 확인 안 함)"""
+    if duplicates is None or isinstance(duplicates, DuplicateCheck):
+        return duplicates
+    return DuplicateCheck(duplicates)
+
+
+def format_duplicates(duplicates, limit=10):
+    """중복 번호 집계를 표시용 문자열로 변환 ("MSCU1234567×1, ...")"""
+    counts = Counter(duplicates).most_common()
+    text = ", ".join(f"{ctr_nbr}×{count}" for ctr_nbr, count in counts[:limit])
+    if len(counts) > limit:
+        text += f" 외 {len(counts) - limit}개"
+    return text
@@ -0,0 +1,195 @@
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from cll_loader import load_cll
+from edi_parser import load_edi_file
+from instrumentation import stage
+from itps_merge import append_itps_rows
+from obl_convert import build_edi_obl_frame, build_obl_frame, build_empty_frame
+from obl_duplicates import DEFAULT_DUPLICATE_POLICY, DuplicateCheck, duplicate_check
+from obl_schema import normalize_obl_columns
+from obl_writer import OBL_CHUNK_ROWS, write_obl_chunks
+from port_resolver import PORT_CODES
+from stow_index import EMPTY_STOW_INDEX, find_matching_services
+
+
+def report_progress(progress, stage, done=None, total=None):
+    """진행 상황 콜백 호출 (콜백이 없으면 무시)"""
+    if progress is not None:
+        progress(stage, done, total)
+
+
+def cll_output_path(file_path, out_dir=None, fmt='xlsx'):
+    """CLL 파일 기준 OBL 출력 경로 ("원본이름_OBL.xlsx")"""
+    save_dir = out_dir or os.path.dirname(file_path)
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(save_dir, f"{base_name}_OBL.{fmt}")
+
+
+def iter_cll_obl_chunks(cll_df, pol, tol, stow_index, empty_entries=(), chunk_rows=OBL_CHUNK_ROWS, progress=None):
+    """CLL 데이터를 청크 단위로 변환 (저장이 앞 청크를 쓰는 동안 다음 청크를 매핑)"""
+    total = len(cll_df)
+    for start in range(0, total, chunk_rows):
+        report_progress(progress, "CLL 변환", start, total)
+        yield build_obl_frame(cll_df.iloc[start:start + chunk_rows], pol, tol, stow_index, start_no=start + 1)
+    report_progress(progress, "CLL 변환", total, total)
+
+    if empty_entries:
+        report_progress(progress, "EMPTY 추가")
+        empty_df = build_empty_frame(empty_entries, pol, tol, stow_index, start_no=total + 1,
+                                     used_ctr_nbrs=cll_df['CNTR NO'])
+        if len(empty_df):
+            yield empty_df
+
+
+def combine_cll_frames(cll_frames, pol, tol, stow_index, progress=None):
+    """여러 CLL 데이터를 하나로 연결한 뒤 한 번에 변환 (컨테이너 번호는 연속)
+
+    tol은 공통 TOL 또는 CLL별 TOL 목록 (터미널이 다른 CLL을 병합할 때)
+    """
+    # CNTR NO가 없는 행은 병합 대상에서 제외
+    frames = [cll_df[cll_df['CNTR NO'].notna()] for cll_df in cll_frames]
+    row_counts = [len(cll_df) for cll_df in frames]
+    if not isinstance(tol, str):
+        tol = np.repeat(np.array(list(tol), dtype=object), row_counts)
+
+    total = sum(row_counts)
+    report_progress(progress, "CLL 병합", 0, total)
+    combined = pd.concat(frames, ignore_index=True)
+    obl_df = build_obl_frame(combined, pol, tol, stow_index, match_port=True)
+    report_progress(progress, "CLL 병합", total, total)
+    return obl_df
+
+
+def write_obl(obl, output_file, progress=None, duplicates=DEFAULT_DUPLICATE_POLICY):
+    """OBL 데이터프레임 또는 청크 이터레이터를 출력 헤더로 저장 (형식은 확장자로 결정)
+
+    duplicates는 중복 CtrNbr 처리 정책 이름 또는 DuplicateCheck이며, 이미 확인한
+    데이터이면 None을 준다.
+    """
+    check = duplicate_check(duplicates)
+    if check is not None:
+        obl = check.apply(obl) if isinstance(obl, pd.DataFrame) else check.iter_chunks(obl)
+    report_progress(progress, "파일 저장")
+    with stage('excel_write') as record:
+        record['rows'] = write_obl_chunks(obl, output_file)
+    return output_file
+
+
+def select_service(stow_indexes, pod_list, service=None):
+    """변환에 사용할 서비스 결정 (지정이 없으면 POD가 일치하는 유일한 서비스)"""
+    if service:
+        if service not in stow_indexes:
+            raise ValueError(f"알 수 없는 서비스: {service}")
+        return service
+
+    matching_services = find_matching_services(stow_indexes, pod_list)
+    if len(matching_services) != 1:
+        candidates = ', '.join(matching_services) or '없음'
+        raise ValueError(f"서비스를 자동으로 선택할 수 없습니다 (일치하는 서비스: {candidates})")
+    return next(iter(matching_services))
+
+
+def convert_cll_file(file_path, stow_indexes, service=None, out_dir=None, use_stow=True, fmt='xlsx',
+                     progress=None, duplicates=DEFAULT_DUPLICATE_POLICY):
+    """CLL 파일 하나를 OBL 파일로 변환하고 결과 정보를 반환"""
+    report_progress(progress, "CLL 읽기")
+    cll = load_cll(file_path)
+    port_info = cll.port_info()
+    if not port_info['pol']:
+        raise ValueError(f"터미널 코드를 POL/TOL로 변환할 수 없습니다: {cll.terminal_code or '(없음)'}")
+
+    if use_stow:
+        service = select_service(stow_indexes, cll.pod_list(), service)
+        stow_index = stow_indexes[service]
+    else:
+        service = ''
+        stow_index = EMPTY_STOW_INDEX
+
+    chunks = iter_cll_obl_chunks(cll.data, port_info['pol'], port_info['tol'], stow_index, progress=progress)
+    check = DuplicateCheck(duplicates)
+    output_file = write_obl(chunks, cll_output_path(file_path, out_dir, fmt), progress, check)
+    return {
+        'input_file': file_path,
+        'output_file': output_file,
+        'service': service,
+        'pol': port_info['pol'],
+        'tol': port_info['tol'],
+        'rows': len(cll.data) - check.dropped(),
+        'duplicates': check.summary()
+    }
+
+
+def edi_obl_pod_list(containers, loaded_at=None):
+    """서비스 자동 선택용 POD 목록 (등장 순서, 중복/UNSET 제외, loaded_at이면 그 항구 선적분만)"""
+    pods = containers['pod']
+    if loaded_at is not None:
+        pods = [pod for pod, pol in zip(pods, containers['pol']) if pol == loaded_at]
+    return [pod for pod in dict.fromkeys(pods) if pod and pod != "UNSET"]
+
+
+def convert_edi_obl_file(file_path, stow_indexes, tpsz_mapping, service=None, pol=None, tol='', out_dir=None,
+                         use_stow=True, loaded_only=False, fmt='xlsx', progress=None,
+                         duplicates=DEFAULT_DUPLICATE_POLICY):
+    """BAPLIE를 중간 엑셀 없이 OBL 파일로 변환 ("원본이름_OBL.xlsx")
+
+    pol을 생략하면 BAPLIE의 현재 항구(LOC+5)를 사용하며, loaded_only면 그 항구에서
+    선적한 컨테이너만 변환한다.
+    """
+    report_progress(progress, "EDI 파싱")
+    parsed, _ = load_edi_file(file_path, progress)
+    pol = pol or parsed['port']
+    if not pol:
+        raise ValueError("POL을 알 수 없습니다 (BAPLIE에 LOC+5 항구가 없습니다).")
+    containers = parsed['containers']
+    loaded_at = pol if loaded_only else None
+
+    if use_stow:
+        service = select_service(stow_indexes, edi_obl_pod_list(containers, loaded_at), service)
+        stow_index = stow_indexes[service]
+    else:
+        service = ''
+        stow_index = EMPTY_STOW_INDEX
+
+    report_progress(progress, "OBL 변환")
+    obl_df = build_edi_obl_frame(containers, pol, tol, stow_index, tpsz_mapping, loaded_at=loaded_at)
+    if obl_df.empty:
+        raise ValueError("변환할 컨테이너가 없습니다.")
+    check = DuplicateCheck(duplicates)
+    obl_df = check.apply(obl_df)
+    output_file = write_obl(obl_df, cll_output_path(file_path, out_dir, fmt), progress, None)
+    return {
+        'input_file': file_path,
+        'output_file': output_file,
+        'service': service,
+        'pol': pol,
+        'tol': tol,
+        'rows': len(obl_df),
+        'duplicates': check.summary()
+    }
+
+
+def merge_itps_file(obl_file, itps_file, tpsz_mapping, out_dir=None, port_codes=PORT_CODES, fmt='xlsx',
+                    progress=None, duplicates=DEFAULT_DUPLICATE_POLICY):
+    """ITPS 파일을 OBL에 추가하여 "OBL_with_ITPS_시각.xlsx"로 저장
+
+    (결합된 데이터프레임, 출력 파일, 중복 CtrNbr 집계)를 반환한다.
+    """
+    report_progress(progress, "OBL 읽기")
+    obl_df = normalize_obl_columns(pd.read_excel(obl_file))
+    report_progress(progress, "ITPS 읽기")
+    itps_df = pd.read_excel(itps_file)
+    combined_df = append_itps_rows(obl_df, itps_df, tpsz_mapping, port_codes, progress)
+    check = DuplicateCheck(duplicates)
+    combined_df = check.apply(combined_df)
+
+    save_dir = out_dir or os.path.dirname(obl_file)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = os.path.join(save_dir, f"OBL_with_ITPS_{timestamp}.{fmt}")
+    write_obl(combined_df, output_file, progress, None)
+    if not os.path.exists(output_file):
+        raise IOError("파일이 생성되지 않았습니다.")
+    return combined_df, output_file, check.summary()
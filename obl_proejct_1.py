@@ -3,15 +3,38 @@ from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 import os
 import json
+import logging
 from typing import List, Dict
 from tkinterdnd2 import DND_FILES, TkinterDnD
 from datetime import datetime
 from openpyxl import load_workbook
 import xlrd  # .xls 파일 처리를 위한 라이브러리
 import time
+import multiprocessing
 import openpyxl
 from openpyxl.styles import Font, Alignment
 from openpyxl import utils
+from cll_loader import load_cll, load_cll_files, merge_port_info, terminal_to_port
+from edi_batch import EDI_EXTENSIONS, convert_edi_batch
+from edi_diff import DIFF_FIELDS, diff_edi_files
+from edi_parser import convert_edi_file, load_edi_file
+from input_files import expand_inputs
+from iso_types import format_unknown_types
+from itps_batch import merge_itps_batch, read_itps
+from itps_merge import ITPS_ASSIGN_COLUMN, append_itps_rows, has_load_port_column, itps_assignment_values
+from obl_config import locate_config_file, DESKTOP_PATH, ONEDRIVE_DESKTOP_PATH, CONFIG_DIR
+from obl_convert import build_obl_frame, build_empty_frame
+from obl_duplicates import DEFAULT_DUPLICATE_POLICY, DUPLICATE_POLICIES, DuplicateCheck, format_duplicates
+from instrumentation import stage, enable_timing_log, enable_timing_log_from_env, disable_timing_log
+from job_runner import JobRunner
+from obl_pipelines import (iter_cll_obl_chunks, cll_output_path, combine_cll_frames, convert_edi_obl_file,
+                           edi_obl_pod_list, merge_itps_file, write_obl)
+from obl_schema import ADDED_EMPTY_WEIGHTS, normalize_obl_columns
+from parse_cache import CACHE_STATS, ParseCache
+from port_resolver import PORT_CODES, convert_to_port_code
+from stow_index import compile_stow_indexes, find_matching_services, EMPTY_STOW_INDEX
+
+_logger = logging.getLogger("obl_convertor.gui")
 
 # pyinstaller -w -F --add-binary="C:/Users/kod03/AppData/Local/Programs/Python/Python311/tcl/tkdnd2.8;tkdnd2.8" obl_proejct_1.py
 
@@ -22,24 +45,12 @@ class ContainerConverter:
         self.root.geometry("1000x900")
 
         # 설정 파일 경로 설정
-        self.desktop_path = os.path.join(os.path.expanduser('~'), 'Desktop')
-        self.onedrive_desktop = os.path.join(os.path.expanduser('~'), 'OneDrive', '바탕 화면')
-        self.config_dir = os.path.join(self.desktop_path, "OBL_Configs")
+        self.desktop_path = DESKTOP_PATH
+        self.onedrive_desktop = ONEDRIVE_DESKTOP_PATH
+        self.config_dir = CONFIG_DIR
         
         # port_codes 딕셔너리 추가
-        self.port_codes = {
-            'KRPUS': 'BUSAN',
-            'KRKAN': 'KWANGYANG',
-            'KRINC': 'INCHEON',
-            'KRPTK': 'PYEONGTAEK',
-            'KRUSN': 'ULSAN',
-            'KRMAS': 'MASAN',
-            'KRKPO': 'POHANG',
-            'KRGNR': 'GUNSAN',
-            'KRYSN': 'YEOSU',
-            'KRMOK': 'MOKPO',
-            'KRJES': 'JEJU'
-        }
+        self.port_codes = dict(PORT_CODES)
         
         # 설정 파일 찾기 및 로드
         self.find_and_load_config_files()
@@ -51,6 +62,10 @@ class ContainerConverter:
         # ITPS 관련 변수
         self.itps_file = None
         self.obl_file = None
+        self.obl_files = []
+
+        # 로드된 CLL 워크북 (드롭 시 한 번만 파싱하여 이후 단계에서 재사용)
+        self.current_cll = None
 
         self.setup_ui()
         self.reset_all()
@@ -65,15 +80,18 @@ class ContainerConverter:
         self.stowage_config_file = self.find_config_file(stow_filename)
         self.tpsz_config_file = self.find_config_file(tpsz_filename)
         
-        print(f"Stowage config file path: {self.stowage_config_file}")  # 디버깅용
+        _logger.debug("Stowage config file path: %s", self.stowage_config_file)
         
         # 설정 로드
         self.stowage_settings = self.load_stowage_settings()
-        print(f"Loaded stowage settings: {self.stowage_settings}")  # 디버깅용
+        _logger.debug("Loaded stowage settings: %s", self.stowage_settings)
         
         # stow_mapping을 직접 설정값으로 설정 (중간 딕셔너리 없이)
         self.stow_mapping = self.stowage_settings
-        print(f"Stow mapping: {self.stow_mapping}")  # 디버깅용
+        _logger.debug("Stow mapping: %s", self.stow_mapping)
+
+        # 서비스별 stow 매핑 인덱스 컴파일 (행마다 매핑 목록을 순회하지 않도록)
+        self.stow_indexes = compile_stow_indexes(self.stow_mapping)
         
         # TPSZ 설정 로드
         self.tpsz_settings = self.load_tpsz_settings()
@@ -88,25 +106,18 @@ class ContainerConverter:
 
     def find_config_file(self, filename: str) -> str:
         """설정 파일 찾기"""
-        # 가능한 경로들
-        possible_paths = [
-            os.path.join(self.desktop_path, filename),  # 일반 바탕화면
-            os.path.join(self.onedrive_desktop, filename),  # OneDrive 바탕화면
-            os.path.join(self.config_dir, filename)  # 설정 디렉토리
-        ]
-        
         # 존재하는 파일 찾기
-        for path in possible_paths:
-            if os.path.exists(path):
-                print(f"Found config file: {path}")  # 디버깅용
-                return path
+        path = locate_config_file(filename)
+        if path:
+            _logger.debug("Found config file: %s", path)
+            return path
         
         # 파일이 없으면 설정 디렉토리에 생성
         os.makedirs(self.config_dir, exist_ok=True)
         default_path = os.path.join(self.config_dir, filename)
         with open(default_path, 'w', encoding='utf-8') as f:
             json.dump({}, f, ensure_ascii=False, indent=2)
-        print(f"Created new config file: {default_path}")  # 디버깅용
+        _logger.info("Created new config file: %s", default_path)
         
         # 사용자에게 알림
         messagebox.showinfo(
@@ -122,10 +133,10 @@ class ContainerConverter:
         try:
             with open(self.stowage_config_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                print("Loaded Stowage settings:", data)  # 디버깅용
+                _logger.debug("Loaded Stowage settings: %s", data)
                 return data
         except Exception as e:
-            print(f"Error loading Stowage settings: {str(e)}")  # 디버깅용
+            _logger.exception("Error loading Stowage settings")
             messagebox.showerror("Error", f"Stowage 매핑 파일 로드 실패: {str(e)}")
             return {}
 
@@ -140,6 +151,9 @@ class ContainerConverter:
 
     def setup_ui(self):
         """UI 설정"""
+        # 하단 작업 상태 표시줄 (탭보다 먼저 배치해야 창 하단에 고정됨)
+        self.setup_status_bar()
+
         # 탭 컨트롤 생성
         self.tab_control = ttk.Notebook(self.root)
         self.tab_control.pack(expand=True, fill="both")
@@ -172,6 +186,127 @@ class ContainerConverter:
         self.update_stowage_preview()  # Stowage 탭 업데이트
         self.update_tpsz_preview()     # TpSZ 탭 업데이트
 
+    def setup_status_bar(self):
+        """백그라운드 작업 진행 상황 / 취소 버튼 표시줄"""
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side="bottom", fill="x", padx=5, pady=3)
+
+        self.job_status_label = ttk.Label(status_frame, text="대기 중")
+        self.job_status_label.pack(side="left", fill="x", expand=True)
+
+        self.job_cancel_button = ttk.Button(status_frame, text="취소", command=self.cancel_job, state="disabled")
+        self.job_cancel_button.pack(side="right", padx=5)
+
+        self.job_progress = ttk.Progressbar(status_frame, length=250, mode="determinate")
+        self.job_progress.pack(side="right", padx=5)
+
+        # 파싱 캐시 적중/미적중 횟수 (같은 파일을 다시 드롭하면 적중)
+        ttk.Button(status_frame, text="캐시 비우기", command=self.clear_parse_cache).pack(side="right", padx=5)
+        self.cache_status_label = ttk.Label(status_frame, text="")
+        self.cache_status_label.pack(side="right", padx=5)
+        self.update_cache_status()
+
+        # 마지막 작업의 단계별 소요 시간 보기
+        self.last_job_timer = None
+        self.job_timing_button = ttk.Button(status_frame, text="시간 상세", command=self.show_job_timings, state="disabled")
+        self.job_timing_button.pack(side="right", padx=5)
+
+        # 단계별 시간 JSON 로그 기록 여부 (OBL_TIMING_LOG 환경 변수로 기본 활성화)
+        self.timing_log_var = tk.BooleanVar(value=enable_timing_log_from_env() is not None)
+        ttk.Checkbutton(status_frame, text="시간 로그", variable=self.timing_log_var,
+                        command=self.toggle_timing_log).pack(side="right", padx=5)
+
+        # 중복 CtrNbr 처리 정책 (flag: Remark에 표시, drop: 두 번째 이후 행 제외), 모든 OBL 저장에 적용
+        self.duplicate_policy = tk.StringVar(value=DEFAULT_DUPLICATE_POLICY)
+        ttk.Combobox(status_frame, textvariable=self.duplicate_policy, values=DUPLICATE_POLICIES,
+                     state="readonly", width=5).pack(side="right", padx=(0, 5))
+        ttk.Label(status_frame, text="중복 CtrNbr").pack(side="right", padx=(5, 2))
+
+        self.jobs = JobRunner(self.root, on_progress=self.show_job_progress, on_finish=self.finish_job,
+                              on_timings=self.update_job_timings)
+
+    def start_job(self, name, func, *args, on_done=None, on_error=None, error_title="오류", error_prefix="", **kwargs):
+        """변환 작업을 백그라운드에서 실행 (결과 콜백은 메인 스레드에서 호출)"""
+        if on_error is None:
+            def on_error(e):
+                messagebox.showerror(error_title, f"{error_prefix}{str(e)}")
+
+        job = self.jobs.submit(name, func, *args, on_done=on_done, on_error=on_error, **kwargs)
+        if job is None:
+            messagebox.showwarning("경고", "다른 작업이 실행 중입니다. 완료되거나 취소된 후 다시 시도해주세요.")
+            return None
+
+        self.job_cancel_button.config(state="normal")
+        return job
+
+    def show_job_progress(self, job, stage, done=None, total=None):
+        """작업 단계 / 처리 행 수 표시"""
+        if total:
+            self.job_progress.config(mode="determinate", maximum=total, value=done or 0)
+            self.job_status_label.config(text=f"{job.name}: {stage} ({done or 0}/{total})")
+        else:
+            self.job_progress.config(mode="indeterminate")
+            self.job_progress.step(5)
+            self.job_status_label.config(text=f"{job.name}: {stage}")
+
+    def finish_job(self, job, outcome):
+        """작업 종료 후 상태 표시줄 초기화"""
+        self.job_cancel_button.config(state="disabled")
+        self.job_progress.config(mode="determinate", value=0)
+        status = {'done': "완료", 'error': "오류", 'cancelled': "취소됨"}[outcome]
+        self.job_status_label.config(text=f"{job.name}: {status}")
+
+    def update_job_timings(self, job):
+        """작업 종료 후 마지막 작업 타이밍 저장"""
+        self.last_job_timer = job.timer
+        self.job_timing_button.config(state="normal")
+        if job.timer.elapsed is not None:
+            self.job_status_label.config(text=f"{self.job_status_label.cget('text')} ({job.timer.elapsed:.2f}s)")
+        self.update_cache_status()
+
+    def update_cache_status(self):
+        """파싱 캐시 적중/미적중 횟수 표시"""
+        self.cache_status_label.config(text=f"캐시 적중 {CACHE_STATS['hits']} / 미적중 {CACHE_STATS['misses']}")
+
+    def clear_parse_cache(self):
+        """파싱 캐시 파일 모두 삭제"""
+        cache = ParseCache()
+        entries, size = cache.size()
+        if not messagebox.askyesno("확인", f"파싱 캐시 {entries}개 ({size / 1024 / 1024:.1f}MB)를 삭제하시겠습니까?"):
+            return
+        cache.clear()
+        messagebox.showinfo("완료", "파싱 캐시를 삭제했습니다.")
+
+    def show_job_timings(self):
+        """마지막 작업의 단계별 소요 시간 표시"""
+        if self.last_job_timer is None:
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("작업 단계별 소요 시간")
+        dialog.geometry("420x300")
+
+        text = tk.Text(dialog, font=('Courier', 10))
+        text.pack(fill="both", expand=True, padx=5, pady=5)
+        text.insert(tk.END, self.last_job_timer.format_breakdown())
+        text.config(state="disabled")
+
+        ttk.Button(dialog, text="닫기", command=dialog.destroy).pack(pady=5)
+
+    def toggle_timing_log(self):
+        """단계별 시간 JSON 로그 켜기/끄기"""
+        if self.timing_log_var.get():
+            path = enable_timing_log()
+            self.job_status_label.config(text=f"시간 로그 기록: {path}")
+        else:
+            disable_timing_log()
+            self.job_status_label.config(text="시간 로그 기록 중지")
+
+    def cancel_job(self):
+        """실행 중인 작업 취소 요청"""
+        self.jobs.cancel()
+        self.job_status_label.config(text="취소 요청 중...")
+
     def setup_single_tab(self):
         # 단일 CLL 변환 탭 설정
         left_frame = ttk.Frame(self.single_tab)
@@ -340,33 +475,27 @@ class ContainerConverter:
         files_frame = ttk.Frame(left_frame)
         files_frame.pack(pady=10, padx=10, fill="x")
 
-        # Master CLL 파일 프레임
-        self.master_frame = ttk.LabelFrame(files_frame, text="첫 번째(Master) CLL 파일")
-        self.master_frame.pack(pady=5, padx=5, fill="x")
-        
-        self.master_label = ttk.Label(self.master_frame, text="CLL 파일을 여기에 드롭하세요")
-        self.master_label.pack(pady=10)
-        
-        self.master_path_label = ttk.Label(self.master_frame, text="파일 경로: 없음")
-        self.master_path_label.pack(pady=5)
-        
-        # Master 파일 드롭 영역 바인딩
-        self.master_frame.drop_target_register(DND_FILES)
-        self.master_frame.dnd_bind('<<Drop>>', self.drop_master_cll)
+        # CLL 파일 목록 프레임 (여러 파일을 한 번에 또는 차례로 드롭)
+        self.multi_files_frame = ttk.LabelFrame(files_frame, text="병합할 CLL 파일")
+        self.multi_files_frame.pack(pady=5, padx=5, fill="both", expand=True)
 
-        # Slave CLL 파일 프레임
-        self.slave_frame = ttk.LabelFrame(files_frame, text="두 번째(Slave) CLL 파일")
-        self.slave_frame.pack(pady=5, padx=5, fill="x")
-        
-        self.slave_label = ttk.Label(self.slave_frame, text="CLL 파일을 여기에 드롭하세요")
-        self.slave_label.pack(pady=10)
-        
-        self.slave_path_label = ttk.Label(self.slave_frame, text="파일 경로: 없음")
-        self.slave_path_label.pack(pady=5)
-        
-        # Slave 파일 드롭 영역 바인딩
-        self.slave_frame.drop_target_register(DND_FILES)
-        self.slave_frame.dnd_bind('<<Drop>>', self.drop_slave_cll)
+        self.multi_drop_label = ttk.Label(self.multi_files_frame, text="CLL 파일들을 여기에 드롭하세요 (여러 개 가능)")
+        self.multi_drop_label.pack(pady=10)
+
+        self.multi_file_listbox = tk.Listbox(self.multi_files_frame, height=8, selectmode=tk.EXTENDED)
+        self.multi_file_listbox.pack(pady=5, padx=5, fill="both", expand=True)
+
+        # 파일 목록 드롭 영역 바인딩
+        for widget in (self.multi_files_frame, self.multi_file_listbox):
+            widget.drop_target_register(DND_FILES)
+            widget.dnd_bind('<<Drop>>', self.drop_multi_cll)
+
+        multi_button_frame = ttk.Frame(self.multi_files_frame)
+        multi_button_frame.pack(pady=5, fill="x")
+
+        ttk.Button(multi_button_frame, text="병합", command=self.combine_cll_files).pack(side=tk.LEFT, padx=5)
+        ttk.Button(multi_button_frame, text="선택 삭제", command=self.remove_multi_cll).pack(side=tk.LEFT, padx=5)
+        ttk.Button(multi_button_frame, text="목록 지우기", command=self.clear_multi_cll).pack(side=tk.LEFT, padx=5)
 
         # 결과 정보 프레임
         self.result_frame = ttk.LabelFrame(right_frame, text="변환 결과")
@@ -420,7 +549,7 @@ class ContainerConverter:
         obl_drop_frame = ttk.LabelFrame(left_frame, text="OBL 파일 드롭")
         obl_drop_frame.pack(pady=10, padx=10, fill="x")
 
-        self.obl_drop_label = ttk.Label(obl_drop_frame, text="OBL 파일을 여기에 드롭하세요")
+        self.obl_drop_label = ttk.Label(obl_drop_frame, text="OBL 파일을 여기에 드롭하세요\n(여러 개면 ITPS를 POL/TOL별로 나눠 추가)")
         self.obl_drop_label.pack(pady=20)
 
         # OBL 드래그 앤 드롭 바인딩
@@ -465,7 +594,7 @@ class ContainerConverter:
         save_button.pack(pady=10)
 
         # 초기 미리보기 내용 설정
-        print("Setting up Stowage preview with mapping:", self.stow_mapping)  # 디버깅용
+        _logger.debug("Setting up Stowage preview with mapping: %s", self.stow_mapping)
         preview_text = "=== 현재 매핑 ===\n"
         if self.stow_mapping:
             for service_name, mappings in self.stow_mapping.items():
@@ -518,10 +647,10 @@ class ContainerConverter:
             return
 
         try:
-            # 엑셀 파일 읽기
-            df_check = pd.read_excel(file_path, header=None)
+            # 엑셀 파일 읽기 (터미널 코드와 데이터를 한 번에 파싱)
+            cll = load_cll(file_path)
             # 4행 12열의 값 가져오기 (0-based index이므로 3, 11)
-            terminal_code = str(df_check.iloc[3, 11]).strip()
+            terminal_code = cll.terminal_code
 
             if not terminal_code:
                 messagebox.showerror("오류", "(4,12) 위치에서 터미널 코드를 찾을 수 없습니다.")
@@ -552,11 +681,11 @@ class ContainerConverter:
                 else:
                     btn.configure(bg='SystemButtonFace')
 
-            # CLL 데이터 읽기
-            df = pd.read_excel(file_path, header=4)
+            # CLL 데이터 (이미 파싱된 결과 사용)
+            df = cll.data
             
             # POD 목록 추출 및 매칭되는 서비스 찾기
-            pod_list = df['POD'].unique().tolist()
+            pod_list = cll.pod_list()
             matching_services = self.find_matching_services(pod_list)
             
             if not matching_services:
@@ -573,6 +702,7 @@ class ContainerConverter:
             self.selected_service.set(selected_service)
 
             self.current_file = file_path
+            self.current_cll = cll
             self.input_label.config(text=f"입력 파일: {os.path.basename(file_path)}")
             
             # 단일 탭의 Summary 업데이트
@@ -606,15 +736,13 @@ class ContainerConverter:
     def add_empty_to_obl(self):
         """기존 OBL에 EMPTY 컨테이너 추가"""
         # OBL 파일 읽기
-        obl_df = pd.read_excel(self.current_file)
+        obl_df = normalize_obl_columns(pd.read_excel(self.current_file))
 
         # 기존 OBL의 컬럼 목록 가져오기
         existing_columns = obl_df.columns.tolist()
 
-        # EMPTY 컨테이너 추가
-        new_rows = []
-        empty_container_num = 1  # 컨테이너 번호 시작값
-        
+        # EMPTY 컨테이너 추가 (잘못된 입력은 조용히 건너뛰기)
+        empty_entries = []
         for pod_entry, sztp_entry, qty_entry in self.empty_entries:
             pod = pod_entry.get()
             sztp = sztp_entry.get()
@@ -622,64 +750,27 @@ class ContainerConverter:
 
             if pod not in ["POD", ""] and sztp not in ["SzTp", ""] and qty not in ["수량", ""]:
                 try:
-                    qty = int(qty)
-                    # SzTp를 정수로 변환
-                    sztp = int(sztp)
-                    
-                    # SzTp에 따른 무게 설정
-                    if str(sztp).startswith('2'):
-                        weight = 2500
-                    elif str(sztp).startswith('4'):
-                        weight = 4500
-                    else:
-                        weight = 0
-
-                    for i in range(qty):
-                        # 기존 컬럼 구조를 따르는 빈 딕셔너리 생성
-                        empty_row = {col: '' for col in existing_columns}
-
-                        # 마지막 No 값 계산
-                        last_no = len(obl_df) + len(new_rows) + 1
-
-                        # EMPTY 컨테이너 번호 생성
-                        ctr_nbr = f"MSCU{empty_container_num:07d}"
-                        empty_container_num += 1
-
-                        # 필요한 필드만 업데이트
-                        empty_row.update({
-                            'No': last_no,
-                            'CtrNbr': ctr_nbr,  # 컨테이너 번호 설정
-                            'ShOwn': 'N',
-                            'Opr': 'MSC',
-                            'POR': self.selected_pol.get(),
-                            'POL': self.selected_pol.get(),
-                            'TOL': self.selected_tol.get(),
-                            'POD': pod,
-                            'FPOD': pod,  # POD와 동일한 값으로 설정
-                            'SzTp': sztp,
-                            'Wgt': weight,  # SzTp에 따른 무게 설정
-                            'ForE': 'E',
-                            'Rfopr': 'N',
-                            'Door': 'C',
-                            'CustH': 'N',
-                            'Fumi': 'N',
-                            'VGM': 'Y',
-                            'Stow': self.stow_mapping.get(pod, '')  # FPOD(POD)에 대한 Stow 코드
-                        })
-                        new_rows.append(empty_row)
+                    empty_entries.append((pod, int(sztp), int(qty)))
                 except ValueError:
-                    continue  # 잘못된 입력은 조용히 건너뛰기
+                    continue
+
+        new_rows = build_empty_frame(empty_entries, self.selected_pol.get(), self.selected_tol.get(),
+                                     start_no=len(obl_df) + 1,
+                                     weights=ADDED_EMPTY_WEIGHTS,
+                                     used_ctr_nbrs=obl_df['CtrNbr'] if 'CtrNbr' in obl_df.columns else ())
 
         # 새로운 EMPTY 컨테이너 추가
-        if new_rows:
-            new_df = pd.DataFrame(new_rows, columns=existing_columns)
+        if not new_rows.empty:
+            new_df = new_rows.reindex(columns=existing_columns, fill_value='')
             obl_df = pd.concat([obl_df, new_df], ignore_index=True)
 
             # 파일 저장
             input_dir = os.path.dirname(self.current_file)
             base_name = os.path.splitext(os.path.basename(self.current_file))[0]
             output_file = os.path.join(input_dir, f"{base_name}_EMPTY_ADDED.xlsx")
-            obl_df.to_excel(output_file, index=False)
+            check = DuplicateCheck(self.duplicate_policy.get())
+            obl_df = check.apply(obl_df)
+            write_obl(obl_df, output_file, duplicates=None)
 
             self.output_file = output_file
             self.output_label.config(text=f"출력 파일: {output_file}")
@@ -687,7 +778,15 @@ class ContainerConverter:
             # Summary 업데이트
             self.update_summary(obl_df)
 
-            messagebox.showinfo("성공", "EMPTY 컨테이너가 추가되었습니다.")
+            messagebox.showinfo("성공", "EMPTY 컨테이너가 추가되었습니다."
+                                + self.duplicate_notice(check.summary(), check.policy))
+
+    def duplicate_notice(self, duplicates, policy=DEFAULT_DUPLICATE_POLICY):
+        """완료 메시지에 붙이는 중복 CtrNbr 안내 (없으면 빈 문자열)"""
+        if not duplicates:
+            return ""
+        handled = "중복 행 제외" if policy == 'drop' else "Remark에 표시"
+        return f"\n\n중복 CtrNbr {len(duplicates)}개 ({handled}):\n{format_duplicates(duplicates)}"
 
     def update_summary(self, df):
         """컨테이너 요약 정보 업데이트"""
@@ -751,198 +850,73 @@ class ContainerConverter:
                 messagebox.showwarning("경고", "Service Name을 선택해주세요!")
                 return
 
-            # CLL 파일 읽기
-            cll_df = pd.read_excel(self.current_file, header=4)
-
-            # 선택된 서비스의 매핑 가져오기
-            service_mappings = self.stow_mapping.get(selected_service, [])
-
-            # OBL 데이터프레임 생성
-            obl_data = []
-
-            # CLL 데이터 변환
-            for idx, row in cll_df.iterrows():
-                # OPT가 비어있으면 선택된 POL 값 사용
-                por_value = row['OPT'] if pd.notna(row['OPT']) and row['OPT'] != '' else self.selected_pol.get()
-
-                # POD와 FPOD 처리
-                pod = str(row['POD']) if pd.notna(row['POD']) else ''
-                fpod = str(row['FDP']) if pd.notna(row['FDP']) else ''  # FPOD는 CLL의 FDP 값 사용
-                
-                # 초기값 설정
-                mapped_port = pod  # POD 초기값
-                mapped_stow = ''   # Stow 초기값
-                
-                # POD가 stow_code와 일치하는지 확인
-                for mapping in service_mappings:
-                    if pod.upper() == mapping['stow_code'].upper():
-                        mapped_port = mapping['port']      # POD를 port 값으로 설정
-                        mapped_stow = mapping['stow_code'] # Stow를 stow_code 값으로 설정
-                        break
+            # 선택된 서비스의 매핑 인덱스 가져오기
+            stow_index = self.get_stow_index(selected_service)
+
+            # 입력값은 메인 스레드에서 미리 읽어 둔다
+            pol = self.selected_pol.get()
+            tol = self.selected_tol.get()
+            empty_entries = self.read_empty_entries()
+            cll_file = self.current_file
+            output_file = cll_output_path(cll_file)
+            # 드롭 시 파싱된 워크북 (작업 스레드에서는 self 상태를 바꾸지 않는다)
+            parsed_cll = self.parsed_cll(cll_file)
+            policy = self.duplicate_policy.get()
+
+            def task(progress):
+                cll = parsed_cll or load_cll(cll_file)
+                cll_df = cll.data
+
+                # CLL 데이터 변환 (청크 단위로 변환하면서 저장, EMPTY 컨테이너 포함)
+                chunks = iter_cll_obl_chunks(cll_df, pol, tol, stow_index, empty_entries, progress=progress)
+                check = DuplicateCheck(policy)
+                write_obl(chunks, output_file, progress, check)
+                return cll, check.summary()
+
+            def on_done(result):
+                cll, duplicates = result
+                cll_df = cll.data
+                if self.current_file == cll_file:
+                    self.current_cll = cll
+                self.output_file = output_file
+                self.output_label.config(text=f"출력 파일: {output_file}")
+
+                # 단일 탭의 Summary만 업데이트
+                with stage('summary_render', len(cll_df)):
+                    self.update_single_summary(cll_df)
+
+                messagebox.showinfo("성공", "변환이 완료되었습니다." + self.duplicate_notice(duplicates, policy))
+
+            self.start_job("CLL 변환", task, on_done=on_done,
+                           error_title="Error", error_prefix="변환 중 오류 발생: ")
 
-                obl_row = {
-                    'No': idx + 1,
-                    'CtrNbr': row['CNTR NO'],
-                    'ShOwn': 'N',
-                    'Opr': 'MSC',
-                    'POR': por_value,
-                    'POL': self.selected_pol.get(),
-                    'TOL': self.selected_tol.get(),
-                    'POD': mapped_port,
-                    'TOD': '',
-                    'Stow': mapped_stow,
-                    'FPOD': fpod,  # FPOD는 원래 값 유지
-                    'SzTp': int(row['T&S']) if pd.notna(row['T&S']) else '',
-                    'Wgt': int(row['WGT']) if pd.notna(row['WGT']) else '',
-                    'ForE': row['F/E'],
-                    'Lbl': '',
-                    'Rfopr': 'N',
-                    'Rftemp': row['R/F'].replace(' CEL', '') if pd.notna(row['R/F']) else '',
-                    'OvDH': row['OH'],
-                    'OvDF': row['OL'] / 2 if pd.notna(row['OL']) and row['OL'] != 0 else '',
-                    'OvDA': row['OL'] / 2 if pd.notna(row['OL']) and row['OL'] != 0 else '',
-                    'OvDP': row['OW'] / 2 if pd.notna(row['OW']) and row['OW'] != 0 else '',
-                    'OvDS': row['OW'] / 2 if pd.notna(row['OW']) and row['OW'] != 0 else '',
-                    'OvSH': '',
-                    'OvSF': '',
-                    'OvSA': '',
-                    'OvSP': '',
-                    'OvSS': '',
-                    'BL': '',
-                    'HI': '',
-                    'AC': '',
-                    'Flip': '',
-                    'Door': 'C',
-                    'CustH': 'N',
-                    'LenBB': '',
-                    'BrthBB': '',
-                    'HgtBB': '',
-                    'WgtBB': '',
-                    'Fumi': 'N',
-                    'FuDt': '',
-                    'VenDt': '',
-                    'Venti': '',
-                    'Damag': '',
-                    'PPK': '',
-                    'Food': '',
-                    'Resi': '',
-                    'Book': '',
-                    'Cold': '',
-                    'Catm': '',
-                    'VGM': 'Y',
-                    'VGM Weighting Method': '',
-                    'HVC': '',
-                    'BN1': '',
-                    'BN2': '',
-                    'BN3': '',
-                    'BN4': '',
-                    'Harmonised system codes': '',
-                    'Description': '',
-                    'Flexitank': '',
-                    'UNNO': row['UNDG'],
-                    'Class': row['IMDG'],
-                    'PSN': '',
-                    'N.Weight': '',
-                    'S.Risk1': '',
-                    'S.Risk2': '',
-                    'S.Risk3': '',
-                    'P.Group': '',
-                    'LQ': '',
-                    'EQ': '',
-                    'FP': '',
-                    'IMDG Remark': '',
-                    'Sub Index': '',
-                    'Inf type': '',
-                    'Address': '',
-                    'Street': '',
-                    'City': '',
-                    'Postal Code': '',
-                    'Country Code': '',
-                    'Country': '',
-                    'Sub Index_1': '',  # 첫 번째 Sub Index 열
-                    'Remark': ''
-                }
-                obl_data.append(obl_row)
-
-            # EMPTY 컨테이너 추가 로직
-            last_no = len(obl_data)
-            empty_container_num = 1
-            for pod_entry, sztp_entry, qty_entry in self.empty_entries:
-                pod = pod_entry.get()
-                sztp = sztp_entry.get()
-                qty = qty_entry.get()
-
-                if pod not in ["POD", ""] and sztp not in ["SzTp", ""] and qty not in ["수량", ""]:
-                    try:
-                        qty = int(qty)
-                        for i in range(qty):
-                            empty_row = dict.fromkeys(obl_data[0].keys(), '')
-                            
-                            # POD에 대한 매핑 확인
-                            mapped_port = pod
-                            mapped_stow = ''
-                            
-                            # POD가 stow_code와 일치하는지 확인
-                            for mapping in service_mappings:
-                                if pod.upper() == mapping['stow_code'].upper():
-                                    # stow_code가 일치하면 해당 port를 POD로 사용
-                                    mapped_port = mapping['port']
-                                    mapped_stow = mapping['stow_code']
-                                    break
-                                elif pod.upper() == mapping['port'].upper():
-                                    # port가 일치하면 해당 stow_code 사용
-                                    mapped_port = mapping['port']
-                                    mapped_stow = mapping['stow_code']
-                                    break
-                            
-                            empty_row.update({
-                                'No': last_no + 1,
-                                'CtrNbr': f"MSCU{empty_container_num:07d}",
-                                'ShOwn': 'N',
-                                'Opr': 'MSC',
-                                'POR': self.selected_pol.get(),
-                                'POL': self.selected_pol.get(),
-                                'TOL': self.selected_tol.get(),
-                                'POD': mapped_port,
-                                'FPOD': mapped_port,
-                                'SzTp': int(sztp),
-                                'Wgt': int(2500 if str(sztp).startswith('2') else 4700 if str(sztp).startswith('4') else 0),
-                                'ForE': 'E',
-                                'Rfopr': 'N',
-                                'Door': 'C',
-                                'CustH': 'N',
-                                'Fumi': 'N',
-                                'VGM': 'Y',
-                                'Stow': mapped_stow
-                            })
-                            obl_data.append(empty_row)
-                            last_no += 1
-                            empty_container_num += 1
-                    except ValueError:
-                        messagebox.showwarning("경고", f"잘못된 수량 형식: {qty}")
-
-            # OBL 데이터프레임 생성
-            obl_df = pd.DataFrame(obl_data)
+        except Exception as e:
+            messagebox.showerror("Error", f"변환 중 오류 발생: {str(e)}")
 
-            # 파일 저장
-            input_dir = os.path.dirname(self.current_file)
-            base_name = os.path.splitext(os.path.basename(self.current_file))[0]
-            output_file = os.path.join(input_dir, f"{base_name}_OBL.xlsx")
-            obl_df = obl_df.rename(columns={
-                'Sub Index_1': 'Sub Index'
-            })
-            obl_df.to_excel(output_file, index=False)
+    def get_stow_index(self, service_name):
+        """서비스의 컴파일된 stow 매핑 인덱스 반환"""
+        return self.stow_indexes.get(service_name, EMPTY_STOW_INDEX)
 
-            self.output_file = output_file
-            self.output_label.config(text=f"출력 파일: {output_file}")
+    def read_empty_entries(self):
+        """EMPTY 컨테이너 입력란에서 [(POD, SzTp, 수량), ...] 목록 읽기"""
+        entries = []
+        for pod_entry, sztp_entry, qty_entry in self.empty_entries:
+            pod = pod_entry.get()
+            sztp = sztp_entry.get()
+            qty = qty_entry.get()
 
-            # 단일 탭의 Summary만 업데이트
-            self.update_single_summary(cll_df)
-            
-            messagebox.showinfo("성공", "변환이 완료되었습니다.")
+            if pod not in ["POD", ""] and sztp not in ["SzTp", ""] and qty not in ["수량", ""]:
+                try:
+                    entries.append((pod, int(sztp), int(qty)))
+                except ValueError:
+                    messagebox.showwarning("경고", f"잘못된 수량 형식: {qty}")
+        return entries
 
-        except Exception as e:
-            messagebox.showerror("Error", f"변환 중 오류 발생: {str(e)}")
+    def parsed_cll(self, file_path):
+        """드롭 시 파싱해 둔 CLL 워크북 (다른 파일이거나 없으면 None, 메인 스레드에서 호출)"""
+        if self.current_cll is not None and self.current_cll.file_path == file_path:
+            return self.current_cll
+        return None
 
     def update_single_summary(self, df):
         """단일 CLL 파일의 Container Summary 업데이트"""
@@ -995,79 +969,46 @@ class ContainerConverter:
             self.single_summary_text.insert(tk.END, summary_text)
             
         except Exception as e:
-            print(f"Summary 생성 중 오류 발생: {str(e)}")  # 디버깅용
+            _logger.exception("Summary 생성 중 오류 발생")
             self.single_summary_text.delete(1.0, tk.END)
             self.single_summary_text.insert(tk.END, "단일 CLL 탭에서 파일 변환 시 Summary가 표시됩니다.")
 
-    def drop_master_cll(self, event):
-        """Master CLL 파일 드롭 처리"""
-        file_path = event.data.strip('{}').strip('"')
-        if not os.path.exists(file_path):
-            messagebox.showerror("오류", "파일이 존재하지 않습니다.")
-            return
-
-        try:
-            # 엑셀 파일 읽기
-            df_check = pd.read_excel(file_path, header=None)
-            # 4행 12열의 값 가져오기 (0-based index이므로 3, 11)
-            terminal_code = str(df_check.iloc[3, 11]).strip()
-
-            if not terminal_code:
-                messagebox.showerror("오류", "(4,12) 위치에서 터미널 코드를 찾을 수 없습니다.")
-                return
-
-            # 터미널 코드를 기반으로 POL, TOL 값 자동 설정
-            port_info = self.terminal_to_port_mapping(terminal_code)
-            
-            if not port_info['pol'] or not port_info['tol']:
-                messagebox.showerror("오류", f"터미널 코드 '{terminal_code}'에 대한 매핑을 찾을 수 없습니다.")
-                return
-
-            # POL, TOL 설정
-            self.selected_pol.set(port_info['pol'])
-            self.selected_tol.set(port_info['tol'])
-
-            # Multi 탭의 POL 버튼 색상만 업데이트
-            for port, btn in self.multi_pol_buttons.items():
-                if port == port_info['pol']:
-                    btn.configure(bg='yellow')
-                else:
-                    btn.configure(bg='SystemButtonFace')
-
-            # Multi 탭의 TOL 버튼 색상만 업데이트
-            for btn_text, value in self.tol_values.items():
-                if value == port_info['tol']:
-                    self.multi_tol_buttons[btn_text].configure(bg='yellow')
-                else:
-                    self.multi_tol_buttons[btn_text].configure(bg='SystemButtonFace')
-
-            self.master_file = file_path
-            self.master_path_label.config(text=f"파일 경로: {file_path}")
-            self.master_label.config(text="Master 파일이 선택되었습니다")
-            
-            # Slave 프레임 활성화
-            self.slave_frame.pack(pady=10, padx=10, fill="x")
-
-        except Exception as e:
-            messagebox.showerror("오류", f"파일 처리 중 오류가 발생했습니다: {str(e)}")
-
-    def drop_slave_cll(self, event):
-        """Slave CLL 파일 드롭 처리"""
-        if not hasattr(self, 'master_file'):
-            messagebox.showwarning("경고", "Master 파일을 먼저 선택해주세요!")
-            return
-
-        file_path = event.data.strip('{}').strip('"')
-        if not os.path.exists(file_path):
-            messagebox.showerror("오류", "파일이 존재하지 않습니다.")
-            return
-
-        self.slave_file = file_path
-        self.slave_path_label.config(text=f"파일 경로: {file_path}")
-        self.slave_label.config(text="Slave 파일이 선택되었습니다")
-        
-        # Slave 파일이 선택되면 바로 병합 처리 시작
-        self.combine_cll_files()
+    def drop_multi_cll(self, event):
+        """병합할 CLL 파일 드롭 처리 (여러 파일 동시 드롭 가능)"""
+        added = 0
+        for file_path in self.root.tk.splitlist(event.data):
+            file_path = file_path.strip('"')
+            if not os.path.exists(file_path):
+                messagebox.showerror("오류", f"파일이 존재하지 않습니다: {file_path}")
+                continue
+            if file_path in self.multi_files:
+                continue
+            self.multi_files.append(file_path)
+            self.multi_file_listbox.insert(tk.END, os.path.basename(file_path))
+            added += 1
+
+        if added:
+            self.multi_drop_label.config(text=f"{len(self.multi_files)}개 파일이 선택되었습니다")
+
+    def remove_multi_cll(self):
+        """목록에서 선택한 CLL 파일 제거"""
+        for index in reversed(self.multi_file_listbox.curselection()):
+            self.multi_file_listbox.delete(index)
+            del self.multi_files[index]
+        self.multi_drop_label.config(text=f"{len(self.multi_files)}개 파일이 선택되었습니다")
+
+    def clear_multi_cll(self):
+        """병합할 CLL 파일 목록 초기화"""
+        self.multi_files = []
+        self.multi_file_listbox.delete(0, tk.END)
+        self.multi_drop_label.config(text="CLL 파일들을 여기에 드롭하세요 (여러 개 가능)")
+
+    def highlight_multi_ports(self, pol, tols):
+        """Multi 탭의 POL/TOL 버튼 색상 업데이트"""
+        for port, btn in self.multi_pol_buttons.items():
+            btn.configure(bg='yellow' if port == pol else 'SystemButtonFace')
+        for btn_text, value in self.tol_values.items():
+            self.multi_tol_buttons[btn_text].configure(bg='yellow' if value in tols else 'SystemButtonFace')
 
     def select_multi_pol(self, port):
         """Multi 탭 POL 버튼 선택 처리"""
@@ -1090,14 +1031,27 @@ class ContainerConverter:
                 self.multi_tol_buttons[btn_text].configure(bg='yellow')
 
     def combine_cll_files(self):
-        """Master와 Slave CLL 파일 병합"""
+        """목록의 CLL 파일들을 병렬로 읽어 하나의 OBL로 병합"""
+        if len(self.multi_files) < 2:
+            messagebox.showwarning("경고", "병합할 CLL 파일을 2개 이상 드롭해주세요!")
+            return
+
+        file_paths = list(self.multi_files)
+        self.start_job("CLL 읽기", load_cll_files, file_paths, on_done=self.merge_loaded_clls,
+                       error_prefix="파일 처리 중 오류가 발생했습니다: ")
+
+    def merge_loaded_clls(self, clls):
+        """파싱된 CLL들의 POL/TOL 확인, 서비스 선택 후 병합 작업 시작"""
         try:
-            # Master와 Slave 파일의 POD 목록 추출
-            master_df = pd.read_excel(self.master_file, header=4)
-            slave_df = pd.read_excel(self.slave_file, header=4)
-            
-            # 두 파일의 POD 목록 합치기
-            pod_list = list(set(master_df['POD'].unique().tolist() + slave_df['POD'].unique().tolist()))
+            # 터미널 코드 기준 POL 일치 확인 (매핑이 없는 터미널은 선택된 POL/TOL 사용)
+            pol, tols = merge_port_info(clls, self.selected_pol.get(), self.selected_tol.get())
+            self.selected_pol.set(pol)
+            if len(set(tols)) == 1:
+                self.selected_tol.set(tols[0])
+            self.highlight_multi_ports(pol, tols)
+
+            # 모든 파일의 POD 목록 합치기
+            pod_list = list(set(pod for cll in clls for pod in cll.pod_list()))
             
             # 매칭되는 서비스 찾기
             matching_services = self.find_matching_services(pod_list)
@@ -1115,151 +1069,44 @@ class ContainerConverter:
             # 선택된 서비스 저장
             self.selected_service.set(selected_service)
 
-            def process_cll_file(file_path, start_row):
-                cll_df = pd.read_excel(file_path, header=4)
-                processed_data = []
-                row_count = start_row
-
-                # 선택된 서비스의 매핑 가져오기
-                service_mappings = self.stow_mapping.get(selected_service, [])
-
-                for idx, row in cll_df.iterrows():
-                    if pd.notna(row['CNTR NO']):
-                        # POD 값 가져오기
-                        pod = str(row['POD']) if pd.notna(row['POD']) else ''
-                        fpod = str(row['FDP']) if pd.notna(row['FDP']) else ''
-                        
-                        # 초기값 설정
-                        mapped_port = pod
-                        mapped_stow = ''
-                        
-                        # POD가 stow_code와 일치하는지 확인
-                        for mapping in service_mappings:
-                            if pod.upper() == mapping['stow_code'].upper():
-                                mapped_port = mapping['port']
-                                mapped_stow = mapping['stow_code']
-                                break
-                            elif pod.upper() == mapping['port'].upper():
-                                mapped_port = mapping['port']
-                                mapped_stow = mapping['stow_code']
-                                break
-
-                        obl_row = {
-                            'No': row_count,
-                            'CtrNbr': row['CNTR NO'],
-                            'ShOwn': 'N',
-                            'Opr': 'MSC',
-                            'POR': row['OPT'] if pd.notna(row['OPT']) else self.selected_pol.get(),
-                            'POL': self.selected_pol.get(),
-                            'TOL': self.selected_tol.get(),
-                            'POD': mapped_port,
-                            'TOD': '',
-                            'Stow': mapped_stow,
-                            'FPOD': fpod,
-                            'SzTp': int(row['T&S']) if pd.notna(row['T&S']) else '',
-                            'Wgt': int(row['WGT']) if pd.notna(row['WGT']) else '',
-                            'ForE': row['F/E'],
-                            'Lbl': '',
-                            'Rfopr': 'N',
-                            'Rftemp': row['R/F'].replace(' CEL', '') if pd.notna(row['R/F']) else '',
-                            'OvDH': row['OH'],
-                            'OvDF': row['OL'] / 2 if pd.notna(row['OL']) and row['OL'] != 0 else '',
-                            'OvDA': row['OL'] / 2 if pd.notna(row['OL']) and row['OL'] != 0 else '',
-                            'OvDP': row['OW'] / 2 if pd.notna(row['OW']) and row['OW'] != 0 else '',
-                            'OvDS': row['OW'] / 2 if pd.notna(row['OW']) and row['OW'] != 0 else '',
-                            'OvSH': '',
-                            'OvSF': '',
-                            'OvSA': '',
-                            'OvSP': '',
-                            'OvSS': '',
-                            'BL': '',
-                            'HI': '',
-                            'AC': '',
-                            'Flip': '',
-                            'Door': 'C',
-                            'CustH': 'N',
-                            'LenBB': '',
-                            'BrthBB': '',
-                            'HgtBB': '',
-                            'WgtBB': '',
-                            'Fumi': 'N',
-                            'FuDt': '',
-                            'VenDt': '',
-                            'Venti': '',
-                            'Damag': '',
-                            'PPK': '',
-                            'Food': '',
-                            'Resi': '',
-                            'Book': '',
-                            'Cold': '',
-                            'Catm': '',
-                            'VGM': 'Y',
-                            'VGM Weighting Method': '',
-                            'HVC': '',
-                            'BN1': '',
-                            'BN2': '',
-                            'BN3': '',
-                            'BN4': '',
-                            'Harmonised system codes': '',
-                            'Description': '',
-                            'Flexitank': '',
-                            'UNNO': row['UNDG'],
-                            'Class': row['IMDG'],
-                            'PSN': '',
-                            'N.Weight': '',
-                            'S.Risk1': '',
-                            'S.Risk2': '',
-                            'S.Risk3': '',
-                            'P.Group': '',
-                            'LQ': '',
-                            'EQ': '',
-                            'FP': '',
-                            'IMDG Remark': '',
-                            'Sub Index': '',
-                            'Inf type': '',
-                            'Address': '',
-                            'Street': '',
-                            'City': '',
-                            'Postal Code': '',
-                            'Country Code': '',
-                            'Country': '',
-                            'Sub Index_1': '',  # 첫 번째 Sub Index 열
-                            'Remark': ''
-                        }
-                        processed_data.append(obl_row)
-                        row_count += 1
-                return processed_data
-
-            # Master와 Slave 파일 처리
-            master_data = process_cll_file(self.master_file, 1)
-            slave_data = process_cll_file(self.slave_file, len(master_data) + 1)
-            
-            all_data = master_data + slave_data
-            
-            # DataFrame 생성 및 저장
-            combined_df = pd.DataFrame(all_data)
-            save_dir = os.path.dirname(self.master_file)
+            # 전체 CLL을 한 번에 변환 (연속된 번호 부여)
+            stow_index = self.get_stow_index(selected_service)
+            save_dir = os.path.dirname(clls[0].file_path)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = os.path.join(save_dir, f"Combined_OBL_{timestamp}.xlsx")
-            
-            # 파일 저장
-            combined_df.to_excel(output_file, index=False)
-            
-            # 결과 표시
-            self.result_label.config(text=f"출력 파일: {output_file}")
-            
-            # 멀티 탭의 Summary만 업데이트
-            self.update_multi_summary(combined_df)
-            
-            # 단일 탭의 Summary는 초기화
-            if hasattr(self, 'single_summary_text'):
-                self.single_summary_text.delete(1.0, tk.END)
-                self.single_summary_text.insert(tk.END, "단일 CLL 탭에서 파일 변환 시 Summary가 표시됩니다.")
-            
-            messagebox.showinfo("성공", f"CLL 파일들이 성공적으로 병합되었습니다.\n총 {len(all_data)}개의 컨테이너가 처리되었습니다.")
-            
+            cll_frames = [cll.data for cll in clls]
+            policy = self.duplicate_policy.get()
+
+            def task(progress):
+                combined_df = combine_cll_frames(cll_frames, pol, tols, stow_index, progress)
+
+                # 겹치는 CLL의 중복 컨테이너 확인 후 파일 저장
+                check = DuplicateCheck(policy)
+                combined_df = check.apply(combined_df)
+                write_obl(combined_df, output_file, progress, None)
+                return combined_df, check.summary()
+
+            def on_done(result):
+                combined_df, duplicates = result
+                # 결과 표시
+                self.result_label.config(text=f"출력 파일: {output_file}")
+
+                # 멀티 탭의 Summary만 업데이트
+                with stage('summary_render', len(combined_df)):
+                    self.update_multi_summary(combined_df)
+
+                # 단일 탭의 Summary는 초기화
+                if hasattr(self, 'single_summary_text'):
+                    self.single_summary_text.delete(1.0, tk.END)
+                    self.single_summary_text.insert(tk.END, "단일 CLL 탭에서 파일 변환 시 Summary가 표시됩니다.")
+
+                messagebox.showinfo("성공", f"CLL 파일 {len(clls)}개가 성공적으로 병합되었습니다.\n총 {len(combined_df)}개의 컨테이너가 처리되었습니다."
+                                    + self.duplicate_notice(duplicates, policy))
+
+            self.start_job("CLL 병합", task, on_done=on_done)
+
         except Exception as e:
-            print(f"Error in combine_cll_files: {str(e)}")  # 디버깅용
+            _logger.exception("Error in combine_cll_files")
             messagebox.showerror("오류", str(e))
 
     def update_multi_summary(self, df):
@@ -1337,8 +1184,6 @@ class ContainerConverter:
         # 파일 경로 레이블 초기화
         self.input_label.config(text="입력 파일: 없음")
         self.output_label.config(text="출력 파일: 없음")
-        self.master_path_label.config(text="파일 경로: 없음")
-        self.slave_path_label.config(text="파일 경로: 없음")
         self.result_label.config(text="출력 파일: 없음")
         
         # Summary 텍스트 초기화
@@ -1349,11 +1194,9 @@ class ContainerConverter:
         
         # 파일 관련 변수 초기화
         self.current_file = None
+        self.current_cll = None
         self.output_file = None
-        if hasattr(self, 'master_file'):
-            delattr(self, 'master_file')
-        if hasattr(self, 'slave_file'):
-            delattr(self, 'slave_file')
+        self.clear_multi_cll()
 
         # Entry 위젯 초기화
         for pod_entry, sztp_entry, qty_entry in self.empty_entries:
@@ -1388,15 +1231,21 @@ class ContainerConverter:
             self.process_itps_file()
 
     def drop_obl_for_itps(self, event):
-        """ITPS 처리를 위한 OBL 파일 드롭 처리"""
-        file_path = event.data.strip('{}').strip('"')
-        if not os.path.exists(file_path):
-            messagebox.showerror("오류", "파일이 존재하지 않습니다.")
+        """ITPS 처리를 위한 OBL 파일 드롭 처리 (여러 파일이면 ITPS 행을 POL/TOL별로 나눠 추가)"""
+        file_paths = [path.strip('"') for path in self.root.tk.splitlist(event.data)]
+        missing = [path for path in file_paths if not os.path.exists(path)]
+        if missing or not file_paths:
+            messagebox.showerror("오류", f"파일이 존재하지 않습니다: {', '.join(missing)}")
             return
 
-        self.obl_file = file_path
-        self.itps_obl_label.config(text=f"OBL 파일: {os.path.basename(file_path)}")
-        self.obl_drop_label.config(text="OBL 파일이 선택되었습니다")
+        self.obl_files = file_paths
+        self.obl_file = file_paths[0]
+        if len(file_paths) == 1:
+            self.itps_obl_label.config(text=f"OBL 파일: {os.path.basename(self.obl_file)}")
+            self.obl_drop_label.config(text="OBL 파일이 선택되었습니다")
+        else:
+            self.itps_obl_label.config(text=f"OBL 파일: {len(file_paths)}개 ({', '.join(map(os.path.basename, file_paths))})")
+            self.obl_drop_label.config(text=f"{len(file_paths)}개 OBL 파일이 선택되었습니다")
         
         # 두 파일이 모두 선택되었다면 자동으로 처리 시작
         if self.itps_file and self.obl_file:
@@ -1404,139 +1253,121 @@ class ContainerConverter:
 
     def process_itps_file(self):
         """ITPS 파일 처리 및 OBL에 추가"""
-        try:
-            print("Starting ITPS file processing...")  # 디버깅용
+        if len(self.obl_files) > 1:
+            self.process_itps_batch()
+            return
+        policy = self.duplicate_policy.get()
+
+        def on_done(result):
+            combined_df, output_file, duplicates = result
+            self.itps_output_label.config(text=f"출력 파일: {os.path.basename(output_file)}")
+            with stage('summary_render', len(combined_df)):
+                self.update_itps_summary(combined_df)
+            messagebox.showinfo("성공", "ITPS 데이터가 성공적으로 추가되었습니다."
+                                + self.duplicate_notice(duplicates, policy))
+
+        # OBL 읽기 → ITPS 행 추가 → "OBL_with_ITPS_시각.xlsx" 저장
+        self.start_job("ITPS 추가", merge_itps_file, self.obl_file, self.itps_file, self.tpsz_mapping,
+                       port_codes=self.port_codes, duplicates=policy, on_done=on_done,
+                       error_prefix="ITPS 처리 중 오류 발생: ")
+
+    def process_itps_batch(self):
+        """ITPS 파일 하나를 여러 OBL에 나눠 추가 (OBL마다 "원본이름_with_ITPS_시각.xlsx")"""
+        policy = self.duplicate_policy.get()
+
+        def on_done(result):
+            outputs = result['results']
+            self.itps_output_label.config(text=f"출력 파일: {len(outputs)}개")
+            self.itps_summary_text.delete(1.0, tk.END)
+            summary_text = "=== ITPS 일괄 추가 결과 ===\n"
+            summary_text += "================================\n\n"
+            for item in outputs:
+                summary_text += (f"{os.path.basename(item['output_file'])}\n"
+                                 f"  {item['pol']} {item['tol']}: +{item['added']}개 → {item['rows']}개\n")
+            for obl_file, error in result['errors']:
+                summary_text += f"[실패] {os.path.basename(obl_file)}: {error}\n"
+            for obl_file in result['skipped']:
+                summary_text += f"[추가할 행 없음] {os.path.basename(obl_file)}\n"
+            if result['unmatched']:
+                summary_text += "--------------------------------\n"
+                summary_text += "=== 대상 OBL 없음 ===\n"
+                for key, count in result['unmatched'].items():
+                    summary_text += f"{key}: {count}개\n"
+            self.itps_summary_text.insert(tk.END, summary_text)
 
-            # OBL 파일 읽기
-            print(f"Reading OBL file: {self.obl_file}")  # 디버깅용
-            obl_df = pd.read_excel(self.obl_file)
-            print(f"OBL data rows: {len(obl_df)}")  # 디버깅용
-            
-            # ITPS 파일 읽기
-            print(f"Reading ITPS file: {self.itps_file}")  # 디버깅용
-            itps_df = pd.read_excel(self.itps_file)
-            print(f"ITPS data rows: {len(itps_df)}")  # 디버깅용
-            
-            # 기존 OBL의 마지막 No 값 가져오기
-            last_no = len(obl_df)
-            
-            # OBL의 POL과 TOL 값 가져오기
-            obl_pol = obl_df['POL'].iloc[0] if not obl_df.empty else ''
-            obl_tol = obl_df['TOL'].iloc[0] if not obl_df.empty else ''
+            duplicates = {}
+            for item in outputs:
+                for ctr_nbr, count in item['duplicates'].items():
+                    duplicates[ctr_nbr] = duplicates.get(ctr_nbr, 0) + count
+            message = f"ITPS 데이터를 OBL {len(outputs)}개에 추가했습니다." + self.duplicate_notice(duplicates, policy)
+            if result['errors']:
+                messagebox.showwarning("일부 실패", message + f"\n\n실패 {len(result['errors'])}개는 Summary를 확인하세요.")
+            else:
+                messagebox.showinfo("성공", message)
 
-            # 새로운 행들을 저장할 리스트
-            new_rows = []
+        itps_file = self.itps_file
+        obl_files = list(self.obl_files)
 
-            # ITPS 데이터를 OBL 형식으로 변환
-            for idx, row in itps_df.iterrows():
+        def on_read(itps_df):
+            # 선적 항구 컬럼이 없는 일반 ITPS는 값별로 대상 OBL을 직접 지정
+            assignments = None
+            if not has_load_port_column(itps_df):
                 try:
-                    # Equipment Number가 있는 경우만 처리
-                    if pd.isna(row['Equipment Number']):
-                        continue
-
-                    print(f"Processing ITPS row {idx}: {row['Equipment Number']}")  # 디버깅용
-                    
-                    # PORT CODE 변환
-                    por = self.convert_to_port_code(row['Origin Load Port']) if pd.notna(row['Origin Load Port']) else ''
-                    pol = self.convert_to_port_code(obl_pol)
-                    pod = self.convert_to_port_code(row['Discharge Port']) if pd.notna(row['Discharge Port']) else ''
-                    
-                    # TpSZ 매핑
-                    tpsz = str(row['Type/Size']) if pd.notna(row['Type/Size']) else ''
-                    mapped_tpsz = self.tpsz_mapping.get(tpsz, tpsz)
-                    
-                    # Rftemp 처리
-                    rftemp = ''
-                    if pd.notna(row['Reefer Temp.']):
-                        temp_str = str(row['Reefer Temp.']).split('/')[0].strip()
-                        rftemp = temp_str
-
-                    # Weight 처리
-                    weight = ''
-                    if pd.notna(row['Weight']):
-                        try:
-                            weight = int(float(row['Weight']))
-                        except:
-                            weight = ''
-
-                    # 새로운 행 데이터 생성
-                    new_row = pd.Series(index=obl_df.columns)  # OBL의 모든 컬럼으로 초기화
-                    new_row.fillna('', inplace=True)  # 모든 값을 빈 문자열로 초기화
-
-                    # 데이터 매핑
-                    new_row['No'] = last_no + len(new_rows) + 1
-                    new_row['CtrNbr'] = str(row['Equipment Number'])
-                    new_row['ShOwn'] = 'N'
-                    new_row['Opr'] = 'MSC'
-                    new_row['POR'] = por
-                    new_row['POL'] = pol
-                    new_row['TOL'] = obl_tol
-                    new_row['POD'] = pod
-                    new_row['FPOD'] = pod
-                    new_row['SzTp'] = mapped_tpsz
-                    new_row['Wgt'] = weight
-                    new_row['ForE'] = str(row['Full/Empty']) if pd.notna(row['Full/Empty']) else ''
-                    new_row['Rfopr'] = 'N'
-                    new_row['Rftemp'] = rftemp
-                    new_row['Door'] = 'C'
-                    new_row['CustH'] = 'N'
-                    new_row['Fumi'] = 'N'
-                    new_row['VGM'] = 'Y'
-                    
-                    # IMO Class 처리
-                    if pd.notna(row['IMO Class']):
-                        imo_class = str(row['IMO Class'])
-                        if imo_class.replace('.', '').isdigit():
-                            new_row['Class'] = str(int(float(imo_class)))
-                        else:
-                            new_row['Class'] = imo_class
-
-                    # UN Number 처리
-                    if pd.notna(row['UN Number']):
-                        new_row['UNNO'] = str(row['UN Number'])[:6]
-
-                    new_rows.append(new_row)
-                    print(f"Added new row for container: {new_row['CtrNbr']}")  # 디버깅용
-                    
-                except Exception as e:
-                    print(f"Error processing row {idx}: {str(e)}")  # 디버깅용
-                    continue
+                    values = itps_assignment_values(itps_df)
+                except ValueError as e:
+                    messagebox.showerror("오류", f"ITPS 처리 중 오류 발생: {e}")
+                    return
+                assignments = self.show_itps_assignment_dialog(values, obl_files)
+                if assignments is None:
+                    return
+            # POL/TOL별 또는 지정한 대로 분배 → OBL별 추가/저장 (병렬)
+            self.start_job("ITPS 일괄 추가", merge_itps_batch, itps_file, obl_files, self.tpsz_mapping,
+                           port_codes=self.port_codes, duplicates=policy, assignments=assignments,
+                           itps_df=itps_df, on_done=on_done, error_prefix="ITPS 처리 중 오류 발생: ")
 
-            print(f"Total new rows created: {len(new_rows)}")  # 디버깅용
+        # ITPS는 한 번만 읽고 분배/추가에 같이 사용
+        self.start_job("ITPS 읽기", read_itps, itps_file, on_done=on_read,
+                       error_prefix="ITPS 처리 중 오류 발생: ")
 
-            # 새로운 데이터를 DataFrame으로 변환
-            if new_rows:
-                new_df = pd.DataFrame(new_rows)
-                print(f"New DataFrame created with {len(new_df)} rows")  # 디버깅용
+    def show_itps_assignment_dialog(self, values, obl_files):
+        """ITPS 값(Origin Load Port)별 대상 OBL 선택 다이얼로그 ({값: OBL 파일 또는 None}, 취소 시 None)"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("ITPS 대상 OBL 지정")
+        dialog.result = None
 
-                # 기존 OBL 데이터와 새로운 데이터 결합
-                combined_df = pd.concat([obl_df, new_df], ignore_index=True)
-                print(f"Combined DataFrame has {len(combined_df)} rows")  # 디버깅용
+        ttk.Label(dialog, text=f"ITPS에 선적 항구 컬럼이 없습니다.\n"
+                               f"{ITPS_ASSIGN_COLUMN} 값별로 행을 추가할 OBL을 선택해주세요.").pack(pady=10, padx=10)
+
+        skip = "(추가 안 함)"
+        choices = [skip] + [f"{i}. {os.path.basename(obl_file)}" for i, obl_file in enumerate(obl_files, 1)]
+        grid_frame = ttk.Frame(dialog)
+        grid_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        selections = {}
+        for row, (value, count) in enumerate(values.items()):
+            ttk.Label(grid_frame, text=f"{value or '(없음)'} ({count}개)").grid(row=row, column=0, sticky="w",
+                                                                               padx=5, pady=2)
+            selection = tk.StringVar(value=skip)
+            ttk.Combobox(grid_frame, textvariable=selection, values=choices, state="readonly",
+                         width=40).grid(row=row, column=1, sticky="ew", padx=5, pady=2)
+            selections[value] = selection
+
+        def on_ok():
+            dialog.result = {value: obl_files[choices.index(selection.get()) - 1]
+                             if selection.get() != skip else None
+                             for value, selection in selections.items()}
+            dialog.destroy()
 
-                # 파일 저장
-                save_dir = os.path.dirname(self.obl_file)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = os.path.join(save_dir, f"OBL_with_ITPS_{timestamp}.xlsx")
-                
-                # 파일 저장 전 확인
-                print(f"Saving to: {output_file}")  # 디버깅용
-                combined_df.to_excel(output_file, index=False)
-                
-                # 파일 저장 확인
-                if os.path.exists(output_file):
-                    print(f"File saved successfully: {output_file}")  # 디버깅용
-                    self.itps_output_label.config(text=f"출력 파일: {os.path.basename(output_file)}")
-                    self.update_itps_summary(combined_df)
-                    messagebox.showinfo("성공", "ITPS 데이터가 성공적으로 추가되었습니다.")
-                else:
-                    raise Exception("파일이 생성되지 않았습니다.")
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text="확인", command=on_ok).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side="left", padx=5)
 
-            else:
-                raise Exception("처리할 ITPS 데이터가 없습니다.")
-            
-        except Exception as e:
-            print(f"Error in process_itps_file: {str(e)}")  # 디버깅용
-            messagebox.showerror("오류", f"ITPS 처리 중 오류 발생: {str(e)}")
+        # 모달 대화상자로 실행
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.focus_set()
+        self.root.wait_window(dialog)
+        return dialog.result
 
     def update_itps_summary(self, df):
         """ITPS 처리 결과 Summary 업데이트"""
@@ -1582,24 +1413,7 @@ class ContainerConverter:
 
     def convert_to_port_code(self, port_name):
         """항구 이름을 5자리 PORT CODE로 변환"""
-        if not port_name or pd.isna(port_name):
-            return ''
-            
-        port_name = str(port_name).strip().upper()
-        
-        # 이미 5자리 코드인 경우 그대로 반환
-        if len(port_name) == 5 and port_name.isalnum():
-            return port_name
-            
-        # port_codes의 value(port name)와 매칭 시도
-        for code, full_name in self.port_codes.items():
-            if full_name == port_name:  # 정확한 매칭
-                return code
-            elif full_name in port_name or port_name in full_name:  # 부분 매칭
-                return code
-                
-        # 매칭되는 코드가 없으면 원래 값 반환
-        return port_name
+        return convert_to_port_code(port_name, self.port_codes)
 
     def drop_stowage_file(self, event):
         """Stowage Code 엑셀 파일 드롭 처리"""
@@ -1636,6 +1450,7 @@ class ContainerConverter:
             
             # 설정 저장
             self.stow_mapping = service_mappings
+            self.stow_indexes = compile_stow_indexes(self.stow_mapping)
             
             # 엑셀 파일 경로 저장
             excel_dir = os.path.dirname(file_path)
@@ -1655,6 +1470,9 @@ class ContainerConverter:
     def save_stowage_settings(self):
         """Stowage Code 설정 저장"""
         try:
+            # 저장 시점의 매핑으로 인덱스 재컴파일
+            self.stow_indexes = compile_stow_indexes(self.stow_mapping)
+
             # JSON 파일로 저장
             with open(self.stowage_config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.stow_mapping, f, ensure_ascii=False, indent=2)
@@ -1837,17 +1655,8 @@ class ContainerConverter:
         self.update_tpsz_preview()
 
     def terminal_to_port_mapping(self, terminal_code):
-        # 터미널 코드에 따른 POL, TOL 매핑 딕셔너리
-        terminal_mapping = {
-            'PNITC': {'pol': 'KRPUS', 'tol': 'KRPUSAB'},
-            'PNCOC': {'pol': 'KRPUS', 'tol': 'KRPUSPN'},
-            'BCTHD': {'pol': 'KRPUS', 'tol': 'KRPUSBC'},
-            'HJNPC': {'pol': 'KRPUS', 'tol': 'KRPUSAP'},
-            'ICTPC': {'pol': 'KRINC', 'tol': 'KRINCAH'},
-            'KEGWC': {'pol': 'KRKAN', 'tol': 'KRKANKT'}
-        }
-        
-        return terminal_mapping.get(terminal_code, {'pol': '', 'tol': ''})
+        """터미널 코드에 따른 POL, TOL 매핑"""
+        return terminal_to_port(terminal_code)
 
     def process_cll_file(self):
         # ... existing code ...
@@ -1867,22 +1676,7 @@ class ContainerConverter:
 
     def find_matching_services(self, pod_list):
         """POD 리스트와 일치하는 서비스 찾기"""
-        matching_services = {}
-        
-        for service_name, mappings in self.stow_mapping.items():
-            matches = []
-            for pod in pod_list:
-                for mapping in mappings:
-                    if pod.upper() == mapping['port'].upper() or pod.upper() == mapping['stow_code'].upper():
-                        matches.append({
-                            'pod': pod,
-                            'port': mapping['port'],
-                            'stow_code': mapping['stow_code']
-                        })
-            if matches:
-                matching_services[service_name] = matches
-        
-        return matching_services
+        return find_matching_services(self.stow_indexes, pod_list)
 
     def show_service_selection_dialog(self, matching_services):
         """서비스 선택 다이얼로그 표시"""
@@ -2071,7 +1865,7 @@ class ContainerConverter:
 
         self.edi_drop_label = ttk.Label(
             drop_frame,
-            text="EDI 파일을 여기에 드롭하세요",
+            text="EDI 파일을 여기에 드롭하세요\n(여러 파일 또는 폴더를 드롭하면 일괄 변환)",
             font=('Arial', 12)
         )
         self.edi_drop_label.pack(fill="both", expand=True, padx=20, pady=20)
@@ -2080,6 +1874,20 @@ class ContainerConverter:
         self.edi_drop_label.drop_target_register(DND_FILES)
         self.edi_drop_label.dnd_bind('<<Drop>>', self.process_edi_file)
 
+        # 원본/수정본 BAPLIE 비교
+        diff_frame = ttk.LabelFrame(left_frame, text="BAPLIE 비교 (원본 → 수정본)")
+        diff_frame.pack(fill="x", pady=5)
+        ttk.Button(diff_frame, text="비교할 파일 선택...", command=self.compare_edi_files).pack(padx=10, pady=10)
+
+        # BAPLIE → OBL 직접 변환 (POL/TOL은 CLL 변환 탭에서 선택한 값, POL이 없으면 BAPLIE 항구)
+        edi_obl_frame = ttk.LabelFrame(left_frame, text="BAPLIE → OBL 변환")
+        edi_obl_frame.pack(fill="x", pady=5)
+        self.edi_obl_loaded_only = tk.BooleanVar(value=False)
+        ttk.Checkbutton(edi_obl_frame, text="POL 선적분만",
+                        variable=self.edi_obl_loaded_only).pack(side="left", padx=10, pady=10)
+        ttk.Button(edi_obl_frame, text="변환할 파일 선택...",
+                   command=self.convert_edi_to_obl).pack(side="left", padx=10, pady=10)
+
         # 오른쪽: POD Summary 표시 영역
         summary_frame = ttk.LabelFrame(right_frame, text="POD 별 컨테이너 수량")
         summary_frame.pack(fill="both", expand=True, pady=5)
@@ -2092,326 +1900,188 @@ class ContainerConverter:
         )
         self.pod_summary_text.pack(fill="both", expand=True, padx=5, pady=5)
 
+        # 색상 태그 설정 (배경색과 보색)
+        self.pod_summary_text.tag_configure("krpus",
+            background="#90EE90",  # 연한 녹색 배경
+            foreground="#FF1493")  # 진한 분홍색 글자
+
+        self.pod_summary_text.tag_configure("krkan",
+            background="#FFD700",  # 골드 배경
+            foreground="#000080")  # 네이비 글자
+
+        self.pod_summary_text.tag_configure("krinc",
+            background="#87CEEB",  # 하늘색 배경
+            foreground="#FF4500")  # 주황색 글자
+
     def process_edi_file(self, event):
         try:
-            input_file_path = event.data.strip('{}')
-            if not os.path.exists(input_file_path):
-                messagebox.showerror("오류", "파일이 존재하지 않습니다.")
+            dropped = [path.strip('"') for path in self.root.tk.splitlist(event.data)]
+            missing = [path for path in dropped if not os.path.exists(path)]
+            if missing:
+                messagebox.showerror("오류", f"파일이 존재하지 않습니다: {', '.join(missing)}")
                 return
 
-            input_dir = os.path.dirname(input_file_path)
-            
-            # 엑셀 워크북 생성
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Sheet1"  # 시트 이름을 명확하게 지정
+            # 여러 파일 또는 폴더는 일괄 변환
+            if len(dropped) > 1 or os.path.isdir(dropped[0]):
+                self.process_edi_batch(dropped)
+                return
+            input_file_path = dropped[0]
 
-            # 기본 폰트 및 정렬 설정
-            default_font = Font(name='Arial', size=10)
-            default_alignment = Alignment(horizontal='left', vertical='center')
-            
-            # 기본 열 너비 설정
-            for column in range(1, 26):  # A to Y
-                ws.column_dimensions[utils.get_column_letter(column)].width = 12
+            def on_error(e):
+                if isinstance(e, PermissionError):
+                    messagebox.showerror("오류", str(e))
+                else:
+                    _logger.error("Error in process_edi_file: %s", e)
+                    messagebox.showerror("오류", f"파일 처리 중 오류가 발생했습니다: {str(e)}")
 
-            # 헤더 설정 (6번째 행)
-            headers = ["POD", "CELL", "Cntr No.", "OPR", "POL", "STOW", "FPOD", "POR", 
-                      "TpSz", "WGT", "F_E", "SP", "Temp", "DG", "UNNO", "PG", "FP",
-                      "PrePos", "ACC.", "RSN", "Over Dimension", "Over Slot", "Remark",
-                      "Void.Calc", "Void.Calc"]
-            
-            for col, header in enumerate(headers, 1):
-                ws.cell(row=6, column=col, value=header)
+            def on_done(result):
+                with stage('summary_render', sum(result['pod_summary'].values())):
+                    self.show_edi_result(result)
+                message = f"EDI 파일이 성공적으로 변환되었습니다.\n저장 위치: {result['output_file']}"
+                if result['unknown_types']:
+                    message += (f"\n\n변환표에 없는 타입 코드 {sum(result['unknown_types'].values())}개: "
+                                f"{format_unknown_types(result['unknown_types'])}")
+                messagebox.showinfo("성공", message)
 
-            # 변수 초기화
-            cntr_count = 6
-            vessel = ""
-            voy = ""
-            port = ""
-            formatted_date_time = ""
+            self.start_job("EDI 변환", convert_edi_file, input_file_path,
+                           on_done=on_done, on_error=on_error)
 
-            # EDI 파일 읽기
-            with open(input_file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-            
-            # 라인별로 분리
-            file_lines = file_content.replace('\r\n', '\n').split('\n')
+        except Exception as e:
+            _logger.exception("Error in process_edi_file")
+            messagebox.showerror("오류", f"파일 처리 중 오류가 발생했습니다: {str(e)}")
 
-            # EDI 라인 처리
-            for line in file_lines:
-                line = line.strip()
-                if not line:
-                    continue
+    def process_edi_batch(self, paths):
+        """여러 EDI 파일을 프로세스 풀에서 일괄 변환하고 통합 POD 요약 저장"""
+        file_paths = expand_inputs(paths, EDI_EXTENSIONS)
+        if not file_paths:
+            messagebox.showerror("오류", "변환할 EDI 파일(.edi, .txt)이 없습니다.")
+            return
 
-                edi_lines = line.split('+')
-                edi_lines2 = line.split('::')
-                edi_lines3 = line.split(':')
-
-                # DTM (날짜/시간) 처리
-                if edi_lines[0] == "DTM":
-                    date_time_parts = edi_lines[1].split(':')
-                    if date_time_parts[0] == "137":
-                        date_str = date_time_parts[1]
-                        edi_date = f"{date_str[6:8]}.{date_str[4:6]}.{date_str[:4]}"
-                        edi_time = f"{date_str[8:10]}:{date_str[10:12]}:23"
-                        formatted_date_time = f"{edi_date} {edi_time}"
-                        ws.cell(row=cntr_count-4, column=1, value=f"Vessel Name : {vessel}                                                                                                   Data : {formatted_date_time}")
-
-                # TDT (선박 정보) 처리
-                elif edi_lines[0] == "TDT":
-                    vessel = edi_lines2[1][:-1]
-                    voy = edi_lines[2]
-                    
-                    ws.cell(row=cntr_count-5, column=1, value="                                                               Inquary Summary(Detail Information)")
-                    ws.cell(row=cntr_count-4, column=1, value=f"Vessel Name : {vessel}                                                                                                   Data : {formatted_date_time}")
-                    ws.cell(row=cntr_count-2, column=1, value="Operator Code : MSC")
-
-                # LOC (위치 정보) 처리
-                elif edi_lines[0] == "LOC":
-                    # LOC+5 처리
-                    if edi_lines[1] == "5":
-                        port = edi_lines[2][:5]
-                        ws.cell(row=cntr_count-3, column=1, value=f"Voyage No : {voy}                                                                                                   Port : {port}")
-
-                    # 다른 LOC 타입 처리
-                    loc_type = edi_lines[1]
-                    cell_value = "UNSET"
-
-                    if len(edi_lines) >= 3 and edi_lines[2].strip():
-                        cell_value = int(edi_lines[2][:7]) if loc_type == "147" else edi_lines[2][:5]
-                        if cell_value == "KRBUS":
-                            cell_value = "KRPUS"
-
-                        # LOC 타입별 처리
-                        # 147: 컨테이너 번호 (2열)
-                        if loc_type == "147":
-                            cntr_count += 1  # 새로운 컨테이너 행 추가
-                            ws.cell(row=cntr_count, column=2, value=cell_value)
-                        # 9,6: 목적지 (5열) 
-                        elif loc_type in ["9", "6"]:
-                            ws.cell(row=cntr_count, column=5, value=cell_value)
-                        # 11,12: 출발지 (1열)
-                        elif loc_type in ["11", "12"]:
-                            ws.cell(row=cntr_count, column=1, value=cell_value)
-                        # 76: 최종 목적지 (8열)
-                        elif loc_type == "76":
-                            ws.cell(row=cntr_count, column=8, value=cell_value)
-                        # 83: 환적항 (7열)
-                        elif loc_type == "83":
-                            ws.cell(row=cntr_count, column=7, value=cell_value)
-
-                    # UNSET 값 설정
-                    if not ws.cell(row=cntr_count, column=8).value:
-                        ws.cell(row=cntr_count, column=8, value="UNSET")
-                    if not ws.cell(row=cntr_count, column=7).value:
-                        ws.cell(row=cntr_count, column=7, value="UNSET")
-
-                # MEA (무게 정보) 처리
-                elif edi_lines[0] == "MEA" and len(edi_lines) > 3:
-                    try:
-                        # MEA+WT++KGM:29600' 형식에서 무게 추출
-                        weight_str = edi_lines[3].split(':')[1].rstrip("'")  # 29600 추출
-                        weight = round(float(weight_str) / 1000, 1)  # 29600 → 29.6
-                        ws.cell(row=cntr_count, column=10, value=weight)
-                        ws.cell(row=cntr_count, column=10).number_format = "0.0"
-                        print(f"Weight processed: {weight}")  # 디버깅용
-                    except Exception as e:
-                        print(f"Error processing weight: {str(e)}")  # 디버깅용
-                        ws.cell(row=cntr_count, column=10, value="")
-
-                # EQD (컨테이너 정보) 처리
-                elif edi_lines[0] == "EQD":
-                    try:
-                        # 컨테이너 번호 저장 (3열)
-                        ws.cell(row=cntr_count, column=3, value=edi_lines[2])
-                        
-                        # 컨테이너 타입 처리 (9열)
-                        if len(edi_lines) > 3:
-                            container_type = edi_lines[3]
-                            type_mapping = {
-                                # 20FT Containers
-                                "2200": "20DV", "2210": "20DV", "22G0": "20DV", "22G1": "20DV",  # Standard 20ft
-                                "22T0": "20TK", "22T1": "20TK",  # Tank 20ft
-                                "2232": "20RE", "22R0": "20RE", "22R1": "20RE",  # Reefer 20ft
-                                "22P1": "20FL", "22P0": "20FL",  # Flat Rack 20ft
-                                "22U1": "20OT", "22U0": "20OT",  # Open Top 20ft
-                                "22H0": "20HQ", "22H1": "20HQ",  # High Cube 20ft
-                                "22B0": "20BK", "22B1": "20BK",  # Bulk 20ft
-                                "2250": "20RF",  # Reefer 20ft
-                                "22GP": "20GP", # General Purpose 20ft
-                                "22PC": "20FR", # Platform Container 20ft
-                                "22UT": "20OT", # Open Top 20ft
-
-                                # 40FT Containers
-                                "42G0": "40DV", "4310": "40DV", "42G1": "40DV",  # Standard 40ft
-                                "45G0": "40HC", "4510": "40HC", "45G1": "40HC",  # High Cube 40ft
-                                "45R0": "40HR", "4532": "40HR", "45R1": "40HR",  # High Cube Reefer 40ft
-                                "42P1": "40FL", "4363": "40FL", "42P0": "40FL",  # Flat Rack 40ft
-                                "42U1": "40OT", "42U0": "40OT",  # Open Top 40ft
-                                "4232": "40RE", "42R0": "40RE",  # Reefer 40ft
-                                "42T0": "40TK", "42T1": "40TK",  # Tank 40ft
-                                "4563": "40HF",  # High Cube Flat Rack 40ft
-                                "42B0": "40BK",  # Bulk 40ft
-                                "40GP": "40GP", # General Purpose 40ft
-                                "40PC": "40FR", # Platform Container 40ft
-                                "40UT": "40OT", # Open Top 40ft
-                                "43GP": "40HC", # 40ft High Cube
-
-                                # 45FT Containers
-                                "9400": "45HC", "L5G0": "45HC",  # High Cube 45ft
-                                "L5G1": "45HC", "95G0": "45HC",  # High Cube 45ft variants
-                                "45GP": "45HC", # 45ft High Cube General Purpose
-                                "45PC": "45FR", # Platform Container 45ft
-                                "45UT": "45OT", # Open Top 45ft
-
-                                # Special Equipment
-                                "GENE": "GE",  # Generator
-                                "VENT": "VT",  # Ventilated
-                                "CONT": "CT",  # Controlled Temperature
-                                "CRYO": "CY",  # Cryogenic
-                                "HCFR": "HRF", # High Cube Flat Rack
-                                "PCHP": "HP", # Platform
-                                "REOT": "RO", # Reefer Open Top
-                                "TKOT": "TO", # Tank Open Top
-                                "PCOT": "PO", # Platform Open Top
-                                "FLOT": "FO", # Flat Rack Open Top
-                                "SKEL": "SK", # Skeletal
-                                "FRMG": "FG", # Frame
-                                "BULD": "BD", # Bulked
-                                "LIVS": "LS", # Live Stock
-                                "VEHI": "VH", # Vehicle Carrier
-                                "PIPE": "PP", # Pipe Carrier
-                                "LOGS": "LG", # Log Carrier
-                                "DANG": "DG", # Dangerous Goods
-                                "EXPL": "EX", # Explosives
-                                "RADIO": "RD", # Radioactive
-                                "OXID": "OX", # Oxidizing Substances
-                                "CORR": "CR", # Corrosives
-                                "MISC": "MC", # Miscellaneous Dangerous Goods
-                                "20HC": "20HC", # 20ft High Cube
-                                "40PW": "40PW", # 40ft Pallet Wide
-                                "45PW": "45PW", # 45ft Pallet Wide
-                                "20RF": "20RF", # 20ft Reefer
-                                "40RF": "40RF", # 40ft Reefer
-                                "45RF": "45RF", # 45ft Reefer
-                                "20TN": "20TN", # 20ft Tank
-                                "40TN": "40TN", # 40ft Tank
-                                "20PL": "20PL", # 20ft Platform
-                                "40PL": "40PL", # 40ft Platform
-                                "45PL": "45PL", # 45ft Platform
-                                "20OS": "20OS", # 20ft Open Side
-                                "40OS": "40OS", # 40ft Open Side
-                                "20VN": "20VN", # 20ft Ventilated
-                                "40VN": "40VN", # 40ft Ventilatedㅇ뎀ㄱ셕ㄷ
-                                "20SS": "20SS", # 20ft Side Stanchion
-                                "40SS": "40SS", # 40ft Side Stanchion
-                                "20HT": "20HT", # 20ft Hard Top
-                                "40HT": "40HT", # 40ft Hard Top
-                                "20OT": "20OT", # 20ft Open Top
-                                "40OT": "40OT", # 40ft Open Top
-                                "40HF": "40HF", # 40ft Open Top
-                                "40HO": "40HO", # 40ft Open Top
-                                "45OT": "45OT", # 45ft Open Top
-                            }
-                            new_type = type_mapping.get(container_type, "")
-                            
-                            # If container_type not in mapping, check if it starts with 2 or 4
-                            if not new_type and container_type:
-                                if container_type.startswith('2'):
-                                    new_type = "20DV"
-                                elif container_type.startswith('4'):
-                                    new_type = "40HC"
-                                    
-                            ws.cell(row=cntr_count, column=9, value=new_type)
-
-                        # E/F 상태 처리 (11열)
-                        if len(edi_lines) > 6:
-                            last_value = edi_lines[6].rstrip("'")  # 마지막 따옴표 제거
-                            if last_value == "4":
-                                ws.cell(row=cntr_count, column=11, value="E")
-                            elif last_value == "5":
-                                ws.cell(row=cntr_count, column=11, value="F")
-                        
-                        print(f"EQD processed - Container: {edi_lines[2]}, Type: {new_type}, Status: {ws.cell(row=cntr_count, column=11).value}")  # 디버깅용
-                    except Exception as e:
-                        print(f"Error processing EQD: {str(e)}")  # 디버깅용
-
-                # CN (컨테이너 상태) 처리
-                elif edi_lines[0] == "CN" and len(edi_lines) > 6:
-                    if edi_lines[6] == "4'":
-                        ws.cell(row=cntr_count, column=11, value="E")
-                    elif edi_lines[6] == "5'":
-                        ws.cell(row=cntr_count, column=11, value="F")
-
-                # NAD (운송인 정보) 처리
-                elif edi_lines[0] == "NAD" and len(edi_lines) > 2:
-                    ws.cell(row=cntr_count, column=4, value=edi_lines[2][:3])
-
-                # TMP (온도 정보) 처리
-                elif edi_lines[0] == "TMP" and len(edi_lines) > 2:
-                    try:
-                        # TMP+2+05.0:CEL' 또는 TMP+2+00.0:CEL' 형식에서 온도값 추출
-                        temp_str = edi_lines[2].split(':')[0].strip()  # :CEL' 부분 제거
-                        
-                        # 부호 처리
-                        is_negative = temp_str.startswith('-')
-                        if is_negative:
-                            temp_str = temp_str[1:]  # 마이너스 부호 제거
-                        elif temp_str.startswith('+'):
-                            temp_str = temp_str[1:]  # 플러스 부호 제거
-                            
-                        # 앞의 0 제거하고 소수점 처리
-                        if temp_str.startswith('0') and not temp_str.startswith('0.'):
-                            temp_str = temp_str[1:]  # 앞의 0 제거
-                            
-                        # 부호 다시 추가
-                        if is_negative:
-                            temp_str = f"-{temp_str}"
-                            
-                        ws.cell(row=cntr_count, column=13, value=f"{temp_str}C")
-                        print(f"Temperature processed: {temp_str}C")  # 디버깅용
-                    except Exception as e:
-                        print(f"Error processing temperature: {str(e)}")  # 디버깅용
-                        ws.cell(row=cntr_count, column=13, value="")  # 에러 시 빈 값 설정
-
-                # DGS (위험물 정보) 처리
-                elif edi_lines[0] == "DGS" and len(edi_lines) > 3:
-                    ws.cell(row=cntr_count, column=14, value=float(edi_lines[2]))
-                    ws.cell(row=cntr_count, column=15, value=float(edi_lines[3]))
-
-                # DIM (치수 정보) 처리
-                elif edi_lines[0] == "DIM" and len(edi_lines) > 2:
-                    ws.cell(row=cntr_count, column=21, value=edi_lines[2])
-
-            # POD 요약 생성
-            pod_summary = {}
-            pol_pod_summary = {}  # POL과 port가 일치하는 데이터의 요약
-            for row in range(7, ws.max_row + 1):  # 데이터가 시작되는 7행부터
-                pod = ws.cell(row=row, column=1).value  # POD는 1열(A열)에 있음
-                pol = ws.cell(row=row, column=5).value  # POL은 5열(E열)에 있음
-                
-                if pod and pod != "UNSET":  # POD 값이 있고 UNSET이 아닌 경우만
-                    pod_summary[pod] = pod_summary.get(pod, 0) + 1
-                    # POL이 현재 port와 일치하는 경우만 별도 집계
-                    if pol == port:
-                        pol_pod_summary[pod] = pol_pod_summary.get(pod, 0) + 1
+        def on_done(batch):
+            with stage('summary_render', len(batch['results'])):
+                self.show_edi_batch_result(batch)
+            message = f"{len(batch['results'])}/{len(file_paths)}개 EDI 파일이 변환되었습니다."
+            if batch['report_file']:
+                message += f"\n통합 POD 요약: {batch['report_file']}"
+            if batch['errors']:
+                details = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in batch['errors'])
+                messagebox.showwarning("일부 실패", f"{message}\n\n실패한 파일:\n{details}")
+            else:
+                messagebox.showinfo("성공", message)
+
+        self.start_job("EDI 일괄 변환", convert_edi_batch, file_paths, on_done=on_done,
+                       error_prefix="EDI 일괄 변환 중 오류가 발생했습니다: ")
+
+    def show_edi_batch_result(self, batch):
+        """일괄 변환 결과를 파일별 합계와 전체 POD Summary로 표시"""
+        self.pod_summary_text.delete(1.0, tk.END)
+        self.pod_summary_text.insert(tk.END, "=== Files ===\n\n")
+
+        total_summary = {}
+        for result in batch['results']:
+            total = sum(result['pod_summary'].values())
+            from_port = sum(result['pol_pod_summary'].values())
+            self.pod_summary_text.insert(
+                tk.END, f"{result['vessel']} {result['voy']} {result['port']}: {total} (From {result['port']}: {from_port})\n")
+            for pod, count in result['pod_summary'].items():
+                total_summary[pod] = total_summary.get(pod, 0) + count
+            if result['unknown_types']:
+                self.pod_summary_text.insert(tk.END, f"  미등록 타입: {format_unknown_types(result['unknown_types'])}\n")
+
+        for path, error in batch['errors']:
+            self.pod_summary_text.insert(tk.END, f"[실패] {os.path.basename(path)}: {error}\n")
+
+        self.pod_summary_text.insert(tk.END, "\n=== Total POD Summary ===\n\n")
+        for pod, count in sorted(total_summary.items()):
+            tag = pod.lower() if pod in ("KRPUS", "KRKAN", "KRINC") else ()
+            self.pod_summary_text.insert(tk.END, f"{pod}: {count}\n", tag)
+        self.pod_summary_text.insert(tk.END, f"\nTotal: {sum(total_summary.values())}\n")
+
+    def compare_edi_files(self):
+        """원본/수정본 BAPLIE를 선택해 컨테이너 변경 사항을 비교하고 엑셀로 저장"""
+        filetypes = [("EDI files", "*.edi *.txt"), ("All files", "*.*")]
+        old_file = filedialog.askopenfilename(title="원본 BAPLIE 선택", filetypes=filetypes)
+        if not old_file:
+            return
+        new_file = filedialog.askopenfilename(title="수정본 BAPLIE 선택", filetypes=filetypes,
+                                              initialdir=os.path.dirname(old_file))
+        if not new_file:
+            return
+
+        def on_done(result):
+            with stage('summary_render'):
+                self.show_edi_diff_result(result)
+            messagebox.showinfo("비교 완료", f"비교 결과가 저장되었습니다.\n저장 위치: {result['output_file']}")
+
+        self.start_job("BAPLIE 비교", diff_edi_files, old_file, new_file, on_done=on_done,
+                       error_prefix="BAPLIE 비교 중 오류가 발생했습니다: ")
+
+    def convert_edi_to_obl(self):
+        """BAPLIE를 선택해 엑셀 변환 없이 바로 OBL로 변환 (서비스는 POD 기준으로 선택)"""
+        file_path = filedialog.askopenfilename(title="BAPLIE 선택",
+                                               filetypes=[("EDI files", "*.edi *.txt"), ("All files", "*.*")])
+        if not file_path:
+            return
+
+        pol = self.selected_pol.get() or None
+        tol = self.selected_tol.get()
+        loaded_only = self.edi_obl_loaded_only.get()
+        policy = self.duplicate_policy.get()
+
+        def on_converted(result):
+            messagebox.showinfo("성공", f"OBL 변환이 완료되었습니다 ({result['rows']}행).\n"
+                                      f"저장 위치: {result['output_file']}"
+                                      + self.duplicate_notice(result['duplicates'], policy))
+
+        def on_parsed(loaded):
+            parsed, _ = loaded
+            loaded_at = (pol or parsed['port']) if loaded_only else None
+            matching_services = self.find_matching_services(edi_obl_pod_list(parsed['containers'], loaded_at))
+            if not matching_services:
+                messagebox.showwarning("경고", "일치하는 서비스를 찾을 수 없습니다.")
+                return
+            selected_service = self.show_service_selection_dialog(matching_services)
+            if not selected_service:
+                return
+            # 파싱 결과는 캐시에서 다시 읽는다
+            self.start_job("BAPLIE → OBL", convert_edi_obl_file, file_path, self.stow_indexes, self.tpsz_mapping,
+                           selected_service, pol, tol, loaded_only=loaded_only, duplicates=policy,
+                           on_done=on_converted,
+                           error_prefix="OBL 변환 중 오류가 발생했습니다: ")
+
+        self.start_job("EDI 파싱", load_edi_file, file_path, on_done=on_parsed,
+                       error_prefix="EDI 파싱 중 오류가 발생했습니다: ")
+
+    def show_edi_diff_result(self, result):
+        """BAPLIE 비교 결과 요약 표시"""
+        self.pod_summary_text.delete(1.0, tk.END)
+        self.pod_summary_text.insert(tk.END, f"Vessel:  {result['vessel']}\n")
+        self.pod_summary_text.insert(tk.END, f"Voyage:  {result['voy']}\n")
+        self.pod_summary_text.insert(tk.END, f"Port:    {result['port']}\n\n")
+
+        self.pod_summary_text.insert(tk.END, "=== BAPLIE Diff ===\n\n")
+        self.pod_summary_text.insert(tk.END, f"Before:  {result['before_count']}\n")
+        self.pod_summary_text.insert(tk.END, f"After:   {result['after_count']}\n\n")
+        self.pod_summary_text.insert(tk.END, f"Added:   {result['added']}\n")
+        self.pod_summary_text.insert(tk.END, f"Removed: {result['removed']}\n")
+        self.pod_summary_text.insert(tk.END, f"Changed: {result['changed_containers']}\n\n")
+        for field, name in DIFF_FIELDS.items():
+            count = result['field_counts'][field]
+            if count:
+                self.pod_summary_text.insert(tk.END, f"  {name}: {count}\n")
+
+    def show_edi_result(self, result):
+        """EDI 변환 결과 POD Summary 표시"""
+        try:
+            vessel = result['vessel']
+            voy = result['voy']
+            port = result['port']
+            pod_summary = result['pod_summary']
+            pol_pod_summary = result['pol_pod_summary']
 
             # POD 요약 텍스트 업데이트
             self.pod_summary_text.delete(1.0, tk.END)
             
-            # 색상 태그 설정 (배경색과 보색)
-            self.pod_summary_text.tag_configure("krpus", 
-                background="#90EE90",  # 연한 녹색 배경
-                foreground="#FF1493")  # 진한 분홍색 글자
-            
-            self.pod_summary_text.tag_configure("krkan", 
-                background="#FFD700",  # 골드 배경
-                foreground="#000080")  # 네이비 글자
-            
-            self.pod_summary_text.tag_configure("krinc", 
-                background="#87CEEB",  # 하늘색 배경
-                foreground="#FF4500")  # 주황색 글자
-            
             # 선박 및 항차 정보 추가
             self.pod_summary_text.insert(tk.END, f"Vessel:  {vessel}\n")
             self.pod_summary_text.insert(tk.END, f"Voyage:  {voy}\n") 
@@ -2453,43 +2123,20 @@ class ContainerConverter:
             
             self.pod_summary_text.insert(tk.END, f"\nTotal from {port}: {pol_total_containers}")
 
-            # 파일 저장
-            output_filename = f"{vessel} {voy} {port}.xlsx"
-            output_file = os.path.join(input_dir, output_filename)
-            
-            # 기존 파일이 있다면 삭제
-            if os.path.exists(output_file):
-                try:
-                    os.remove(output_file)
-                except PermissionError:
-                    messagebox.showerror("오류", "기존 파일이 열려있습니다. 파일을 닫고 다시 시도해주세요.")
-                    return
-
-            try:
-                wb.save(output_file)
-                print(f"File saved successfully at: {output_file}")  # 디버깅용
-                
-                # 파일이 정상적으로 생성되었는지 확인
-                if os.path.exists(output_file):
-                    file_size = os.path.getsize(output_file)
-                    print(f"Created file size: {file_size} bytes")  # 디버깅용
-                    if file_size > 0:
-                        messagebox.showinfo("성공", f"EDI 파일이 성공적으로 변환되었습니다.\n저장 위치: {output_file}")
-                    else:
-                        messagebox.showerror("오류", "파일이 올바르게 생성되지 않았습니다.")
-                else:
-                    messagebox.showerror("오류", "파일 생성에 실패했습니다.")
-            except Exception as e:
-                print(f"Error saving file: {str(e)}")  # 디버깅용
-                messagebox.showerror("오류", f"파일 저장 중 오류가 발생했습니다: {str(e)}")
-            finally:
-                wb.close()
+            # 변환표에 없는 ISO 타입 코드
+            unknown_types = result.get('unknown_types', {})
+            if unknown_types:
+                self.pod_summary_text.insert(tk.END, "\n\n=== Unknown Type Codes ===\n\n")
+                for code, count in sorted(unknown_types.items()):
+                    self.pod_summary_text.insert(tk.END, f"{code}: {count}\n")
 
         except Exception as e:
-            print(f"Error in process_edi_file: {str(e)}")  # 디버깅용
-            messagebox.showerror("오류", f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+            _logger.exception("Error in show_edi_result")
+            messagebox.showerror("오류", f"Summary 표시 중 오류가 발생했습니다: {str(e)}")
 
 if __name__ == "__main__":
+    # 실행 파일(PyInstaller)에서 CLL 병렬 파싱용 프로세스 풀 지원
+    multiprocessing.freeze_support()
     app = ContainerConverter()
     app.run()
 
@@ -8,6 +8,9 @@ from tkinterdnd2 import DND_FILES, TkinterDnD
 from datetime import datetime
 from openpyxl import load_workbook
 import xlrd  # .xls 파일 처리를 위한 라이브러리
+from obl_convert import build_obl_frame
+from obl_schema import to_output_frame
+from stow_index import StowIndex
 
 # pyinstaller -w -F --add-binary="C:/Users/kod03/AppData/Local/Programs/Python/Python311/tcl/tkdnd2.8;tkdnd2.8" obl_project1.py
 
@@ -639,59 +642,15 @@ class ContainerConverter:
             # 선택된 서비스의 매핑 가져오기
             service_mappings = self.stow_mapping.get(selected_service, [])
             
-            # OBL 데이터프레임 생성
-            obl_data = []
+            # CLL 데이터 변환 (공통 OBL 스키마 사용)
+            obl_df = build_obl_frame(cll_df, self.selected_pol.get(), self.selected_tol.get(),
+                                     StowIndex(service_mappings))
 
-            # CLL 데이터 변환
-            for idx, row in cll_df.iterrows():
-                # OPT가 비어있으면 선택된 POL 값 사용
-                por_value = row['OPT'] if pd.notna(row['OPT']) and row['OPT'] != '' else self.selected_pol.get()
-
-                # POD와 FPOD 처리
-                pod = str(row['POD']) if pd.notna(row['POD']) else ''
-                fpod = str(row['FDP']) if pd.notna(row['FDP']) else ''
-                
-                # 초기값 설정
-                mapped_port = pod
-                mapped_stow = ''
-                
-                # POD가 stow_code와 일치하는지 확인
-                for mapping in service_mappings:
-                    if pod.upper() == mapping['stow_code'].upper():
-                        mapped_port = mapping['port']
-                        mapped_stow = mapping['stow_code']
-                        break
-                
-                # OBL 데이터 생성
-                obl_row = {
-                    'No': idx + 1,
-                    'CtrNbr': row['CNTR NO'],
-                    'ShOwn': 'N',
-                    'Opr': 'MSC',
-                    'POR': por_value,
-                    'POL': self.selected_pol.get(),
-                    'TOL': self.selected_tol.get(),
-                    'POD': mapped_port,
-                    'TOD': '',
-                    'Stow': mapped_stow,
-                    'FPOD': fpod,
-                    'SzTp': int(row['T&S']) if pd.notna(row['T&S']) else '',
-                    'Wgt': int(row['WGT']) if pd.notna(row['WGT']) else '',
-                    'ForE': row['F/E'],
-                    'Rfopr': 'N',
-                    'Door': 'C',
-                    'CustH': 'N',
-                    'Fumi': 'N',
-                    'VGM': 'Y'
-                }
-                obl_data.append(obl_row)
-
-            # OBL 데이터프레임 생성 및 저장
-            obl_df = pd.DataFrame(obl_data)
+            # OBL 데이터프레임 저장
             input_dir = os.path.dirname(self.current_file)
             base_name = os.path.splitext(os.path.basename(self.current_file))[0]
             output_file = os.path.join(input_dir, f"{base_name}_OBL.xlsx")
-            obl_df.to_excel(output_file, index=False)
+            to_output_frame(obl_df).to_excel(output_file, index=False)
 
             self.output_file = output_file
             self.output_label.config(text=f"출력 파일: {output_file}")
@@ -1012,7 +971,7 @@ class ContainerConverter:
             save_dir = os.path.dirname(self.obl_file)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = os.path.join(save_dir, f"OBL_with_ITPS_{timestamp}.xlsx")
-            combined_df.to_excel(output_file, index=False)
+            to_output_frame(combined_df).to_excel(output_file, index=False)
             
             # 결과 표시
             self.itps_output_label.config(text=f"출력 파일: {os.path.basename(output_file)}")
@@ -1549,60 +1508,19 @@ class ContainerConverter:
             # 선택된 서비스의 매핑 가져오기
             service_mappings = self.stow_mapping.get(self.selected_service, [])
 
-            # OBL 데이터프레임 생성
-            obl_data = []
-
-            # Master와 Slave 데이터 변환 및 병합
-            for df in [master_df, slave_df]:
-                for idx, row in df.iterrows():
-                    # OPT가 비어있으면 선택된 POL 값 사용
-                    por_value = row['OPT'] if pd.notna(row['OPT']) and row['OPT'] != '' else self.selected_pol.get()
-
-                    # POD와 FPOD 처리
-                    pod = str(row['POD']) if pd.notna(row['POD']) else ''
-                    fpod = str(row['FDP']) if pd.notna(row['FDP']) else ''
-                    
-                    # 초기값 설정
-                    mapped_port = pod
-                    mapped_stow = ''
-                    
-                    # POD가 stow_code와 일치하는지 확인
-                    for mapping in service_mappings:
-                        if pod.upper() == mapping['stow_code'].upper():
-                            mapped_port = mapping['port']
-                            mapped_stow = mapping['stow_code']
-                            break
-
-                    # OBL 데이터 생성
-                    obl_row = {
-                        'No': len(obl_data) + 1,  # 연속된 번호 부여
-                        'CtrNbr': row['CNTR NO'],
-                        'ShOwn': 'N',
-                        'Opr': 'MSC',
-                        'POR': por_value,
-                        'POL': self.selected_pol.get(),
-                        'TOL': self.selected_tol.get(),
-                        'POD': mapped_port,
-                        'TOD': '',
-                        'Stow': mapped_stow,
-                        'FPOD': fpod,
-                        'SzTp': int(row['T&S']) if pd.notna(row['T&S']) else '',
-                        'Wgt': int(row['WGT']) if pd.notna(row['WGT']) else '',
-                        'ForE': row['F/E'],
-                        'Rfopr': 'N',
-                        'Door': 'C',
-                        'CustH': 'N',
-                        'Fumi': 'N',
-                        'VGM': 'Y'
-                    }
-                    obl_data.append(obl_row)
+            # Master와 Slave 데이터 변환 및 병합 (연속된 번호 부여, 공통 OBL 스키마 사용)
+            pol = self.selected_pol.get()
+            tol = self.selected_tol.get()
+            stow_index = StowIndex(service_mappings)
+            master_data = build_obl_frame(master_df, pol, tol, stow_index, start_no=1)
+            slave_data = build_obl_frame(slave_df, pol, tol, stow_index, start_no=len(master_data) + 1)
 
             # OBL 데이터프레임 생성 및 저장
-            combined_df = pd.DataFrame(obl_data)
+            combined_df = pd.concat([master_data, slave_data], ignore_index=True)
             output_dir = os.path.dirname(self.master_file)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = os.path.join(output_dir, f"Combined_OBL_{timestamp}.xlsx")
-            combined_df.to_excel(output_file, index=False)
+            to_output_frame(combined_df).to_excel(output_file, index=False)
 
             # 결과 표시
             self.result_label.config(text=f"출력 파일: {os.path.basename(output_file)}")
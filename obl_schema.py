@@ -0,0 +1,397 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+from port_resolver import PORT_CODES, port_resolver
+
+# OBL 컬럼 정의
+#   name    : 컬럼명 (내부용, 중복 없음)
+#   default : 소스가 없을 때 모든 행에 들어가는 값 (생략 시 '')
+#   cll     : CLL → OBL 변환 시 소스
+#   empty   : EMPTY 컨테이너 추가 시 소스
+#   edi     : BAPLIE → OBL 직접 변환 시 소스 (obl_convert.edi_source_frame 컬럼)
+#   itps    : ITPS 데이터를 OBL에 추가할 때 소스
+#
+# 소스 표기법
+#   'CNTR NO'            입력 데이터의 컬럼
+#   '@pol'               변환 컨텍스트 값 (@row_no 는 연번)
+#   '=E'                 고정값
+#   ('T&S', 'int')       소스 + 변환 함수 이름 (TRANSFORMS 참고)
+OBL_SCHEMA = [
+    {'name': 'No', 'cll': '@row_no', 'empty': '@row_no', 'edi': '@row_no', 'itps': '@row_no'},
+    {'name': 'CtrNbr', 'cll': 'CNTR NO', 'empty': ('SEQ', 'empty_ctr_nbr'), 'edi': 'cntr_no',
+     'itps': ('Equipment Number', 'text')},
+    {'name': 'ShOwn', 'default': 'N'},
+    {'name': 'Opr', 'default': 'MSC'},
+    {'name': 'POR', 'cll': ('OPT', 'or_pol'), 'empty': '@pol', 'edi': ('por', 'or_pol'),
+     'itps': ('Origin Load Port', 'port_code')},
+    {'name': 'POL', 'cll': '@pol', 'empty': '@pol', 'edi': '@pol', 'itps': '@pol'},
+    {'name': 'TOL', 'cll': '@tol', 'empty': '@tol', 'edi': '@tol', 'itps': '@tol'},
+    {'name': 'POD', 'cll': ('POD', 'stow_port'), 'empty': ('POD', 'stow_port'), 'edi': ('pod', 'stow_port'),
+     'itps': ('Discharge Port', 'port_code')},
+    {'name': 'TOD'},
+    {'name': 'Stow', 'cll': ('POD', 'stow_code'), 'empty': ('POD', 'stow_code'), 'edi': ('pod', 'stow_code')},
+    {'name': 'FPOD', 'cll': ('FDP', 'text'), 'empty': ('POD', 'stow_port'), 'edi': ('fpod', 'text'),
+     'itps': ('Discharge Port', 'port_code')},
+    {'name': 'SzTp', 'cll': ('T&S', 'int'), 'empty': ('SZTP', 'int'), 'edi': ('sztp', 'text'),
+     'itps': ('Type/Size', 'tpsz')},
+    {'name': 'Wgt', 'cll': ('WGT', 'int'), 'empty': ('SZTP', 'empty_weight'), 'edi': ('weight_kg', 'int'),
+     'itps': ('Weight', 'weight')},
+    {'name': 'ForE', 'cll': 'F/E', 'empty': '=E', 'edi': ('fe', 'text'), 'itps': ('Full/Empty', 'text')},
+    {'name': 'Lbl'},
+    {'name': 'Rfopr', 'default': 'N'},
+    {'name': 'Rftemp', 'cll': ('R/F', 'strip_cel'), 'edi': ('temp', 'edi_temp'),
+     'itps': ('Reefer Temp.', 'reefer_temp')},
+    {'name': 'OvDH', 'cll': 'OH'},
+    {'name': 'OvDF', 'cll': ('OL', 'half')},
+    {'name': 'OvDA', 'cll': ('OL', 'half')},
+    {'name': 'OvDP', 'cll': ('OW', 'half')},
+    {'name': 'OvDS', 'cll': ('OW', 'half')},
+    {'name': 'OvSH'},
+    {'name': 'OvSF'},
+    {'name': 'OvSA'},
+    {'name': 'OvSP'},
+    {'name': 'OvSS'},
+    {'name': 'BL'},
+    {'name': 'HI'},
+    {'name': 'AC'},
+    {'name': 'Flip'},
+    {'name': 'Door', 'default': 'C'},
+    {'name': 'CustH', 'default': 'N'},
+    {'name': 'LenBB'},
+    {'name': 'BrthBB'},
+    {'name': 'HgtBB'},
+    {'name': 'WgtBB'},
+    {'name': 'Fumi', 'default': 'N'},
+    {'name': 'FuDt'},
+    {'name': 'VenDt'},
+    {'name': 'Venti'},
+    {'name': 'Damag'},
+    {'name': 'PPK'},
+    {'name': 'Food'},
+    {'name': 'Resi'},
+    {'name': 'Book'},
+    {'name': 'Cold'},
+    {'name': 'Catm'},
+    {'name': 'VGM', 'default': 'Y'},
+    {'name': 'VGM Weighting Method'},
+    {'name': 'HVC'},
+    {'name': 'BN1'},
+    {'name': 'BN2'},
+    {'name': 'BN3'},
+    {'name': 'BN4'},
+    {'name': 'Harmonised system codes'},
+    {'name': 'Description'},
+    {'name': 'Flexitank'},
+    {'name': 'UNNO', 'cll': 'UNDG', 'edi': ('unno', 'int'), 'itps': ('UN Number', 'un_number')},
+    {'name': 'Class', 'cll': 'IMDG', 'edi': ('dg', 'imo_class'), 'itps': ('IMO Class', 'itps_class')},
+    {'name': 'PSN'},
+    {'name': 'N.Weight'},
+    {'name': 'S.Risk1'},
+    {'name': 'S.Risk2'},
+    {'name': 'S.Risk3'},
+    {'name': 'P.Group'},
+    {'name': 'LQ'},
+    {'name': 'EQ'},
+    {'name': 'FP'},
+    {'name': 'IMDG Remark'},
+    {'name': 'Sub Index'},
+    {'name': 'Inf type'},
+    {'name': 'Address'},
+    {'name': 'Street'},
+    {'name': 'City'},
+    {'name': 'Postal Code'},
+    {'name': 'Country Code'},
+    {'name': 'Country'},
+    {'name': 'Sub Index_1', 'header': 'Sub Index'},  # 두 번째 Sub Index 열
+    {'name': 'Remark'},
+]
+
+OBL_COLUMNS = [column['name'] for column in OBL_SCHEMA]
+
+# 엑셀 저장 시 헤더 (Sub Index 열이 두 개)
+OBL_HEADERS = [column.get('header', column['name']) for column in OBL_SCHEMA]
+OUTPUT_RENAMES = {column['name']: column['header'] for column in OBL_SCHEMA if 'header' in column}
+
+# 저장된 OBL을 다시 읽을 때 pandas가 붙이는 중복 헤더 이름 → 내부 컬럼명
+INPUT_RENAMES = {'Sub Index.1': 'Sub Index_1'}
+
+# EMPTY 컨테이너 기본 무게 (SzTp 첫 자리 기준)
+EMPTY_WEIGHTS = {'2': 2500, '4': 4700}
+
+# 저장된 OBL에 EMPTY만 추가할 때(EMPTY 추가 탭)의 무게
+# 원래 이 경로는 40ft를 4500으로 써 왔고 기존 출력과 맞추기 위해 CLL 변환(4700)과 따로 둔다
+ADDED_EMPTY_WEIGHTS = {'2': 2500, '4': 4500}
+
+
+def _text(series, context):
+    """NaN은 빈 문자열, 나머지는 문자열로 변환"""
+    return series.astype(object).where(series.notna(), '').map(str)
+
+
+def _int(series, context):
+    """NaN은 빈 문자열, 나머지는 int로 변환"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        values = series[mask]
+        if pd.api.types.is_numeric_dtype(values):
+            out[mask] = values.astype('int64').astype(object)
+        else:
+            out[mask] = values.map(int)
+    return out
+
+
+def _half(series, context):
+    """값이 있고 0이 아니면 절반 (OOG 양쪽 분배), 아니면 빈 문자열"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna() & (series != 0)
+    if mask.any():
+        out[mask] = (series[mask] / 2).astype(object)
+    return out
+
+
+def _strip_cel(series, context):
+    """R/F 값에서 ' CEL' 제거"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        out[mask] = series[mask].astype(str).str.replace(' CEL', '', regex=False).astype(object)
+    return out
+
+
+def _edi_temp(series, context):
+    """EDI 온도 표시값에서 단위 제거 (-18.0C → -18.0)"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        out[mask] = series[mask].astype(str).str.rstrip('C').astype(object)
+    return out
+
+
+def _imo_class(series, context):
+    """DGS 등급 숫자 → Class 문자열 (3.0 → 3, 2.1 → 2.1)"""
+    def label(value):
+        return str(int(value)) if float(value).is_integer() else str(value)
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        out[mask] = series[mask].map(label)
+    return out
+
+
+def _port_code(series, context):
+    """항구 이름 → 5자리 PORT CODE (고유값마다 한 번만 변환, NaN은 빈 문자열)"""
+    return port_resolver(context.get('port_codes', PORT_CODES)).resolve_series(series)
+
+
+def _tpsz(series, context):
+    """ITPS Type/Size → TpSz 매핑 값 (매핑이 없으면 원래 값)"""
+    tpsz_mapping = context.get('tpsz_mapping', {})
+    text = _text(series, context)
+    return text.map(lambda tpsz: tpsz_mapping.get(tpsz, tpsz))
+
+
+def _weight(series, context):
+    """숫자로 읽을 수 있는 무게만 int로 (소수점 이하 버림), 나머지는 빈 문자열"""
+    values = pd.to_numeric(series, errors='coerce')
+    if values.dtype == object:
+        values = values.astype('float64')
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = np.isfinite(values)
+    if mask.any():
+        out[mask] = values[mask].astype('int64').astype(object)
+    return out
+
+
+def _reefer_temp(series, context):
+    """ITPS 온도 "설정/환기" 값에서 설정 온도만 사용 (-18 / 0 → -18)"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        out[mask] = series[mask].astype(str).str.split('/', n=1).str[0].str.strip().astype(object)
+    return out
+
+
+def _itps_class(series, context):
+    """ITPS IMO Class 정리 (숫자면 정수 부분만, 2.1 → 2, 9A는 그대로)"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        text = series[mask].astype(str)
+        numeric = text.str.replace('.', '', regex=False).str.isdigit()
+        numbers = pd.to_numeric(text.where(numeric), errors='coerce')
+        numeric &= numbers.notna()
+        text[numeric] = numbers[numeric].astype('int64').astype(str)
+        out[mask] = text.astype(object)
+    return out
+
+
+def _un_number(series, context):
+    """UN Number 앞 6자리"""
+    out = pd.Series('', index=series.index, dtype=object)
+    mask = series.notna()
+    if mask.any():
+        out[mask] = series[mask].astype(str).str[:6].astype(object)
+    return out
+
+
+def _or_pol(series, context):
+    """비어있으면 선택된 POL 값 사용"""
+    return series.astype(object).where(series.notna() & (series != ''), context['pol'])
+
+
+def _stow_port(series, context):
+    """POD → 매핑된 port (매핑이 없으면 원래 값)"""
+    ports, _ = context['stow_index'].map_pods(_text(series, context), context.get('match_port', False))
+    return ports
+
+
+def _stow_code(series, context):
+    """POD → 매핑된 stow code (매핑이 없으면 빈 문자열)"""
+    _, stows = context['stow_index'].map_pods(_text(series, context), context.get('match_port', False))
+    return stows
+
+
+EMPTY_CTR_NBR_PATTERN = re.compile(r'MSCU(\d{7})')
+
+
+def empty_sequence(total, used_ctr_nbrs=()):
+    """EMPTY 임시 번호 순번 total개 (1부터, used_ctr_nbrs에 이미 있는 MSCU 번호는 건너뜀)
+
+    EMPTY를 이미 추가한 OBL에 다시 추가해도 앞의 임시 번호와 겹치지 않게 이어서 매긴다.
+    """
+    used = set()
+    for value in used_ctr_nbrs:
+        match = EMPTY_CTR_NBR_PATTERN.fullmatch(str(value).strip().upper())
+        if match:
+            used.add(int(match.group(1)))
+    if not used:
+        return np.arange(1, total + 1)
+    seqs = []
+    seq = 0
+    while len(seqs) < total:
+        seq += 1
+        if seq not in used:
+            seqs.append(seq)
+    return np.array(seqs, dtype=np.int64)
+
+
+def _empty_ctr_nbr(series, context):
+    """EMPTY 컨테이너 임시 번호 (MSCU0000001 ...)"""
+    return series.map(lambda seq: f"MSCU{seq:07d}")
+
+
+def _empty_weight(series, context):
+    """SzTp 첫 자리에 따른 EMPTY 컨테이너 무게"""
+    weights = context.get('empty_weights', EMPTY_WEIGHTS)
+    return series.map(lambda sztp: weights.get(str(sztp)[:1], 0))
+
+
+TRANSFORMS = {
+    'text': _text,
+    'int': _int,
+    'half': _half,
+    'strip_cel': _strip_cel,
+    'edi_temp': _edi_temp,
+    'imo_class': _imo_class,
+    'port_code': _port_code,
+    'tpsz': _tpsz,
+    'weight': _weight,
+    'reefer_temp': _reefer_temp,
+    'itps_class': _itps_class,
+    'un_number': _un_number,
+    'or_pol': _or_pol,
+    'stow_port': _stow_port,
+    'stow_code': _stow_code,
+    'empty_ctr_nbr': _empty_ctr_nbr,
+    'empty_weight': _empty_weight,
+}
+
+
+class ConversionPlan:
+    """입력 종류별로 컴파일된 OBL 변환 계획"""
+
+    def __init__(self, kind, constants, context_fields, source_fields):
+        self.kind = kind
+        self.constants = constants            # {컬럼: 고정값}
+        self.context_fields = context_fields  # {컬럼: 컨텍스트 키}
+        self.source_fields = source_fields    # [(컬럼, 입력 컬럼, 변환 함수 또는 None)]
+
+    def input_columns(self):
+        """계획이 사용하는 입력 컬럼 목록"""
+        return sorted({source for _, source, _ in self.source_fields})
+
+    def build(self, frame, context):
+        """입력 데이터프레임을 OBL 데이터프레임으로 변환"""
+        frame = frame.reset_index(drop=True)
+        row_count = len(frame)
+
+        columns = dict(self.constants)
+        for name, key in self.context_fields.items():
+            if key == 'row_no':
+                start_no = context.get('start_no', 1)
+                columns[name] = range(start_no, start_no + row_count)
+            else:
+                columns[name] = context[key]
+
+        # 같은 (입력 컬럼, 변환) 조합은 한 번만 계산
+        computed = {}
+        with stage('mapping', row_count):
+            for name, source, transform in self.source_fields:
+                key = (source, transform)
+                if key not in computed:
+                    series = frame[source]
+                    computed[key] = series if transform is None else transform(series, context)
+                columns[name] = computed[key]
+
+        with stage('frame_build', row_count):
+            obl_df = pd.DataFrame(columns, index=pd.RangeIndex(row_count), columns=OBL_COLUMNS)
+            return obl_df.infer_objects()
+
+
+def compile_plan(kind, schema=OBL_SCHEMA):
+    """스키마를 입력 종류(kind)별 변환 계획으로 컴파일"""
+    constants = {}
+    context_fields = {}
+    source_fields = []
+
+    for column in schema:
+        name = column['name']
+        spec = column.get(kind)
+        if spec is None:
+            constants[name] = column.get('default', '')
+            continue
+
+        transform = None
+        if isinstance(spec, tuple):
+            spec, transform_name = spec
+            transform = TRANSFORMS[transform_name]
+
+        if spec.startswith('@'):
+            context_fields[name] = spec[1:]
+        elif spec.startswith('='):
+            constants[name] = spec[1:]
+        else:
+            source_fields.append((name, spec, transform))
+
+    return ConversionPlan(kind, constants, context_fields, source_fields)
+
+
+def normalize_obl_columns(obl_df):
+    """저장된 OBL 파일을 읽은 데이터프레임의 컬럼명을 내부 컬럼명으로 변환"""
+    return obl_df.rename(columns=INPUT_RENAMES)
+
+
+def to_output_frame(obl_df):
+    """저장용 헤더로 컬럼명 변환"""
+    return obl_df.rename(columns=OUTPUT_RENAMES)
+
+
+# 모듈 로드 시 한 번만 컴파일
+CLL_PLAN = compile_plan('cll')
+EMPTY_PLAN = compile_plan('empty')
+EDI_PLAN = compile_plan('edi')
+ITPS_PLAN = compile_plan('itps')
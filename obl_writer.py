@@ -0,0 +1,174 @@
+import csv
+import itertools
+import os
+import queue
+import threading
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+from instrumentation import activate, current_timer
+from obl_schema import OBL_COLUMNS, OUTPUT_RENAMES
+
+# 한 번에 변환/저장하는 행 수
+OBL_CHUNK_ROWS = 5000
+
+# pandas to_excel과 같은 헤더 서식 (굵게, 가는 테두리, 가운데 정렬)
+_THIN = Side(style='thin')
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+
+def iter_frame_chunks(df, chunk_rows=OBL_CHUNK_ROWS):
+    """데이터프레임을 행 단위 청크로 나누기"""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def prefetch_chunks(chunks, maxsize=2):
+    """청크 생성(매핑)을 별도 스레드에서 미리 진행하여 저장과 겹치도록 함"""
+    buffer = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
+    # 매핑 단계 시간도 같은 작업 타이머에 기록
+    timer = current_timer()
+
+    def produce():
+        try:
+            with activate(timer):
+                for chunk in chunks:
+                    if stop.is_set():
+                        return
+                    buffer.put(chunk)
+        except BaseException as e:
+            buffer.put(e)
+            return
+        buffer.put(done)
+
+    threading.Thread(target=produce, name="obl-chunk-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # 저장이 중단되면 생산 스레드도 멈춤 (대기 중인 put을 풀어준다)
+        stop.set()
+        while not buffer.empty():
+            buffer.get_nowait()
+
+
+def _cell_rows(chunk):
+    """청크를 셀 값 행 목록으로 변환 (NaN/빈 문자열은 빈 셀)"""
+    values = chunk.astype(object)
+    values = values.where(values.notna() & (values != ''), None)
+    return values.to_numpy().tolist()
+
+
+def write_xlsx(chunks, output_file, columns=OBL_COLUMNS):
+    """write-only 모드로 청크를 차례로 기록 (행 수와 관계없이 메모리 일정)"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+
+    header_cells = []
+    for header in output_headers(columns):
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = HEADER_FONT
+        cell.border = HEADER_BORDER
+        cell.alignment = HEADER_ALIGNMENT
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    rows = 0
+    for chunk in chunks:
+        for row in _cell_rows(chunk):
+            ws.append(row)
+        rows += len(chunk)
+    wb.save(output_file)
+    return rows
+
+
+def write_csv(chunks, output_file, columns=OBL_COLUMNS):
+    """CSV로 청크를 차례로 기록 (엑셀에서 바로 열리도록 UTF-8 BOM)"""
+    rows = 0
+    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(output_headers(columns))
+        for chunk in chunks:
+            writer.writerows([['' if value is None else value for value in row] for row in _cell_rows(chunk)])
+            rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks, output_file, columns=OBL_COLUMNS):
+    """Parquet로 청크를 차례로 기록 (pyarrow 필요)
+
+    OBL 컬럼은 숫자와 빈 문자열이 섞여 있으므로 모든 값을 문자열로 저장한다.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet 출력에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+    # 출력 헤더는 'Sub Index'가 두 번 나오므로 Parquet 컬럼명은 내부 이름 사용
+    columns = [str(name) for name in columns]
+    schema = pa.schema([(name, pa.string()) for name in columns])
+    rows = 0
+    with pq.ParquetWriter(output_file, schema) as writer:
+        for chunk in chunks:
+            values = chunk.astype(object)
+            values = values.where(values.notna() & (values != ''), None)
+            arrays = [pa.array([None if value is None else str(value) for value in values.iloc[:, i]], pa.string())
+                      for i in range(len(columns))]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            rows += len(chunk)
+    return rows
+
+
+# 출력 형식 → 저장 함수
+OBL_WRITERS = {
+    'xlsx': write_xlsx,
+    'csv': write_csv,
+    'parquet': write_parquet,
+}
+
+
+def output_format(output_file):
+    """파일 확장자로 출력 형식 결정"""
+    fmt = os.path.splitext(output_file)[1].lstrip('.').lower()
+    if fmt not in OBL_WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: .{fmt} (지원: {', '.join(OBL_WRITERS)})")
+    return fmt
+
+
+def output_headers(columns):
+    """내부 컬럼명 → 저장용 헤더 (Sub Index_1 → Sub Index)"""
+    return [OUTPUT_RENAMES.get(name, name) for name in columns]
+
+
+def write_obl_chunks(chunks, output_file, prefetch=True):
+    """OBL 청크(내부 컬럼명 데이터프레임)를 확장자에 맞는 형식으로 저장하고 행 수 반환
+
+    헤더는 첫 청크의 컬럼 순서를 따르며, 청크가 없으면 기본 OBL 컬럼으로 빈 파일을 만든다.
+    """
+    writer = OBL_WRITERS[output_format(output_file)]
+    if isinstance(chunks, pd.DataFrame):
+        columns = list(chunks.columns)
+        chunks = iter_frame_chunks(chunks)
+    else:
+        if prefetch:
+            chunks = prefetch_chunks(chunks)
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            return writer(iter(()), output_file)
+        columns = list(first.columns)
+        chunks = itertools.chain([first], (chunk.reindex(columns=columns) for chunk in chunks))
+    return writer(chunks, output_file, columns)
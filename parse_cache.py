@@ -0,0 +1,183 @@
+"""파싱 결과 디스크 캐시 (파일 내용 해시 기준)
+
+같은 CLL/BAPLIE 파일을 다시 드롭하면 엑셀/EDI를 다시 파싱하지 않고 저장된
+결과(pickle)를 바로 읽는다. 키는 파일 내용의 SHA-256과 파서 종류/버전이므로
+파일 이름이 바뀌어도 적중하고, 내용이나 파서가 바뀌면 자동으로 무효가 된다.
+전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 지운다.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+
+from instrumentation import current_timer, stage
+from obl_config import CONFIG_DIR
+
+CACHE_ENV = "OBL_PARSE_CACHE"  # "0"이면 캐시 사용 안 함
+CACHE_DIR = os.path.join(CONFIG_DIR, "cache")
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_SUFFIX = ".pkl"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_logger = logging.getLogger("obl_convertor.parse_cache")
+
+# 프로세스 전체 적중/미적중 횟수 (화면 표시용)
+CACHE_STATS = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def file_digest(file_path):
+    """파일 내용 SHA-256 (16진수)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """파싱 결과를 내용 해시별 pickle 파일로 저장하는 크기 제한 LRU 캐시"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, file_path, kind, version, *extra):
+        """(파일 내용, 파서 종류, 버전, 추가 조건)으로 캐시 키 생성"""
+        parts = [file_digest(file_path), kind, str(version), *map(str, extra)]
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key):
+        """저장된 값 반환 (없거나 읽을 수 없으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 깨진 항목 (저장 중 종료 등)은 지우고 미적중으로 처리
+            self._remove(path)
+            return None
+        # 사용 시각 갱신 (LRU 순서)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        """값 저장 후 크기 한도를 넘으면 오래된 항목 정리"""
+        os.makedirs(self.directory, exist_ok=True)
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+
+    def entries(self):
+        """(마지막 사용 시각, 크기, 경로) 목록"""
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(CACHE_SUFFIX):
+                        try:
+                            info = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((info.st_mtime, info.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def evict(self):
+        """전체 크기가 한도 이하가 될 때까지 가장 오래 사용하지 않은 항목 삭제 (삭제 수 반환)"""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """모든 항목 삭제"""
+        for _, _, path in self.entries():
+            self._remove(path)
+
+    def size(self):
+        """(항목 수, 전체 바이트)"""
+        entries = self.entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def cache_enabled():
+    return os.environ.get(CACHE_ENV, '').strip() != '0'
+
+
+def default_cache():
+    """기본 위치의 캐시 (OBL_PARSE_CACHE=0이면 None)"""
+    return ParseCache() if cache_enabled() else None
+
+
+def note_cache_result(hit):
+    """적중/미적중 횟수 기록 (프로세스 합계 + 현재 작업 타이머)"""
+    name = 'hits' if hit else 'misses'
+    with _stats_lock:
+        CACHE_STATS[name] += 1
+    timer = current_timer()
+    if timer is not None:
+        key = f'cache_{name}'
+        timer.info[key] = timer.info.get(key, 0) + 1
+
+
+def cached_parse(file_path, kind, version, parse, *extra, cache=None):
+    """캐시에 있으면 저장된 파싱 결과를, 없으면 parse()를 실행하고 저장한 결과를 반환
+
+    (결과, 적중 여부)를 반환한다. 캐시를 쓸 수 없으면(비활성화, 디스크 오류) 그냥 파싱한다.
+    """
+    cache = cache or default_cache()
+    if cache is None:
+        return parse(), False
+
+    try:
+        with stage('cache_lookup'):
+            key = cache.key(file_path, kind, version, *extra)
+            value = cache.get(key)
+    except OSError:
+        return parse(), False
+
+    if value is not None:
+        note_cache_result(True)
+        return value, True
+
+    note_cache_result(False)
+    value = parse()
+    try:
+        with stage('cache_store'):
+            cache.put(key, value)
+    except (OSError, pickle.PicklingError) as e:
+        _logger.warning("파싱 캐시 저장 실패: %s", e)
+    return value, False
@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+from unlocode import default_unlocode_index
+
+# 항구 코드 → 항구 이름
+PORT_CODES = {
+    'KRPUS': 'BUSAN',
+    'KRKAN': 'KWANGYANG',
+    'KRINC': 'INCHEON',
+    'KRPTK': 'PYEONGTAEK',
+    'KRUSN': 'ULSAN',
+    'KRMAS': 'MASAN',
+    'KRKPO': 'POHANG',
+    'KRGNR': 'GUNSAN',
+    'KRYSN': 'YEOSU',
+    'KRMOK': 'MOKPO',
+    'KRJES': 'JEJU'
+}
+
+# 항구 이름별 변환 결과 캐시 크기
+PORT_CACHE_SIZE = 4096
+
+# 부분 매칭 색인 n-gram 길이
+NGRAM_SIZE = 3
+
+# UN/LOCODE 형식 (국가 2자리 + 지명 3자리), 이 형식의 입력은 사용자가 쓴 코드로 본다
+LOCODE_PATTERN = re.compile(r'[A-Z]{2}[A-Z0-9]{3}')
+
+
+class PortResolver:
+    """항구 이름 → 5자리 PORT CODE 변환기
+
+    port_codes 순서상 처음으로 일치하는 항목(정확히 같거나, 한쪽이 다른 쪽에 포함)의
+    코드를 반환한다. 이름 dict와 n-gram 색인으로 후보만 확인하며 결과는 캐시한다.
+    일치하는 항목이 없으면 fallback(이름 → 코드 또는 None, 예: UN/LOCODE 색인)을 조회한다.
+    5글자 입력은 표의 이름(BUSAN 등)과 정확히 같을 때만 바꾸고, UN/LOCODE 형식이면
+    fallback 없이 그대로 둔다. 생성 시점의 port_codes 내용을 사용한다.
+    """
+
+    def __init__(self, port_codes=PORT_CODES, cache_size=PORT_CACHE_SIZE, fallback=None):
+        self.codes = list(port_codes)
+        self.fallback = fallback
+        # 이름 → 처음 나오는 위치 (같은 이름이 여럿이면 앞의 코드 사용)
+        self.names = {}
+        for i, full_name in enumerate(port_codes.values()):
+            self.names.setdefault(full_name, i)
+        self.name_lengths = sorted({len(full_name) for full_name in self.names})
+        # n-gram → 그 n-gram을 포함하는 이름 목록 (입력이 이름의 일부인 경우)
+        self.ngrams = {}
+        for full_name in self.names:
+            for k in range(len(full_name) - NGRAM_SIZE + 1):
+                self.ngrams.setdefault(full_name[k:k + NGRAM_SIZE], set()).add(full_name)
+        self.resolve_name = lru_cache(maxsize=cache_size)(self._resolve_name)
+
+    def __call__(self, port_name):
+        return self.resolve(port_name)
+
+    def resolve(self, port_name):
+        """항구 이름 하나 변환 (빈 값은 '', 매칭되는 코드가 없으면 대문자로 바꾼 원래 값)"""
+        if not port_name or pd.isna(port_name):
+            return ''
+        return self.resolve_name(str(port_name).strip().upper())
+
+    def resolve_series(self, series):
+        """컬럼 전체 변환 (고유값마다 한 번만 변환, NaN은 빈 문자열)"""
+        mask = series.notna()
+        codes = {port_name: self.resolve(port_name) for port_name in series[mask].unique()}
+        return series.map(codes).where(mask, '').astype(object)
+
+    def _resolve_name(self, port_name):
+        if not port_name:
+            return ''
+        if len(port_name) == 5 and port_name.isalnum():
+            # 이름이 5글자인 항구(BUSAN 등)가 아니면 이미 5자리 코드이므로 그대로 반환
+            position = self.names.get(port_name)
+            if position is not None:
+                return self.codes[position]
+            if LOCODE_PATTERN.fullmatch(port_name) or self.fallback is None:
+                return port_name
+            return self.fallback(port_name) or port_name
+        position = min(self._contained_names(port_name) | self._containing_names(port_name), default=None)
+        if position is not None:
+            return self.codes[position]
+        code = self.fallback(port_name) if self.fallback is not None else None
+        # 매칭되는 코드가 없으면 원래 값 반환
+        return code or port_name
+
+    def _contained_names(self, port_name):
+        """입력 안에 포함된 이름들의 위치 (정확한 매칭 포함)"""
+        names = self.names
+        positions = set()
+        for length in self.name_lengths:
+            if length > len(port_name):
+                break
+            for start in range(len(port_name) - length + 1):
+                position = names.get(port_name[start:start + length])
+                if position is not None:
+                    positions.add(position)
+        return positions
+
+    def _containing_names(self, port_name):
+        """입력을 포함하는 이름들의 위치"""
+        if len(port_name) < NGRAM_SIZE:
+            candidates = self.names  # 짧은 입력은 모든 이름 확인
+        else:
+            candidates = None
+            for k in range(len(port_name) - NGRAM_SIZE + 1):
+                names = self.ngrams.get(port_name[k:k + NGRAM_SIZE])
+                if not names:
+                    return set()
+                candidates = names if candidates is None else candidates & names
+        return {self.names[full_name] for full_name in candidates if port_name in full_name}
+
+
+# port_codes dict별 변환기 (id → (port_codes, 변환기))
+_resolvers = {}
+
+
+def port_resolver(port_codes=PORT_CODES):
+    """port_codes에 대한 변환기 (같은 dict이면 한 번 만든 변환기 재사용, 없는 이름은 UN/LOCODE 색인 조회)"""
+    entry = _resolvers.get(id(port_codes))
+    if entry is None or entry[0] is not port_codes:
+        resolver = PortResolver(port_codes, fallback=default_unlocode_index().lookup)
+        entry = _resolvers[id(port_codes)] = (port_codes, resolver)
+    return entry[1]
+
+
+def convert_to_port_code(port_name, port_codes=PORT_CODES):
+    """항구 이름을 5자리 PORT CODE로 변환"""
+    return port_resolver(port_codes).resolve(port_name)
@@ -0,0 +1,83 @@
+class StowIndex:
+    """서비스 하나의 stow 매핑을 대문자 코드 기준 해시 인덱스로 컴파일"""
+
+    def __init__(self, service_mappings=()):
+        # stow_code로만 찾는 인덱스 (단일 CLL 변환)
+        self.stow_ports = {}
+        self.stow_codes = {}
+        # stow_code 또는 port로 찾는 인덱스 (병합, EMPTY 추가)
+        self.code_ports = {}
+        self.code_stows = {}
+        # 코드별 일치하는 모든 매핑 (서비스 선택 다이얼로그용)
+        self.matches = {}
+
+        # 먼저 나온 매핑이 우선 (기존 순차 검색과 동일한 결과)
+        for mapping in service_mappings:
+            port = mapping['port']
+            stow_code = mapping['stow_code']
+            stow_key = stow_code.upper()
+            port_key = port.upper()
+
+            self.stow_ports.setdefault(stow_key, port)
+            self.stow_codes.setdefault(stow_key, stow_code)
+            for key in dict.fromkeys((stow_key, port_key)):
+                self.code_ports.setdefault(key, port)
+                self.code_stows.setdefault(key, stow_code)
+                self.matches.setdefault(key, []).append(mapping)
+
+    def __len__(self):
+        return len(self.stow_codes)
+
+    def lookups(self, match_port=False):
+        """(port 딕셔너리, stow_code 딕셔너리) 반환"""
+        if match_port:
+            return self.code_ports, self.code_stows
+        return self.stow_ports, self.stow_codes
+
+    def resolve(self, pod, match_port=False):
+        """POD 하나를 (port, stow_code)로 변환 (매핑이 없으면 (POD, ''))"""
+        ports, stows = self.lookups(match_port)
+        key = pod.upper()
+        return ports.get(key, pod), stows.get(key, '')
+
+    def map_pods(self, pods, match_port=False):
+        """POD 컬럼(문자열 Series) 전체를 한 번에 (port, stow_code) 컬럼으로 변환"""
+        ports, stows = self.lookups(match_port)
+        keys = pods.str.upper()
+        mapped_ports = keys.map(ports).astype(object)
+        mapped_stows = keys.map(stows).astype(object)
+        mapped_ports = mapped_ports.where(mapped_ports.notna(), pods)
+        mapped_stows = mapped_stows.where(mapped_stows.notna(), '')
+        return mapped_ports, mapped_stows
+
+    def find_matches(self, pod_list):
+        """POD 목록 중 이 서비스 매핑과 일치하는 항목 목록"""
+        matches = []
+        for pod in pod_list:
+            if not isinstance(pod, str):
+                continue
+            for mapping in self.matches.get(pod.upper(), []):
+                matches.append({
+                    'pod': pod,
+                    'port': mapping['port'],
+                    'stow_code': mapping['stow_code']
+                })
+        return matches
+
+
+EMPTY_STOW_INDEX = StowIndex()
+
+
+def compile_stow_indexes(stow_mapping):
+    """{서비스명: 매핑 목록} 설정을 {서비스명: StowIndex}로 컴파일"""
+    return {service_name: StowIndex(mappings) for service_name, mappings in stow_mapping.items()}
+
+
+def find_matching_services(stow_indexes, pod_list):
+    """POD 리스트와 일치하는 서비스 찾기"""
+    matching_services = {}
+    for service_name, stow_index in stow_indexes.items():
+        matches = stow_index.find_matches(pod_list)
+        if matches:
+            matching_services[service_name] = matches
+    return matching_services
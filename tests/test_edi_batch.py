@@ -0,0 +1,28 @@
+import os
+
+from edi_batch import plan_edi_outputs
+
+HEADER = "UNB+UNOA:2+MSC+TERMINAL+261018:0900+1'TDT+20+{voy}+++MSC:172:20+++9999999:146::MSC ANNA'LOC+5+KRPUS:139:6'"
+CONTAINER = "LOC+147+0010182::5'EQD+CN+MSCU1234567+22G1'UNZ+1+1'"
+
+
+def write_baplie(path, voy):
+    path.write_text(HEADER.format(voy=voy) + CONTAINER)
+    return str(path)
+
+
+def test_plan_keeps_plain_names_when_unique(tmp_path):
+    first = write_baplie(tmp_path / "first.edi", "FE001")
+    second = write_baplie(tmp_path / "second.edi", "FE002")
+    planned = plan_edi_outputs([first, second])
+    assert os.path.basename(planned[first]) == "MSC ANNA FE001 KRPUS.xlsx"
+    assert os.path.basename(planned[second]) == "MSC ANNA FE002 KRPUS.xlsx"
+
+
+def test_plan_separates_same_call(tmp_path):
+    # 원본/수정본처럼 같은 선박/항차/항구인 파일은 입력 파일 이름으로 구분
+    original = write_baplie(tmp_path / "original.edi", "FE001")
+    revised = write_baplie(tmp_path / "revised.edi", "FE001")
+    planned = plan_edi_outputs([original, revised], str(tmp_path / "out"))
+    assert os.path.basename(planned[original]) == "MSC ANNA FE001 KRPUS (original).xlsx"
+    assert os.path.basename(planned[revised]) == "MSC ANNA FE001 KRPUS (revised).xlsx"
@@ -0,0 +1,77 @@
+from openpyxl import load_workbook
+
+from edi_diff import RECORD_FIELDS, diff_containers, diff_edi_files
+from edi_parser import parse_edi_file
+
+
+def baplie(*containers):
+    """(컨테이너 번호, ISO 타입, CELL, 양하항, 무게 kg) 목록으로 BAPLIE 본문 생성"""
+    body = "".join(
+        f"LOC+147+{cell:07d}::5'LOC+9+KRPUS'LOC+11+{pod}'MEA+WT++KGM:{weight}'EQD+CN+{cntr_no}+{iso_type}+++5'"
+        for cntr_no, iso_type, cell, pod, weight in containers
+    )
+    return (
+        "UNB+UNOA:2+MSC+TERMINAL+261018:0900+1'"
+        "UNH+1+BAPLIE:D:95B:UN:SMDG20'"
+        "TDT+20+FE001+++MSC:172:20+++9999999:146::MSC ANNA'"
+        "LOC+5+KRPUS:139:6'"
+        + body + "UNZ+1+1'"
+    )
+
+
+OLD = baplie(
+    ('MSCU1111111', '22G1', 10182, 'SGSIN', 20000),
+    ('MSCU2222222', '45G1', 10184, 'NLRTM', 15000),
+    ('MSCU3333333', '22G1', 10186, 'SGSIN', 8000),
+)
+# 1111111은 CELL/무게 변경, 2222222는 그대로, 3333333 하선, 4444444 신규 선적
+NEW = baplie(
+    ('MSCU1111111', '22G1', 10282, 'SGSIN', 21500),
+    ('MSCU2222222', '45G1', 10184, 'NLRTM', 15000),
+    ('MSCU4444444', '45R1', 10188, 'CNSHA', 25000),
+)
+
+
+def parse(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return parse_edi_file(str(path))
+
+
+def test_diff_containers_added_removed_changed(tmp_path):
+    old = parse(tmp_path, "old.edi", OLD)['containers']
+    new = parse(tmp_path, "new.edi", NEW)['containers']
+
+    diff = diff_containers(old, new)
+
+    cntr_no = RECORD_FIELDS.index('cntr_no')
+    assert [record[cntr_no] for record in diff['added']] == ['MSCU4444444']
+    assert [record[cntr_no] for record in diff['removed']] == ['MSCU3333333']
+    assert sorted(diff['changed']) == [
+        ['MSCU1111111', 'CELL', 10182, 10282, 10182, 10282],
+        ['MSCU1111111', 'WGT', 20.0, 21.5, 10182, 10282],
+    ]
+    assert diff['changed_containers'] == 1
+    assert diff['field_counts'] == {'cell': 1, 'pod': 0, 'weight': 1, 'temp': 0, 'dg': 0, 'unno': 0}
+
+
+def test_diff_identical_files_is_empty(tmp_path):
+    containers = parse(tmp_path, "old.edi", OLD)['containers']
+    diff = diff_containers(containers, containers)
+    assert diff['added'] == diff['removed'] == diff['changed'] == []
+    assert diff['changed_containers'] == 0
+
+
+def test_diff_edi_files_writes_workbook(tmp_path):
+    old_file = tmp_path / "old.edi"
+    new_file = tmp_path / "new.edi"
+    old_file.write_text(OLD)
+    new_file.write_text(NEW)
+
+    result = diff_edi_files(str(old_file), str(new_file), out_dir=str(tmp_path))
+    assert (result['before_count'], result['after_count']) == (3, 3)
+    assert (result['added'], result['removed'], result['changed_containers']) == (1, 1, 1)
+
+    workbook = load_workbook(result['output_file'])
+    assert workbook.sheetnames == ['Summary', 'Added', 'Removed', 'Changed']
+    assert workbook['Changed'].max_row == 3  # 헤더 + CELL/WGT 변경 2행
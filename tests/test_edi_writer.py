@@ -0,0 +1,63 @@
+import os
+
+import pandas as pd
+import pytest
+
+from edi_parser import parse_edi_file
+from edi_writer import TypeResolver, export_obl_edi
+from obl_schema import OBL_COLUMNS
+
+HEADER = {'vessel': 'MSC ANNA', 'voyage': 'FE123', 'call_sign': '9999999', 'port': 'KRPUS',
+          'recipient': 'KRPUSPN'}
+
+
+def obl_frame(rows, cells=True):
+    df = pd.DataFrame([{column: '' for column in OBL_COLUMNS} for _ in range(rows)])
+    df['No'] = range(1, rows + 1)
+    df['CtrNbr'] = [f"MSCU{i:07d}" for i in range(rows)]
+    df['POL'] = 'KRPUS'
+    df['POD'] = ['SGSIN', 'NLRTM'] * (rows // 2) + ['SGSIN'] * (rows % 2)
+    df['SzTp'] = '45G1'
+    df['Wgt'] = [12000 + i for i in range(rows)]
+    df['ForE'] = ['F', 'E'] * (rows // 2) + ['F'] * (rows % 2)
+    if cells:
+        df['Cell'] = [10182 + i * 2 for i in range(rows)]
+    return df
+
+
+def test_baplie_round_trip(tmp_path):
+    df = obl_frame(50)
+    output_file = str(tmp_path / "out.edi")
+    result = export_obl_edi(df, output_file, 'BAPLIE', HEADER)
+    assert result['containers'] == 50
+
+    parsed = parse_edi_file(output_file)
+    containers = parsed['containers']
+    assert parsed['count'] == 50
+    assert parsed['port'] == 'KRPUS'
+    assert parsed['voy'] == 'FE123'
+    assert containers['cell'] == [10182 + i * 2 for i in range(50)]
+    assert containers['cntr_no'] == df['CtrNbr'].tolist()
+    assert containers['pod'] == df['POD'].tolist()
+    assert containers['pol'] == ['KRPUS'] * 50
+    assert containers['fe'] == df['ForE'].tolist()
+    assert containers['weight_kg'] == [float(weight) for weight in df['Wgt']]
+    assert containers['iso_type'] == [TypeResolver()('45G1')] * 50
+
+
+def test_baplie_requires_cells(tmp_path):
+    output_file = tmp_path / "out.edi"
+    with pytest.raises(ValueError, match="COPRAR"):
+        export_obl_edi(obl_frame(3, cells=False), str(output_file), 'BAPLIE', HEADER)
+    assert not output_file.exists()
+
+    # 셀 위치가 없어도 COPRAR는 만들 수 있다
+    result = export_obl_edi(obl_frame(3, cells=False), str(tmp_path / "out_coprar.edi"), 'COPRAR', HEADER)
+    assert result['containers'] == 3
+
+
+def test_unb_requires_recipient(tmp_path):
+    header = {key: value for key, value in HEADER.items() if key != 'recipient'}
+    with pytest.raises(ValueError, match="recipient"):
+        export_obl_edi(obl_frame(2), str(tmp_path / "out.edi"), 'BAPLIE', header)
+    assert not os.path.exists(tmp_path / "out.edi")
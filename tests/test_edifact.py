@@ -0,0 +1,84 @@
+import io
+
+import edi_parser
+from edi_parser import parse_edi_file
+from edifact import Segment, iter_segments
+from parse_cache import ParseCache
+
+# CN(2글자 태그) 세그먼트로만 F/E가 주어지는 컨테이너
+BAPLIE_WITH_CN = (
+    "UNB+UNOA:2+MSC+TERMINAL+261018:0900+1'"
+    "UNH+1+BAPLIE:D:95B:UN:SMDG20'"
+    "LOC+5+KRPUS:139:6'"
+    "LOC+147+0010182::5'"
+    "EQD+CN+MSCU1234567+22G1'"
+    "CN+1+2+3+4+5+4'"
+    "LOC+147+0010184::5'"
+    "EQD+CN+MSCU7654321+45G1'"
+    "CN+1+2+3+4+5+5'"
+    "UNT+9+1'"
+    "UNZ+1+1'"
+)
+
+BAPLIE = BAPLIE_WITH_CN.replace("UNT+9+1'", "FTX+AAA+++TEST'UNT+10+1'")
+
+
+def test_segment_tag_two_letters():
+    assert Segment("CN+1+2+3+4+5+4").tag == 'CN'
+    assert Segment("CN+1+2+3+4+5+4")[0] == 'CN'
+    assert Segment("LOC+147+0010182::5").tag == 'LOC'
+    assert Segment("UNZ").tag == 'UNZ'
+
+
+def test_iter_segments_keeps_two_letter_tags(tmp_path):
+    path = tmp_path / "cn.edi"
+    path.write_text(BAPLIE_WITH_CN)
+    # 텍스트 스트림과 파일 경로(메모리 매핑) 모두 같은 태그로 나뉜다
+    for source in (io.StringIO(BAPLIE_WITH_CN), str(path)):
+        segments = list(iter_segments(source, tags={'CN', 'LOC'}))
+        assert [segment.tag for segment in segments] == ['LOC', 'LOC', 'CN', 'LOC', 'CN']
+
+
+def test_cn_segment_sets_full_empty(tmp_path):
+    path = tmp_path / "cn.edi"
+    path.write_text(BAPLIE_WITH_CN)
+    parsed = parse_edi_file(str(path))
+    assert parsed['count'] == 2
+    assert parsed['containers']['fe'] == ['E', 'F']
+    assert parsed['segment_stats']['CN'][0] == 2
+
+
+def test_registered_handler_invalidates_cache(tmp_path, monkeypatch):
+    handlers = {tag: dict(handler) if isinstance(handler, dict) else handler
+                for tag, handler in edi_parser.SEGMENT_HANDLERS.items()}
+    monkeypatch.setattr(edi_parser, 'SEGMENT_HANDLERS', handlers)
+    path = tmp_path / "baplie.edi"
+    path.write_text(BAPLIE)
+    cache = ParseCache(str(tmp_path / "cache"))
+
+    first, hit = edi_parser.load_edi_file(str(path), cache=cache)
+    assert not hit and first['segment_stats']
+    again, hit = edi_parser.load_edi_file(str(path), cache=cache)
+    assert hit and again['segment_stats'] == {}
+
+    seen = []
+    edi_parser.register_segment_handler('FTX', lambda segment, state: seen.append(segment.tag))
+    _, hit = edi_parser.load_edi_file(str(path), cache=cache)
+    assert not hit and seen == ['FTX']
+
+
+def test_register_handler_keeps_existing_handlers(monkeypatch):
+    monkeypatch.setattr(edi_parser, 'SEGMENT_HANDLERS', {'LOC': {'147': 'cell'}, 'MEA': 'weight'})
+    edi_parser.register_segment_handler('LOC', 'other')
+    edi_parser.register_segment_handler('MEA', 'vgm', qualifier='VGM')
+    assert edi_parser.SEGMENT_HANDLERS == {'LOC': {'147': 'cell', None: 'other'},
+                                           'MEA': {None: 'weight', 'VGM': 'vgm'}}
+
+
+def test_bad_segments_counted_not_printed(tmp_path, capsys):
+    path = tmp_path / "bad.edi"
+    path.write_text(BAPLIE_WITH_CN.replace("EQD+CN+MSCU1234567", "MEA+WT++KGM:heavy'TMP+2+'EQD+CN+MSCU1234567"))
+    parsed = parse_edi_file(str(path))
+    assert parsed['invalid_segments'] == {'MEA': 1}
+    assert parsed['containers']['weight'][0] == ""
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,53 @@
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.generators import write_itps_workbook, write_obl_workbook
+from itps_batch import merge_itps_batch
+from itps_merge import partition_itps_rows
+
+
+@pytest.fixture
+def itps_inputs(tmp_path):
+    itps_file = write_itps_workbook(str(tmp_path / "itps.xlsx"), 60)
+    busan = write_obl_workbook(str(tmp_path / "busan.xlsx"), 20, pol='KRPUS', tol='KRPUSAB')
+    kwangyang = write_obl_workbook(str(tmp_path / "kwangyang.xlsx"), 10, pol='KRKAN', tol='KRKANGW', seed=1)
+    return itps_file, busan, kwangyang
+
+
+def test_generator_layout_needs_assignments(itps_inputs):
+    itps_file, busan, kwangyang = itps_inputs
+    with pytest.raises(ValueError, match="지정"):
+        merge_itps_batch(itps_file, [busan, kwangyang], {}, max_workers=1)
+
+
+def test_batch_merge_with_assignments(itps_inputs, tmp_path):
+    itps_file, busan, kwangyang = itps_inputs
+    origins = pd.read_excel(itps_file)['Origin Load Port'].value_counts()
+
+    result = merge_itps_batch(itps_file, [busan, kwangyang], {}, str(tmp_path), max_workers=2,
+                              assignments={'busan': busan, 'KWANGYANG': kwangyang, 'INCHEON': None})
+
+    assert result['errors'] == []
+    assert [item['obl_file'] for item in result['results']] == [busan, kwangyang]
+    first, second = result['results']
+    assert (first['pol'], first['tol'], first['added']) == ('KRPUS', 'KRPUSAB', origins['BUSAN'])
+    assert (second['pol'], second['tol'], second['added']) == ('KRKAN', 'KRKANGW', origins['KWANGYANG'])
+    assert sum(result['unmatched'].values()) == 60 - origins['BUSAN'] - origins['KWANGYANG']
+
+    saved = pd.read_excel(first['output_file'])
+    assert len(saved) == 20 + origins['BUSAN']
+    assert saved['No'].tolist() == list(range(1, len(saved) + 1))
+    added = saved.iloc[20:]
+    assert set(added['POL']) == {'KRPUS'} and set(added['TOL']) == {'KRPUSAB'}
+    assert set(added['POR']) == {'KRPUS'}
+    assert os.path.dirname(first['output_file']) == str(tmp_path)
+
+
+def test_partition_retries_unknown_terminal_by_port():
+    itps_df = pd.DataFrame({'Load Port': ['BUSAN', 'KRPUS', 'KWANGYANG', 'KWANGYANG'],
+                            'Load Terminal': ['KRPUSAB', 'OTHER', '', 'KRKANXX']})
+    positions, unmatched = partition_itps_rows(itps_df, [('KRPUS', 'KRPUSAB'), ('KRKAN', 'KRKANGW')])
+    assert {target: rows.tolist() for target, rows in positions.items()} == {0: [0, 1], 1: [2, 3]}
+    assert unmatched == {}
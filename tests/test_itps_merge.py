@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+from itps_merge import append_itps_rows
+from obl_schema import OBL_COLUMNS
+from port_resolver import PORT_CODES, convert_to_port_code
+
+TPSZ_MAPPING = {'22G1': '20DV', '45G1': '40HC'}
+
+# 엑셀에서 읽은 것처럼 컬럼마다 문자열/숫자/NaN이 섞인 ITPS
+ITPS = pd.DataFrame({
+    'Equipment Number': ['ITPU0000001', 'ITPU0000002', np.nan, 'ITPU0000003', 'ITPU0000004', 'ITPU0000005'],
+    'Origin Load Port': ['BUSAN', 'SINGAPORE', 'BUSAN', np.nan, 'KWANGYANG', 'CNSHA'],
+    'Discharge Port': ['ROTTERDAM', 'KRPUS', 'BUSAN', 'HAMBURG', np.nan, 'SGSIN'],
+    'Type/Size': ['22G1', '45G1', '22G1', '45R1', np.nan, 4510],
+    'Reefer Temp.': ['-18/0', 3.5, np.nan, ' -25 / C', np.nan, np.nan],
+    'Weight': ['1,200', 'abc', 100, np.nan, 24500.9, '3000'],
+    'Full/Empty': ['F', 'E', 'F', np.nan, 'F', 'F'],
+    'IMO Class': ['2.1', '1.4S', np.nan, 3.0, 9, np.nan],
+    'UN Number': [12345678, 'UN1263X', np.nan, 1263.0, '1830', np.nan],
+}, dtype=object)
+
+
+def legacy_itps_rows(obl_df, itps_df, tpsz_mapping):
+    """기존 process_itps_file의 행 단위 변환 (비교 기준)"""
+    last_no = len(obl_df)
+    obl_pol = obl_df['POL'].iloc[0] if not obl_df.empty else ''
+    obl_tol = obl_df['TOL'].iloc[0] if not obl_df.empty else ''
+    new_rows = []
+    for _, row in itps_df.iterrows():
+        if pd.isna(row['Equipment Number']):
+            continue
+        por = convert_to_port_code(row['Origin Load Port']) if pd.notna(row['Origin Load Port']) else ''
+        pol = convert_to_port_code(obl_pol)
+        pod = convert_to_port_code(row['Discharge Port']) if pd.notna(row['Discharge Port']) else ''
+        tpsz = str(row['Type/Size']) if pd.notna(row['Type/Size']) else ''
+        rftemp = ''
+        if pd.notna(row['Reefer Temp.']):
+            rftemp = str(row['Reefer Temp.']).split('/')[0].strip()
+        weight = ''
+        if pd.notna(row['Weight']):
+            try:
+                weight = int(float(row['Weight']))
+            except (TypeError, ValueError):
+                weight = ''
+        new_row = dict.fromkeys(obl_df.columns, '')
+        new_row.update({
+            'No': last_no + len(new_rows) + 1, 'CtrNbr': str(row['Equipment Number']), 'ShOwn': 'N',
+            'Opr': 'MSC', 'POR': por, 'POL': pol, 'TOL': obl_tol, 'POD': pod, 'FPOD': pod,
+            'SzTp': tpsz_mapping.get(tpsz, tpsz), 'Wgt': weight,
+            'ForE': str(row['Full/Empty']) if pd.notna(row['Full/Empty']) else '',
+            'Rfopr': 'N', 'Rftemp': rftemp, 'Door': 'C', 'CustH': 'N', 'Fumi': 'N', 'VGM': 'Y',
+        })
+        if pd.notna(row['IMO Class']):
+            imo_class = str(row['IMO Class'])
+            new_row['Class'] = str(int(float(imo_class))) if imo_class.replace('.', '').isdigit() else imo_class
+        if pd.notna(row['UN Number']):
+            new_row['UNNO'] = str(row['UN Number'])[:6]
+        new_rows.append(new_row)
+    return pd.DataFrame(new_rows, columns=obl_df.columns)
+
+
+def existing_obl(rows=3):
+    obl_df = pd.DataFrame('', index=range(rows), columns=OBL_COLUMNS, dtype=object)
+    obl_df['No'] = range(1, rows + 1)
+    obl_df['CtrNbr'] = [f"MSCU{i:07d}" for i in range(rows)]
+    obl_df['POL'] = 'BUSAN'
+    obl_df['TOL'] = 'KRPUSAB'
+    return obl_df
+
+
+def test_itps_rows_match_legacy_loop():
+    obl_df = existing_obl()
+    combined = append_itps_rows(obl_df, ITPS, TPSZ_MAPPING)
+    new_rows = combined.iloc[len(obl_df):].reset_index(drop=True)
+    expected = legacy_itps_rows(obl_df, ITPS, TPSZ_MAPPING)
+
+    assert len(new_rows) == 5
+    for column in OBL_COLUMNS:
+        assert new_rows[column].tolist() == expected[column].tolist(), column
+
+
+def test_itps_edge_cases():
+    new_rows = append_itps_rows(existing_obl(), ITPS, TPSZ_MAPPING).iloc[3:]
+    assert new_rows['No'].tolist() == [4, 5, 6, 7, 8]
+    assert new_rows['Wgt'].tolist() == ['', '', '', 24500, 3000]
+    assert new_rows['Rftemp'].tolist() == ['-18', '3.5', '-25', '', '']
+    assert new_rows['Class'].tolist() == ['2', '1.4S', '3', '9', '']
+    assert new_rows['UNNO'].tolist() == ['123456', 'UN1263', '1263.0', '1830', '']
+    assert new_rows['POL'].tolist() == ['KRPUS'] * 5
+    # 표에 없는 이름은 UN/LOCODE 색인으로 변환 (기존 행 단위 코드와 다른 유일한 부분)
+    assert new_rows['POR'].tolist() == ['KRPUS', 'SGSIN', '', 'KRKAN', 'CNSHA']
+    assert new_rows['SzTp'].tolist() == ['20DV', '40HC', '45R1', '', '4510']
@@ -0,0 +1,67 @@
+import pandas as pd
+
+from edi_parser import parse_edi_file
+from obl_convert import build_edi_obl_frame, build_empty_frame
+from obl_duplicates import DuplicateCheck
+from stow_index import EMPTY_STOW_INDEX
+
+ENTRIES = [('SGSIN', 2, 2), ('CNSHA', 4, 1)]
+
+# 22G1 → 20DV, 45R1 → 40HR (타입 테이블), L5G1 → 45HC는 TpSz 매핑에 없어 ISO 코드로 찾는다.
+# MSCU4444444는 JPTYO 선적분
+BAPLIE = (
+    "UNB+UNOA:2+MSC+TERMINAL+261018:0900+1'"
+    "UNH+1+BAPLIE:D:95B:UN:SMDG20'"
+    "TDT+20+FE001+++MSC:172:20+++9999999:146::MSC ANNA'"
+    "LOC+5+KRPUS:139:6'"
+    "LOC+147+0010182::5'LOC+9+KRPUS'LOC+11+SGSIN'MEA+WT++KGM:20000'EQD+CN+MSCU1111111+22G1+++5'"
+    "LOC+147+0010184::5'LOC+9+KRPUS'LOC+11+NLRTM'MEA+WT++KGM:15500'EQD+CN+MSCU2222222+45R1+++5'"
+    "LOC+147+0010186::5'LOC+9+KRPUS'LOC+11+CNSHA'MEA+WT++KGM:8000'EQD+CN+MSCU3333333+L5G1+++5'"
+    "LOC+147+0010188::5'LOC+9+JPTYO'LOC+11+SGSIN'MEA+WT++KGM:9000'EQD+CN+MSCU4444444+22G1+++5'"
+    "UNZ+1+1'"
+)
+TPSZ_MAPPING = {'20DV': '2200', '40HR': '4532', 'L5G1': 'L5G1X'}
+
+
+def test_added_empty_continues_placeholder_numbers():
+    first = build_empty_frame(ENTRIES, 'KRPUS', 'PNC')
+    assert first['CtrNbr'].tolist() == ['MSCU0000001', 'MSCU0000002', 'MSCU0000003']
+
+    second = build_empty_frame(ENTRIES, 'KRPUS', 'PNC', start_no=4, used_ctr_nbrs=first['CtrNbr'])
+    assert second['CtrNbr'].tolist() == ['MSCU0000004', 'MSCU0000005', 'MSCU0000006']
+
+    check = DuplicateCheck()
+    check.apply(pd.concat([first, second], ignore_index=True))
+    assert check.summary() == {}
+
+
+def test_baplie_to_obl_columns(tmp_path):
+    path = tmp_path / "in.edi"
+    path.write_text(BAPLIE)
+    containers = parse_edi_file(str(path))['containers']
+
+    df = build_edi_obl_frame(containers, 'KRPUS', 'PNC', EMPTY_STOW_INDEX, TPSZ_MAPPING, loaded_at='KRPUS')
+
+    assert df['CtrNbr'].tolist() == ['MSCU1111111', 'MSCU2222222', 'MSCU3333333']
+    assert df['No'].tolist() == [1, 2, 3]
+    assert df['POL'].tolist() == ['KRPUS'] * 3
+    assert df['TOL'].tolist() == ['PNC'] * 3
+    # POR/FPOD가 없으면 컨테이너의 POL/POD를 쓴다
+    assert df['POR'].tolist() == ['KRPUS'] * 3
+    assert df['POD'].tolist() == ['SGSIN', 'NLRTM', 'CNSHA']
+    assert df['FPOD'].tolist() == ['SGSIN', 'NLRTM', 'CNSHA']
+    assert df['SzTp'].tolist() == ['2200', '4532', 'L5G1X']
+    assert df['Wgt'].tolist() == [20000, 15500, 8000]
+    assert pd.api.types.is_integer_dtype(df['Wgt'])
+
+
+def test_baplie_to_obl_keeps_other_ports_without_loaded_at(tmp_path):
+    path = tmp_path / "in.edi"
+    path.write_text(BAPLIE)
+    containers = parse_edi_file(str(path))['containers']
+
+    df = build_edi_obl_frame(containers, 'KRPUS', 'PNC', EMPTY_STOW_INDEX, TPSZ_MAPPING, start_no=11)
+
+    assert df['CtrNbr'].tolist()[-1] == 'MSCU4444444'
+    assert df['No'].tolist() == [11, 12, 13, 14]
+    assert df['POR'].tolist()[-1] == 'JPTYO'
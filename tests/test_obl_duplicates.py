@@ -0,0 +1,24 @@
+import pandas as pd
+
+from obl_duplicates import DUPLICATE_REMARK, DuplicateCheck
+
+
+def obl_frame(ctr_nbrs, start_no=1):
+    return pd.DataFrame({'No': range(start_no, start_no + len(ctr_nbrs)), 'CtrNbr': ctr_nbrs, 'Remark': ''})
+
+
+def test_flag_keeps_rows_and_numbers():
+    check = DuplicateCheck('flag')
+    result = check.apply(obl_frame(['MSCU1', 'MSCU2', 'mscu1 ']))
+    assert result['No'].tolist() == [1, 2, 3]
+    assert result['Remark'].tolist() == ['', '', DUPLICATE_REMARK]
+    assert check.summary() == {'MSCU1': 1}
+
+
+def test_drop_renumbers_across_chunks():
+    check = DuplicateCheck('drop')
+    chunks = [obl_frame(['A', 'B', 'A']), obl_frame(['C', 'B', 'D'], start_no=4), obl_frame(['E'], start_no=7)]
+    result = pd.concat(check.iter_chunks(chunks), ignore_index=True)
+    assert result['CtrNbr'].tolist() == ['A', 'B', 'C', 'D', 'E']
+    assert result['No'].tolist() == [1, 2, 3, 4, 5]
+    assert check.dropped() == 2
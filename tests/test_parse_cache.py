@@ -0,0 +1,80 @@
+import os
+import pickle
+
+from parse_cache import ParseCache, cached_parse
+
+
+def counting_parse(result):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return result
+    return parse, calls
+
+
+def test_hit_then_miss_after_content_change(tmp_path):
+    source = tmp_path / "input.edi"
+    source.write_text("UNB+first'")
+    cache = ParseCache(str(tmp_path / "cache"))
+    parse, calls = counting_parse({'rows': 1})
+
+    assert cached_parse(str(source), 'edi', 1, parse, cache=cache) == ({'rows': 1}, False)
+    assert cached_parse(str(source), 'edi', 1, parse, cache=cache) == ({'rows': 1}, True)
+    assert len(calls) == 1
+
+    source.write_text("UNB+second'")
+    assert cached_parse(str(source), 'edi', 1, parse, cache=cache)[1] is False
+    assert len(calls) == 2
+
+
+def test_miss_when_version_or_extra_changes(tmp_path):
+    source = tmp_path / "input.xlsx"
+    source.write_bytes(b"workbook")
+    cache = ParseCache(str(tmp_path / "cache"))
+    parse, calls = counting_parse([1, 2, 3])
+
+    cached_parse(str(source), 'cll', 1, parse, 'table-a', cache=cache)
+    assert cached_parse(str(source), 'cll', 1, parse, 'table-a', cache=cache)[1] is True
+    assert cached_parse(str(source), 'cll', 2, parse, 'table-a', cache=cache)[1] is False
+    assert cached_parse(str(source), 'cll', 1, parse, 'table-b', cache=cache)[1] is False
+    assert cached_parse(str(source), 'edi', 1, parse, 'table-a', cache=cache)[1] is False
+    assert len(calls) == 4
+
+
+def test_corrupt_or_truncated_entry_is_reparsed(tmp_path):
+    source = tmp_path / "input.edi"
+    source.write_text("UNB+x'")
+    cache = ParseCache(str(tmp_path / "cache"))
+    parse, calls = counting_parse({'rows': list(range(100))})
+    cached_parse(str(source), 'edi', 1, parse, cache=cache)
+
+    key = cache.key(str(source), 'edi', 1)
+    path = cache._path(key)
+    data = open(path, 'rb').read()
+    for damaged in (data[:len(data) // 2], b"not a pickle"):
+        with open(path, 'wb') as f:
+            f.write(damaged)
+        assert cache.get(key) is None
+        assert not os.path.exists(path)
+        assert cached_parse(str(source), 'edi', 1, parse, cache=cache) == ({'rows': list(range(100))}, False)
+    assert len(calls) == 3
+    assert pickle.load(open(path, 'rb')) == {'rows': list(range(100))}
+
+
+def test_evicts_least_recently_used_over_limit(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+    value = b"x" * 1000
+    for key in ('old', 'used', 'new'):
+        cache.put(key, value)
+    entry_size = os.path.getsize(cache._path('old'))
+    for age, key in ((300, 'old'), (200, 'used'), (100, 'new')):
+        mtime = 1_000_000 - age
+        os.utime(cache._path(key), (mtime, mtime))
+    assert cache.get('used') == value  # 사용 시각 갱신
+
+    cache.max_bytes = 2 * entry_size
+    assert cache.evict() == 1
+    assert cache.get('old') is None
+    assert cache.get('used') == value and cache.get('new') == value
+    assert cache.size() == (2, 2 * entry_size)
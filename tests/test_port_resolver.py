@@ -0,0 +1,34 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from port_resolver import PortResolver
+from unlocode import UnlocodeIndex
+
+
+def _unknown(port_name):
+    raise AssertionError(f"fallback called for {port_name}")
+
+
+def test_locode_shaped_input_is_kept_without_fallback():
+    resolver = PortResolver({'KRPUS': 'BUSAN'}, fallback=_unknown)
+    assert resolver.resolve('BUSAN') == 'KRPUS'
+    assert resolver.resolve('SGSIN') == 'SGSIN'
+    assert resolver.resolve('XXAB1') == 'XXAB1'
+
+
+def test_fallback_used_for_names():
+    resolver = PortResolver({'KRPUS': 'BUSAN'}, fallback={'SINGAPORE': 'SGSIN'}.get)
+    assert resolver.resolve('Singapore') == 'SGSIN'
+    assert resolver.resolve('NOWHERE TOWN') == 'NOWHERE TOWN'
+
+
+def _open_index(path):
+    return UnlocodeIndex(path=path, source=os.path.dirname(path)).lookup('SINGAPORE')
+
+
+def test_index_built_once_by_concurrent_workers(tmp_path):
+    path = str(tmp_path / 'unlocode.sqlite')
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        codes = list(executor.map(_open_index, [path] * 8))
+    assert codes == ['SGSIN'] * 8
+    assert sorted(os.listdir(tmp_path)) == ['unlocode.sqlite']
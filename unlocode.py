@@ -0,0 +1,284 @@
+"""UN/LOCODE 항구 이름 → 코드 색인 (SQLite)
+
+기본 항목(port_code.PORT_NAMES)과 설정 위치의 UN/LOCODE CSV(UNLOCODE.csv 파일 또는
+UNLOCODE 폴더 안의 CSV, UNECE 배포 형식)를 정규화한 이름 키로 하나의 SQLite 파일에
+모아 둔다. 색인은 첫 조회 때 열고, 원본이 바뀌었으면 그때 다시 만든다.
+
+키는 대문자/악센트 제거/구두점을 공백으로 바꾼 이름, 공백을 없앤 이름,
+"이름 국가코드"이며 UN/LOCODE의 "옛 이름 = 새 이름" 항목은 별칭으로 들어간다.
+같은 키가 여럿이면 기본 항목 → 항구(Function 1) → 나머지 순으로 앞의 것을 쓴다.
+"""
+import csv
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+
+from obl_config import CONFIG_DIR, locate_config_file
+from port_code import PORT_NAMES
+
+UNLOCODE_SOURCE_NAME = "UNLOCODE"  # UNLOCODE.csv 또는 UNLOCODE 폴더
+UNLOCODE_INDEX_PATH = os.path.join(CONFIG_DIR, "cache", "unlocode.sqlite")
+UNLOCODE_INDEX_VERSION = 1
+
+# 이름별 조회 결과 캐시 크기
+LOOKUP_CACHE_SIZE = 8192
+
+# 색인 생성 잠금 대기 시간 / 비정상 종료로 남은 잠금으로 보는 시간 (초)
+BUILD_LOCK_TIMEOUT = 120
+BUILD_LOCK_STALE = 600
+
+# UNECE CSV 열 위치
+CHANGE, COUNTRY, LOCATION, NAME, NAME_WO_DIACRITICS, SUBDIVISION, STATUS, FUNCTION = range(8)
+
+_NON_ALNUM = re.compile(r'[^0-9A-Z]+')
+_logger = logging.getLogger("obl_convertor.unlocode")
+
+
+def normalize_port_name(name):
+    """비교용 이름 (악센트 제거, 대문자, 영숫자 외 문자는 공백 하나로)"""
+    text = unicodedata.normalize('NFKD', str(name))
+    text = ''.join(character for character in text if not unicodedata.combining(character))
+    return _NON_ALNUM.sub(' ', text.upper()).strip()
+
+
+def name_keys(name, country=''):
+    """이름 하나의 색인 키 목록"""
+    normalized = normalize_port_name(name)
+    if not normalized:
+        return []
+    keys = [normalized, normalized.replace(' ', '')]
+    if country:
+        keys.append(f"{normalized} {country}")
+    return list(dict.fromkeys(keys))
+
+
+def unlocode_sources(source=None):
+    """UN/LOCODE CSV 파일 목록 (파일이면 그 파일, 폴더면 안의 CSV 전부)"""
+    source = source or locate_config_file(UNLOCODE_SOURCE_NAME) or locate_config_file(UNLOCODE_SOURCE_NAME + ".csv")
+    if not source:
+        return []
+    if os.path.isdir(source):
+        return sorted(glob.glob(os.path.join(source, "*.csv")))
+    return [source]
+
+
+def read_unlocode_rows(file_path):
+    """UNECE CSV의 지명 행 [(국가, 코드, 이름, 항구 여부)]와 별칭 [(국가, 옛 이름, 새 이름)]"""
+    locations = []
+    aliases = []
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+    except UnicodeDecodeError:
+        # 예전 배포본은 Latin-1
+        with open(file_path, 'r', encoding='latin-1', newline='') as f:
+            rows = list(csv.reader(f))
+
+    for row in rows:
+        if len(row) <= FUNCTION:
+            continue
+        country = row[COUNTRY].strip().upper()
+        location = row[LOCATION].strip().upper()
+        name = row[NAME_WO_DIACRITICS] or row[NAME]
+        if len(country) != 2 or not name:
+            continue
+        if row[CHANGE].strip() == '=' and ' = ' in name:
+            old_name, new_name = name.split(' = ', 1)
+            aliases.append((country, old_name, new_name))
+        elif len(location) == 3 and row[CHANGE].strip() != 'X':
+            locations.append((country, country + location, name, row[FUNCTION].startswith('1')))
+    return locations, aliases
+
+
+def _insert_keys(conn, code, name, country, priority):
+    conn.executemany("INSERT OR IGNORE INTO port_key (key, code, priority) VALUES (?, ?, ?)",
+                     [(key, code, priority) for key in name_keys(name, country)])
+
+
+def build_unlocode_index(conn, sources, seeds=PORT_NAMES):
+    """색인 테이블 생성 후 기본 항목과 UN/LOCODE 행 추가 (키 수 반환)"""
+    conn.executescript("""
+        CREATE TABLE port_key (key TEXT PRIMARY KEY, code TEXT NOT NULL, priority INTEGER NOT NULL) WITHOUT ROWID;
+        CREATE TABLE port_name (code TEXT PRIMARY KEY, name TEXT NOT NULL) WITHOUT ROWID;
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+    """)
+    # 우선순위 0: 기본 항목
+    for code, name in seeds.items():
+        _insert_keys(conn, code, name, code[:2], 0)
+        conn.execute("INSERT OR IGNORE INTO port_name VALUES (?, ?)", (code, name))
+
+    locations = []
+    aliases = []
+    for file_path in sources:
+        file_locations, file_aliases = read_unlocode_rows(file_path)
+        locations += file_locations
+        aliases += file_aliases
+
+    # 우선순위 1: 항구, 2: 그 외 지명
+    codes_by_name = {}
+    for country, code, name, is_port in sorted(locations, key=lambda item: not item[3]):
+        _insert_keys(conn, code, name, country, 1 if is_port else 2)
+        conn.execute("INSERT OR IGNORE INTO port_name VALUES (?, ?)", (code, name))
+        codes_by_name.setdefault((country, normalize_port_name(name)), code)
+    # 우선순위 3: 옛 이름 별칭
+    for country, old_name, new_name in aliases:
+        code = codes_by_name.get((country, normalize_port_name(new_name)))
+        if code:
+            _insert_keys(conn, code, old_name, country, 3)
+    return conn.execute("SELECT COUNT(*) FROM port_key").fetchone()[0]
+
+
+def source_signature(sources, seeds=PORT_NAMES):
+    """색인을 다시 만들어야 하는지 판단할 원본 서명 (버전, 파일 크기/수정 시각, 기본 항목)"""
+    parts = [UNLOCODE_INDEX_VERSION, hashlib.sha256(json.dumps(seeds, sort_keys=True).encode('utf-8')).hexdigest()]
+    for file_path in sources:
+        info = os.stat(file_path)
+        parts.append([os.path.abspath(file_path), info.st_size, info.st_mtime_ns])
+    return json.dumps(parts)
+
+
+@contextmanager
+def build_lock(lock_path, timeout=BUILD_LOCK_TIMEOUT, poll=0.1):
+    """색인 생성 잠금 (여러 작업 프로세스가 같은 색인을 동시에 만들지 않도록 잠금 파일을 O_EXCL로 생성)
+
+    기다리다 timeout이 지나면 TimeoutError.
+    """
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > BUILD_LOCK_STALE:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue  # 그 사이 잠금이 풀림
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"UN/LOCODE 색인 생성 잠금을 기다리다 시간이 초과되었습니다: {lock_path}")
+            time.sleep(poll)
+    try:
+        os.write(fd, str(os.getpid()).encode('ascii'))
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+class UnlocodeIndex:
+    """지연 로드되는 UN/LOCODE 색인 (첫 조회 때 열고, 원본이 바뀌었으면 다시 생성)
+
+    생성은 프로세스 간 잠금 안에서 임시 파일에 만든 뒤 교체하므로, 여러 작업 프로세스가
+    동시에 열어도 한 프로세스만 만들고 나머지는 완성된 파일을 읽는다.
+    """
+
+    def __init__(self, path=UNLOCODE_INDEX_PATH, source=None, seeds=PORT_NAMES):
+        self.path = path
+        self.source = source
+        self.seeds = seeds
+        self._conn = None
+        self._lock = threading.Lock()
+        self.lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._lookup)
+
+    def __call__(self, port_name):
+        return self.lookup(port_name)
+
+    def connection(self):
+        """읽기 전용 연결 (처음 호출 시 색인 확인/생성)"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open()
+            return self._conn
+
+    def _open(self):
+        sources = unlocode_sources(self.source)
+        signature = source_signature(sources, self.seeds)
+        try:
+            if self._stored_signature() != signature:
+                with build_lock(self.path + ".lock"):
+                    # 잠금을 기다리는 동안 다른 프로세스가 만들었으면 그대로 사용
+                    if self._stored_signature() != signature:
+                        self._build_file(sources, signature)
+            return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            # 색인 파일을 쓸 수 없으면 메모리에 만든다
+            _logger.warning("UN/LOCODE 색인을 열 수 없어 메모리에 만듭니다: %s", e)
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            build_unlocode_index(conn, sources, self.seeds)
+            return conn
+
+    def _stored_signature(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def _build_file(self, sources, signature):
+        """임시 파일에 색인을 만든 뒤 교체 (다른 프로세스가 반쯤 만든 파일을 읽지 않도록)"""
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp_path)
+            try:
+                with conn:
+                    build_unlocode_index(conn, sources, self.seeds)
+                    conn.execute("INSERT INTO meta VALUES ('signature', ?)", (signature,))
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _lookup(self, port_name):
+        """항구 이름 → UN/LOCODE (이미 색인에 있는 코드면 그대로, 없으면 None)"""
+        keys = name_keys(port_name)
+        if not keys:
+            return None
+        conn = self.connection()
+        if len(keys[0]) == 5 and conn.execute("SELECT 1 FROM port_name WHERE code = ?", (keys[0],)).fetchone():
+            return keys[0]
+        for key in keys:
+            row = conn.execute("SELECT code FROM port_key WHERE key = ?", (key,)).fetchone()
+            if row:
+                return row[0]
+        return None
+
+    def port_name(self, code):
+        """UN/LOCODE → 항구 이름 (없으면 None)"""
+        row = self.connection().execute("SELECT name FROM port_name WHERE code = ?", (code,)).fetchone()
+        return row[0] if row else None
+
+
+@lru_cache(maxsize=1)
+def default_unlocode_index():
+    """기본 위치의 색인 (프로세스당 하나, 실제 로드는 첫 조회 때)"""
+    return UnlocodeIndex()